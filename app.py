@@ -1,5 +1,11 @@
 import argparse
-from invest_agent.workflow import app
+import asyncio
+import os
+import uuid
+from invest_agent.workflow import app, build_app
+from invest_agent.infra.checkpoint import SQLiteCheckpointSaver
+from invest_agent.infra import profiling
+from invest_agent.infra.log import log_context, setup_logging
 from types import SimpleNamespace
 
 class ReportConfig(SimpleNamespace):
@@ -7,21 +13,109 @@ class ReportConfig(SimpleNamespace):
     author: str = "팀 알파"
     renderer: str = "none"
     out_dir: str = "./outputs"
+    stream_html: bool = False
+    chart_backend: str = "svg"
+
+    def as_dict(self) -> dict:
+        # 체크포인터가 직렬화할 수 있도록 상태에는 dict로 넣음
+        return {k: getattr(self, k) for k in ("version", "author", "renderer", "out_dir", "stream_html", "chart_backend")}
 
 def main():
     parser = argparse.ArgumentParser(description="InvestAgent CLI")
-    parser.add_argument("--query", required=True, help="자연어 쿼리")
+    parser.add_argument("--query", help="자연어 쿼리 (--resume이면 생략)")
     parser.add_argument("--out-dir", default="outputs")
+    parser.add_argument("--chart-backend", default="svg", choices=["svg", "matplotlib"], help="보고서 차트 생성 방식")
+    parser.add_argument("--stream-html", action="store_true", help="보고서 HTML을 메모리 대신 파일로 스트리밍")
+    parser.add_argument("--parallel", action="store_true", help="탐색된 회사들을 동시에 분석")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="동시 분석 작업 수 상한")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="async 노드 + app.ainvoke로 실행")
+    parser.add_argument("--checkpoint-db", default=None, help="SQLite 체크포인트 파일 (지정 시 중단된 실행을 이어갈 수 있음)")
+    parser.add_argument("--thread-id", default=None, help="체크포인트 thread_id (기본: 무작위)")
+    parser.add_argument("--resume", action="store_true", help="--thread-id의 마지막 완료 노드부터 이어서 실행")
+    parser.add_argument("--keep-checkpoints", type=int, default=20, help="thread별 보존할 체크포인트 수")
+    parser.add_argument("--checkpoint-max-age-days", type=float, default=14, help="이 기간이 지난 thread 삭제")
+    parser.add_argument("--trace-out", default=None,
+                        help="프로파일 trace JSONL 경로 (같은 이름의 .otlp.json도 저장하고 요약을 출력)")
+    parser.add_argument("--log-format", default=None, choices=["text", "json"], help="로그 형식 (기본 INVEST_AGENT_LOG_FORMAT 또는 text)")
+    parser.add_argument("--log-file", default=None, help="로그를 추가로 기록할 파일")
     args = parser.parse_args()
+    setup_logging(fmt=args.log_format, log_file=args.log_file)
+
+    if args.resume and not (args.checkpoint_db and args.thread_id):
+        parser.error("--resume에는 --checkpoint-db와 --thread-id가 필요합니다.")
+    if not args.resume and not args.query:
+        parser.error("--query가 필요합니다.")
+
+    thread_id = args.thread_id or f"cli-{uuid.uuid4().hex[:8]}"
+    config = {"configurable": {"thread_id": thread_id}}
+
+    if args.parallel or args.use_async or args.checkpoint_db:
+        checkpointer = None
+        if args.checkpoint_db:
+            checkpointer = SQLiteCheckpointSaver(
+                args.checkpoint_db,
+                keep_last=args.keep_checkpoints,
+                max_age_days=args.checkpoint_max_age_days,
+            )
+            print(f"💾 체크포인트: {args.checkpoint_db} (thread_id={thread_id})")
+        runner = build_app(
+            parallel=args.parallel,
+            max_concurrency=args.max_concurrency,
+            use_async=args.use_async,
+            checkpointer=checkpointer,
+        )
+    else:
+        runner = app
 
-    state = {
-        "query": args.query,
-        "report_config": ReportConfig(out_dir=args.out_dir),
-    }
-    out = app.invoke(state)
+    if args.resume:
+        snapshot = runner.get_state(config)
+        if not snapshot.next:
+            print(f"ℹ️ 이어서 실행할 단계가 없습니다: {thread_id}")
+            print("✅ reports:", snapshot.values.get("reports", []))
+            return
+        print(f"🔁 재개: {thread_id} → {list(snapshot.next)}")
+        # 입력 None = 마지막 체크포인트에서 남은 노드만 실행
+        state = None
+    else:
+        state = {
+            "query": args.query,
+            "report_config": ReportConfig(
+                out_dir=args.out_dir, stream_html=args.stream_html, chart_backend=args.chart_backend
+            ).as_dict(),
+        }
+
+    tracer = None
+    if args.trace_out:
+        # 노드·LLM·검색·임베딩 호출을 span으로 기록 (ChatOpenAI 호출은 콜백으로 전달)
+        tracer = profiling.start_trace(run_id=thread_id)
+        config["callbacks"] = [profiling.profiling_callback()]
+
+    try:
+        with log_context(run_id=thread_id), profiling.span("run", kind="run", thread_id=thread_id):
+            if args.use_async:
+                out = asyncio.run(runner.ainvoke(state, config=config))
+            else:
+                out = runner.invoke(state, config=config)
+    finally:
+        if tracer is not None:
+            profiling.stop_trace()
+            _write_trace(tracer, args.trace_out)
     print("✅ reports:", out.get("reports", []))
 
+
+def _write_trace(tracer, path: str) -> None:
+    otlp_path = f"{os.path.splitext(path)[0]}.otlp.json"
+    tracer.write_jsonl(path)
+    tracer.write_otlp(otlp_path)
+    print(tracer.flame_summary())
+    print(f"🧭 trace: {path} / {otlp_path}")
+
 if __name__ == "__main__":
     main()
 
-# python app.py --query "한국 생성형 AI 스타트업 알려줘!"
\ No newline at end of file
+# python app.py --query "한국 생성형 AI 스타트업 알려줘!"
+# python app.py --query "한국 생성형 AI 스타트업 알려줘!" --parallel --max-concurrency 3
+# python app.py --query "한국 생성형 AI 스타트업 알려줘!" --parallel --async
+# python app.py --query "한국 생성형 AI 스타트업 알려줘!" --checkpoint-db .cache/checkpoints.sqlite --thread-id run-1
+# python app.py --resume --checkpoint-db .cache/checkpoints.sqlite --thread-id run-1
+# python app.py --query "한국 생성형 AI 스타트업 알려줘!" --parallel --trace-out outputs/trace.jsonl
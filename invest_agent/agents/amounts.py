@@ -0,0 +1,224 @@
+# agents/amounts.py
+"""
+금액·비율 텍스트 정규화
+
+LLM이 돌려주는 시장 규모 / 매출 / CAGR 문장에서 숫자를 뽑아 USD 기준으로 변환함.
+정규식은 모듈 로드 시 한 번만 컴파일하고, 같은 문장은 LRU 캐시로 재사용함.
+기존 형식('억 달러', '백만 달러')은 키워드가 있을 때만 전용 정규식으로 먼저 처리함.
+
+지원 형식 (예):
+    "6000억 달러", "250 백만 달러"      기존 형식 (빠른 경로, 기존 결과와 동일)
+    "$12.5B", "US$ 3.4 billion", "USD 800M", "12.5bn USD"
+    "₩70억", "1.2조 원", "1조 2,000억원", "3천만 원", "KRW 5,000억"
+통화 표시($, USD, 달러, ₩, 원 등)가 붙은 숫자만 금액으로 봄 → "B2B", "4K", "7B 파라미터",
+"사용자 100만 명" 같은 문장은 금액이 아님. "$49/seat", "월 1만 원/user"처럼 단위당 가격도
+매출 규모가 아니므로 건너뜀 (연 단위 "/년", "/yr"는 인정).
+
+환경 변수:
+    INVEST_AGENT_KRW_PER_USD  원/달러 환율 (기본 1350)
+"""
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional
+
+try:
+    KRW_PER_USD = float(os.getenv("INVEST_AGENT_KRW_PER_USD", 1350))
+except ValueError:
+    KRW_PER_USD = 1350.0
+
+# ========= 단위 표 =========
+
+KOREAN_SMALL_UNITS = {"십": 1e1, "백": 1e2, "천": 1e3}
+KOREAN_LARGE_UNITS = {"만": 1e4, "억": 1e8, "조": 1e12}
+
+ENGLISH_UNITS = {
+    "k": 1e3, "thousand": 1e3,
+    "m": 1e6, "mn": 1e6, "mm": 1e6, "million": 1e6,
+    "b": 1e9, "bn": 1e9, "billion": 1e9,
+    "t": 1e12, "tn": 1e12, "trillion": 1e12,
+}
+
+USD_MARKERS = {"$", "us$", "usd", "달러", "불", "dollar", "dollars"}
+KRW_MARKERS = {"₩", "krw", "원"}
+
+# ========= 정규식 (모듈 로드 시 1회 컴파일) =========
+
+_NUM = r"\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+
+# 기존 parse_usd_billion / _parse_arr_text가 인식하던 형식 (결과를 그대로 유지하기 위한 빠른 경로)
+_LEGACY_EOK_USD = re.compile(rf"({_NUM})\s*억\s*달러")
+_LEGACY_MILLION_USD = re.compile(rf"({_NUM})\s*백만\s*달러")
+
+_AMOUNT_RE = re.compile(
+    rf"""
+    (?:(?P<prefix>US\$|\$|₩|(?<![a-z])USD|(?<![a-z])KRW)\s*|(?<![0-9a-z.,]))
+    (?P<num>{_NUM})\s*
+    (?:
+        (?P<ksmall>[십백천])?(?P<klarge>[만억조])
+      | (?P<ksmall_only>[십백천])(?![만억조])
+      | (?P<en>trillion|billion|million|thousand|tn|bn|mn|mm|[tbmk])(?![a-z])
+    )?
+    (?P<rest>(?:\s*(?:{_NUM})\s*[십백천]?[만억])*)
+    \s*(?P<suffix>달러|불|원|USD|KRW|dollars?)?
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+_DIGIT_RE = re.compile(r"\d")
+# 금액 바로 뒤의 단위당 표기 ("/seat", "/월", "per user") — 연 단위는 제외
+_PER_UNIT_RE = re.compile(r"\s*(?:/\s*(?!(?:yr|year|annum|년|연)\b)\S|per\s+(?!(?:yr|year|annum)\b)[a-z])", re.IGNORECASE)
+_REST_RE = re.compile(rf"({_NUM})\s*([십백천])?([만억])")
+
+_PERCENT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(?:%|퍼센트)")
+_SIGNED_PERCENT_RE = re.compile(r"([+\-]?\d+(?:\.\d+)?)\s*%")
+
+
+class Amount(NamedTuple):
+    value: float    # 통화 단위 금액 (예: 1.2조 원 → 1.2e12)
+    currency: str   # "USD" | "KRW"
+
+    def to_usd(self, krw_per_usd: Optional[float] = None) -> float:
+        if self.currency == "KRW":
+            return self.value / (krw_per_usd or KRW_PER_USD)
+        return self.value
+
+
+def _to_float(num: str) -> float:
+    return float(num.replace(",", ""))
+
+
+def _korean_multiplier(small: Optional[str], large: Optional[str]) -> float:
+    return KOREAN_SMALL_UNITS.get(small, 1.0) * KOREAN_LARGE_UNITS.get(large, 1.0)
+
+
+def _match_to_amount(m: "re.Match") -> Optional[Amount]:
+    prefix = (m.group("prefix") or "").lower()
+    suffix = (m.group("suffix") or "").lower()
+    small = m.group("ksmall") or m.group("ksmall_only")
+    large = m.group("klarge")
+    en = (m.group("en") or "").lower()
+    korean = bool(small or large)
+
+    # 통화 표시가 없는 숫자(연도, 개수, "B2B", "7B 파라미터" 등)는 금액이 아님
+    if not (prefix or suffix):
+        return None
+    # 단위당 가격("$49/seat")은 규모가 아님
+    if _PER_UNIT_RE.match(m.string, m.end()):
+        return None
+
+    value = _to_float(m.group("num"))
+    if korean:
+        value *= _korean_multiplier(small, large)
+        # "1조 2000억" 같은 복합 표기
+        for num, rest_small, rest_large in _REST_RE.findall(m.group("rest") or ""):
+            value += _to_float(num) * _korean_multiplier(rest_small, rest_large)
+    elif en:
+        value *= ENGLISH_UNITS[en]
+
+    currency = "USD" if prefix in USD_MARKERS or suffix in USD_MARKERS else "KRW"
+    return Amount(value, currency)
+
+
+@lru_cache(maxsize=4096)
+def parse_amount(text: Optional[str]) -> Optional[Amount]:
+    """문장에서 첫 번째 금액 (없으면 None)"""
+    if not text or not isinstance(text, str) or not _DIGIT_RE.search(text):
+        return None
+    for m in _AMOUNT_RE.finditer(text):
+        amount = _match_to_amount(m)
+        if amount is not None:
+            return amount
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_usd_billion(text: Optional[str]) -> Optional[float]:
+    """'6000억 달러' → 600.0, '$12.5B' → 12.5, '1.2조 원' → 약 0.89 (USD billions)"""
+    if not text or not isinstance(text, str):
+        return None
+    if "달러" in text:
+        m = _LEGACY_EOK_USD.search(text)
+        if m:
+            return _to_float(m.group(1)) / 10.0
+        m = _LEGACY_MILLION_USD.search(text)
+        if m:
+            return _to_float(m.group(1)) / 1000.0
+    amount = parse_amount(text)
+    return amount.to_usd() / 1e9 if amount else None
+
+
+@lru_cache(maxsize=4096)
+def parse_usd_million(text: Optional[str]) -> Optional[float]:
+    """'250 백만 달러' → 250.0, '$12M ARR' → 12.0, '₩70억' → 약 5.19 (USD millions)"""
+    if not text or not isinstance(text, str):
+        return None
+    if "백만" in text:
+        m = _LEGACY_MILLION_USD.search(text)
+        if m:
+            return _to_float(m.group(1))
+    amount = parse_amount(text)
+    return amount.to_usd() / 1e6 if amount else None
+
+
+def parse_percent(text: Optional[str]) -> Optional[float]:
+    """'17.3%' → 17.3"""
+    if not text or not isinstance(text, str):
+        return None
+    m = _PERCENT_RE.search(text)
+    return float(m.group(1)) if m else None
+
+
+def extract_pct_delta(text: Optional[str]) -> Optional[float]:
+    """
+    성능 비교 문장의 개선 폭(%)
+
+    '+12%' 또는 '대비'가 들어간 문장은 절댓값, 그 외에는 30% 이하일 때만 인정함.
+    """
+    if not text or not isinstance(text, str):
+        return None
+    m = _SIGNED_PERCENT_RE.search(text)
+    if not m:
+        return None
+    val = float(m.group(1))
+    if "+" in m.group(0) or "대비" in text:
+        return abs(val)
+    return val if val <= 30 else None
+
+
+def clear_caches() -> None:
+    """파싱 결과 LRU 캐시 비우기 (벤치마크·환율 변경 시)"""
+    parse_amount.cache_clear()
+    parse_usd_billion.cache_clear()
+    parse_usd_million.cache_clear()
+
+
+_UNITS = ("usd", "usd_m", "usd_b")
+
+
+def parse_amounts(texts: Iterable[Optional[str]], unit: str = "usd_b") -> List[Optional[float]]:
+    """
+    여러 문장을 한 번에 USD로 변환 (unit: "usd" / "usd_m" / "usd_b")
+
+    usd_b / usd_m은 parse_usd_billion / parse_usd_million과 같은 결과이며,
+    중복 문장은 한 번만 파싱함.
+    """
+    if unit not in _UNITS:
+        raise ValueError(f"지원하지 않는 단위: {unit} ({', '.join(_UNITS)})")
+
+    if unit == "usd_b":
+        parse = parse_usd_billion
+    elif unit == "usd_m":
+        parse = parse_usd_million
+    else:
+        def parse(text):
+            amount = parse_amount(text)
+            return amount.to_usd() if amount else None
+
+    seen = {}
+    out: List[Optional[float]] = []
+    for text in texts:
+        key = text if isinstance(text, str) else None
+        if key not in seen:
+            seen[key] = parse(key)
+        out.append(seen[key])
+    return out
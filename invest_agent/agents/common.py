@@ -1,8 +1,11 @@
 # agents/common.py
+import logging
 from typing import Dict, Any
 
 from invest_agent.states import GraphState
 
+logger = logging.getLogger(__name__)
+
 
 def advance_or_finish(state: GraphState) -> GraphState:
     """
@@ -25,11 +28,8 @@ def advance_or_finish(state: GraphState) -> GraphState:
     new_idx = current_idx + 1
     
     if new_idx < len(companies):
-        print(f"[공통] 다음 회사로 진행: {new_idx + 1}/{len(companies)}")
+        logger.info(f"[공통] 다음 회사로 진행: {new_idx + 1}/{len(companies)}")
     else:
-        print(f"[공통] 모든 회사 분석 완료: {len(companies)}개")
+        logger.info(f"[공통] 모든 회사 분석 완료: {len(companies)}개")
     
-    return {
-        **state,
-        "idx": new_idx
-    }
\ No newline at end of file
+    return {"idx": new_idx}
\ No newline at end of file
@@ -1,16 +1,23 @@
 # agents/competitor.py
-from typing import Dict, Any, List, Tuple
+from typing import Dict, List, Tuple
+import asyncio
 import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from pydantic import BaseModel, Field
 from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
-from langchain_community.tools.tavily_search import TavilySearchResults
-from langchain_community.vectorstores import FAISS
-from langchain_community.embeddings import HuggingFaceBgeEmbeddings
 
-from invest_agent.states import GraphState
+from invest_agent.states import GraphState, source_entry
+from invest_agent.infra.vectorstores import get_index
+from invest_agent.infra.search_cache import tavily_search, atavily_search
+from invest_agent.infra.profiling import propagate
+
+logger = logging.getLogger(__name__)
 
 
 def extract_json_from_llm_response(text: str) -> dict:
@@ -27,10 +34,48 @@ def extract_json_from_llm_response(text: str) -> dict:
     try:
         return json.loads(text)
     except json.JSONDecodeError as e:
-        print(f"❌ JSON 파싱 실패: {text[:200]}")
+        logger.error(f"❌ JSON 파싱 실패: {text[:200]}")
         raise e
 
 
+def _web_competitor_prompt(target: str, core_tech: str, results: list, max_results: int, exclude_companies: list) -> str:
+    context = "\n\n".join([
+        f"[{r.get('title', 'N/A')}]\n{r.get('content', '')}"
+        for r in results
+    ])
+    
+    return f"""
+다음 웹 검색 결과에서 {target}의 경쟁사를 찾아주세요.
+
+타겟: {target}, 기술: {core_tech}
+제외: {', '.join(exclude_companies) if exclude_companies else '없음'}
+
+검색 결과:
+{context}
+
+{max_results}개 경쟁사를 JSON으로 출력:
+{{"competitors": [{{"company": "Name", "focus": "주력분야", "country": "국가", "recent_investment": "투자정보", "founded_year": "연도", "website": "URL"}}]}}
+"""
+
+
+def _parse_web_competitors(content: str, max_results: int, exclude_companies: list) -> list:
+    data = extract_json_from_llm_response(content)
+    
+    web_competitors = []
+    for comp in data.get("competitors", [])[:max_results]:
+        if comp["company"] not in exclude_companies:
+            web_competitors.append({
+                "company": comp["company"],
+                "focus": comp.get("focus", "N/A"),
+                "country": comp.get("country", "N/A"),
+                "recent_investment": comp.get("recent_investment", "N/A"),
+                "founded_year": comp.get("founded_year", "N/A"),
+                "website": comp.get("website", ""),
+                "source": "web_search"
+            })
+    return web_competitors
+
+
 def search_web_competitors(target: str, core_tech: str, max_results: int = 2, exclude_companies: list = None) -> Tuple[list, list]:
     """
     웹 검색으로 경쟁사 발굴
@@ -41,63 +86,50 @@ def search_web_competitors(target: str, core_tech: str, max_results: int = 2, ex
     if exclude_companies is None:
         exclude_companies = []
     
-    search_tool = TavilySearchResults(max_results=5)
     llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
     
     search_query = f"{target} competitors {core_tech} AI startup similar companies"
     
     try:
-        results = search_tool.invoke({"query": search_query})
+        results = tavily_search(search_query, max_results=5)
         
         # URL 수집
         urls = [r.get("url", "") for r in results if r.get("url")]
         
-        context = "\n\n".join([
-            f"[{r.get('title', 'N/A')}]\n{r.get('content', '')}"
-            for r in results
-        ])
+        prompt = _web_competitor_prompt(target, core_tech, results, max_results, exclude_companies)
+        response = llm.invoke([HumanMessage(content=prompt)])
+        return _parse_web_competitors(response.content, max_results, exclude_companies), urls
         
-        prompt = f"""
-다음 웹 검색 결과에서 {target}의 경쟁사를 찾아주세요.
+    except Exception as e:
+        logger.error(f"❌ 웹 검색 실패: {e}")
+        return [], []
 
-타겟: {target}, 기술: {core_tech}
-제외: {', '.join(exclude_companies) if exclude_companies else '없음'}
 
-검색 결과:
-{context}
+async def asearch_web_competitors(target: str, core_tech: str, max_results: int = 2, exclude_companies: list = None) -> Tuple[list, list]:
+    """search_web_competitors의 async 버전"""
+    if exclude_companies is None:
+        exclude_companies = []
+
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+
+    search_query = f"{target} competitors {core_tech} AI startup similar companies"
+
+    try:
+        results = await atavily_search(search_query, max_results=5)
+
+        urls = [r.get("url", "") for r in results if r.get("url")]
+
+        prompt = _web_competitor_prompt(target, core_tech, results, max_results, exclude_companies)
+        response = await llm.ainvoke([HumanMessage(content=prompt)])
+        return _parse_web_competitors(response.content, max_results, exclude_companies), urls
 
-{max_results}개 경쟁사를 JSON으로 출력:
-{{"competitors": [{{"company": "Name", "focus": "주력분야", "country": "국가", "recent_investment": "투자정보", "founded_year": "연도", "website": "URL"}}]}}
-"""
-        
-        response = llm.invoke([HumanMessage(content=prompt)])
-        data = extract_json_from_llm_response(response.content)
-        
-        web_competitors = []
-        for comp in data.get("competitors", [])[:max_results]:
-            if comp["company"] not in exclude_companies:
-                web_competitors.append({
-                    "company": comp["company"],
-                    "focus": comp.get("focus", "N/A"),
-                    "country": comp.get("country", "N/A"),
-                    "recent_investment": comp.get("recent_investment", "N/A"),
-                    "founded_year": comp.get("founded_year", "N/A"),
-                    "website": comp.get("website", ""),
-                    "source": "web_search"
-                })
-        
-        return web_competitors, urls
-        
     except Exception as e:
-        print(f"❌ 웹 검색 실패: {e}")
+        logger.error(f"❌ 웹 검색 실패: {e}")
         return [], []
 
 
-def select_relevant_bigtech(target: str, target_tech: dict) -> list:
-    """관련 대기업 2개 선정"""
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    
-    prompt = f"""
+def _bigtech_prompt(target: str, target_tech: dict) -> str:
+    return f"""
 타겟: {target}, 기술: {target_tech.get('core_technology', 'N/A')}
 
 다음 중 가장 관련 높은 대기업 2개 선택:
@@ -106,9 +138,10 @@ OpenAI, Meta, Google, Microsoft, Anthropic, Amazon, Adobe, Stability AI
 JSON 출력:
 {{"companies": [{{"company": "OpenAI", "focus": "GPT", "reasoning": "이유"}}]}}
 """
-    
-    response = llm.invoke([HumanMessage(content=prompt)])
-    data = extract_json_from_llm_response(response.content)
+
+
+def _parse_bigtech(content: str) -> list:
+    data = extract_json_from_llm_response(content)
     
     return [{
         "company": c["company"],
@@ -119,49 +152,28 @@ JSON 출력:
     } for c in data.get("companies", [])[:2]]
 
 
-def competitor_analysis(state: GraphState) -> GraphState:
-    """
-    경쟁사 분석 노드
-    
-    입력:
-        - current_company: 타겟 기업명
-        - tech: 기술 분석 결과
-        - market_eval: 시장 분석 결과
-    
-    출력:
-        - competitor: {...}
-        - sources["competitor"]: 참고 출처
-    """
-    target = state.get("current_company", "Unknown")
-    tech = state.get("tech", {})
-    tech_blk = tech.get("technology", {})
-    market_eval = state.get("market_eval", {})
-    
-    print(f"[경쟁사 분석] 시작: {target}")
-    
-    # ===== 출처 수집 =====
-    competitor_sources = []
-    
-    # 1. 경쟁사 발굴 (스타트업 2 + 대기업 2)
+def select_relevant_bigtech(target: str, target_tech: dict) -> list:
+    """관련 대기업 2개 선정"""
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    response = llm.invoke([HumanMessage(content=_bigtech_prompt(target, target_tech))])
+    return _parse_bigtech(response.content)
+
+
+async def aselect_relevant_bigtech(target: str, target_tech: dict) -> list:
+    """select_relevant_bigtech의 async 버전"""
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    response = await llm.ainvoke([HumanMessage(content=_bigtech_prompt(target, target_tech))])
+    return _parse_bigtech(response.content)
+
+
+def _search_startup_index(target: str, tech_blk: dict) -> list:
+    """Discovery FAISS에서 유사 스타트업 검색 (자기 자신 제외)"""
     startup_competitors = []
-    
-    # Discovery FAISS 활용
     try:
-        embeddings = HuggingFaceBgeEmbeddings(
-            model_name="BAAI/bge-base-en-v1.5",
-            model_kwargs={"device": "cpu"},
-            encode_kwargs={"normalize_embeddings": True}
-        )
-        
         faiss_path = Path("faiss_startup_index")  # ✅ Discovery 스타트업 DB
+        vectorstore = get_index(str(faiss_path))
         
-        if faiss_path.exists():
-            vectorstore = FAISS.load_local(
-                str(faiss_path),
-                embeddings,
-                allow_dangerous_deserialization=True
-            )
-            
+        if vectorstore is not None:
             search_query = f"{target} {tech_blk.get('core_technology', '')} AI startup"
             docs = vectorstore.similarity_search(search_query, k=3)
             
@@ -177,62 +189,108 @@ def competitor_analysis(state: GraphState) -> GraphState:
                         "source": "discovery_faiss"
                     })
             
-            print(f"  ✓ Discovery FAISS: {len(startup_competitors)}개")
+            logger.info(f"✓ Discovery FAISS: {len(startup_competitors)}개")
         else:
-            print(f"  ⚠️ Discovery FAISS 없음: {faiss_path}")
+            logger.warning(f"⚠️ Discovery FAISS 없음: {faiss_path}")
         
     except Exception as e:
-        print(f"  ⚠ Vector DB 실패: {e}")
-    
-    # 부족하면 웹 검색 (URL 수집 포함)
-    if len(startup_competitors) < 2:
-        needed = 2 - len(startup_competitors)
-        web_comps, web_urls = search_web_competitors(
-            target,
-            tech_blk.get('core_technology', ''),
-            max_results=needed,
-            exclude_companies=[c["company"] for c in startup_competitors]
-        )
-        startup_competitors.extend(web_comps)
-        competitor_sources.extend(web_urls)
-        print(f"  ✓ 웹 검색: {len(web_comps)}개 추가")
-    
-    # 대기업 2개
-    bigtech = select_relevant_bigtech(target, tech_blk)
-    print(f"  ✓ 대기업: {[c['company'] for c in bigtech]}")
-    
-    all_competitors = startup_competitors[:2] + bigtech[:2]
-    
-    # 2. 웹 리서치 (URL 수집)
-    search_tool = TavilySearchResults(max_results=3)
+        logger.warning(f"⚠ Vector DB 실패: {e}")
+    return startup_competitors
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+# 경쟁사 리서치: 결과는 앞 200자만 쓰므로 요청 단계에서 개수와 본문 크기를 줄임
+RESEARCH_CONCURRENCY = _env_int("INVEST_AGENT_RESEARCH_CONCURRENCY", 4)
+RESEARCH_SEARCH_PARAMS = {
+    "max_results": 3,
+    "include_raw_content": False,
+    "include_answer": False,
+    "include_images": False,
+}
+
+
+def _research_query(comp: dict) -> str:
+    return f"{comp['company']} AI product features customers"
+
+
+def _collect_research(comps: list, results: list, competitor_sources: list) -> Dict[str, str]:
+    """검색 결과(실패 시 예외 객체)를 경쟁사 순서대로 반영 → 출처 순서가 실행 순서와 무관"""
     research_data = {}
-    
-    for comp in all_competitors:
-        comp_name = comp["company"]
+    for comp, result in zip(comps, results):
+        if isinstance(result, Exception):
+            research_data[comp["company"]] = f"Focus: {comp.get('focus', 'N/A')}"
+        else:
+            research_data[comp["company"]] = _research_context(result, competitor_sources)
+    return research_data
+
+
+def research_competitors(comps: list, competitor_sources: list) -> Dict[str, str]:
+    """경쟁사별 웹 리서치 (동시 실행 수는 RESEARCH_CONCURRENCY, 호출 속도는 rate limiter가 제한)"""
+    def search_one(comp: dict):
         try:
-            results = search_tool.invoke({
-                "query": f"{comp_name} AI product features customers"
-            })
-            
-            # URL 수집
-            for r in results:
-                if r.get("url"):
-                    competitor_sources.append(r["url"])
-            
-            context = "\n".join([r.get('content', '')[:200] for r in results])
-            research_data[comp_name] = context
+            return tavily_search(_research_query(comp), **RESEARCH_SEARCH_PARAMS)
         except Exception as e:
-            research_data[comp_name] = f"Focus: {comp.get('focus', 'N/A')}"
-    
-    print(f"  ✓ 웹 리서치 완료")
-    print(f"  ✓ 수집된 출처: {len(competitor_sources)}개")
-    
-    # 3. 경쟁 포지셔닝 분석
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-    scored_list = []
+            return e
+
+    if not comps:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(RESEARCH_CONCURRENCY, len(comps)))) as executor:
+        results = list(executor.map(propagate(search_one), comps))
+    return _collect_research(comps, results, competitor_sources)
+
+
+async def aresearch_competitors(comps: list, competitor_sources: list) -> Dict[str, str]:
+    """research_competitors의 async 버전 (asyncio.Semaphore로 동시 실행 수 제한)"""
+    semaphore = asyncio.Semaphore(max(1, RESEARCH_CONCURRENCY))
+
+    async def search_one(comp: dict):
+        async with semaphore:
+            try:
+                return await atavily_search(_research_query(comp), **RESEARCH_SEARCH_PARAMS)
+            except Exception as e:
+                return e
+
+    results = await asyncio.gather(*(search_one(c) for c in comps))
+    return _collect_research(comps, results, competitor_sources)
+
+
+def _research_context(results: list, competitor_sources: list) -> str:
+    # URL 수집
+    for r in results:
+        if r.get("url"):
+            competitor_sources.append(r["url"])
     
-    for comp in all_competitors:
-        prompt = f"""
+    return "\n".join([r.get('content', '')[:200] for r in results])
+
+
+# ===== 경쟁 포지셔닝 점수 =====
+# batch: 경쟁사 전체를 구조화 출력 1회로 채점 (기본)
+# concurrent: 경쟁사마다 구조화 출력을 동시에 호출
+# batch 프롬프트가 너무 길거나 응답에서 빠진 경쟁사가 있으면 concurrent로 보완함.
+SCORING_MODE = os.getenv("INVEST_AGENT_COMPETITOR_SCORING", "batch")
+MAX_BATCH_PROMPT_CHARS = 12000
+
+
+class CompetitorScore(BaseModel):
+    company: str = Field(description="경쟁사명 (입력과 동일하게)")
+    overlap: float = Field(ge=0, le=10, description="타겟과의 사업/기술 중복도 0-10")
+    differentiation: float = Field(ge=0, le=10, description="타겟 대비 차별화 정도 0-10")
+    moat: float = Field(ge=0, le=10, description="경쟁사의 진입장벽 0-10")
+    positioning: str = Field(description="한 문장 요약")
+
+
+class CompetitorScoreList(BaseModel):
+    scores: List[CompetitorScore]
+
+
+def _score_prompt(target: str, tech_blk: dict, comp: dict, research_data: dict) -> str:
+    return f"""
 경쟁사 평가 (각 0-10점):
 
 타겟: {target} / 기술: {tech_blk.get('core_technology', 'N/A')}
@@ -240,23 +298,119 @@ def competitor_analysis(state: GraphState) -> GraphState:
 
 리서치: {research_data.get(comp["company"], "")[:300]}
 
-JSON 출력:
-{{"company": "{comp['company']}", "overlap": 7.5, "differentiation": 6.0, "moat": 5.5, "positioning": "한 문장 요약"}}
+company는 "{comp['company']}"로, positioning은 한 문장 요약으로 작성.
 """
-        
-        response = llm.invoke([HumanMessage(content=prompt)])
-        score_data = extract_json_from_llm_response(response.content)
-        scored_list.append(score_data)
-    
-    print(f"  ✓ 포지셔닝 분석 완료")
-    
-    # 4. SWOT 분석
+
+
+def _batch_score_prompt(target: str, tech_blk: dict, comps: list, research_data: dict) -> str:
+    blocks = "\n\n".join([
+        f"[{i}] {c['company']} / {c.get('focus', 'N/A')}\n리서치: {research_data.get(c['company'], '')[:300]}"
+        for i, c in enumerate(comps, start=1)
+    ])
+    return f"""
+경쟁사 평가 (경쟁사마다 overlap, differentiation, moat 각 0-10점):
+
+타겟: {target} / 기술: {tech_blk.get('core_technology', 'N/A')}
+
+경쟁사 목록:
+{blocks}
+
+모든 경쟁사에 대해 하나씩 점수를 작성. company는 목록의 이름을 그대로 사용하고,
+positioning은 한 문장 요약으로 작성.
+"""
+
+
+def _scoring_llm():
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+
+
+def _score_dict(comp: dict, score: CompetitorScore) -> dict:
+    data = score.model_dump()
+    data["company"] = comp["company"]  # 표기 차이가 있어도 입력 이름으로 통일
+    return data
+
+
+def _match_scores(comps: list, result: CompetitorScoreList) -> Dict[int, dict]:
+    """batch 응답을 입력 순서(인덱스)에 매칭. 이름은 대소문자/공백 무시."""
+    by_name = {s.company.casefold().strip(): s for s in result.scores}
+    matched = {}
+    for i, comp in enumerate(comps):
+        score = by_name.get(comp["company"].casefold().strip())
+        if score is not None:
+            matched[i] = _score_dict(comp, score)
+    return matched
+
+
+def _use_batch(prompt: str) -> bool:
+    return SCORING_MODE == "batch" and len(prompt) <= MAX_BATCH_PROMPT_CHARS
+
+
+def score_competitors(target: str, tech_blk: dict, comps: list, research_data: dict) -> list:
+    """경쟁사별 포지셔닝 점수 (입력 순서 유지)"""
+    if not comps:
+        return []
+    llm = _scoring_llm()
+    matched: Dict[int, dict] = {}
+
+    prompt = _batch_score_prompt(target, tech_blk, comps, research_data)
+    if _use_batch(prompt):
+        try:
+            result = llm.with_structured_output(CompetitorScoreList).invoke([HumanMessage(content=prompt)])
+            matched = _match_scores(comps, result)
+        except Exception as e:
+            logger.warning(f"⚠ 일괄 채점 실패, 개별 채점으로 전환: {e}")
+
+    missing = [i for i in range(len(comps)) if i not in matched]
+    if missing:
+        single = llm.with_structured_output(CompetitorScore)
+
+        def score_one(i: int) -> dict:
+            prompt = _score_prompt(target, tech_blk, comps[i], research_data)
+            return _score_dict(comps[i], single.invoke([HumanMessage(content=prompt)]))
+
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            for i, data in zip(missing, executor.map(propagate(score_one), missing)):
+                matched[i] = data
+
+    return [matched[i] for i in range(len(comps))]
+
+
+async def ascore_competitors(target: str, tech_blk: dict, comps: list, research_data: dict) -> list:
+    """score_competitors의 async 버전"""
+    if not comps:
+        return []
+    llm = _scoring_llm()
+    matched: Dict[int, dict] = {}
+
+    prompt = _batch_score_prompt(target, tech_blk, comps, research_data)
+    if _use_batch(prompt):
+        try:
+            result = await llm.with_structured_output(CompetitorScoreList).ainvoke([HumanMessage(content=prompt)])
+            matched = _match_scores(comps, result)
+        except Exception as e:
+            logger.warning(f"⚠ 일괄 채점 실패, 개별 채점으로 전환: {e}")
+
+    missing = [i for i in range(len(comps)) if i not in matched]
+    if missing:
+        single = llm.with_structured_output(CompetitorScore)
+
+        async def score_one(i: int) -> dict:
+            prompt = _score_prompt(target, tech_blk, comps[i], research_data)
+            return _score_dict(comps[i], await single.ainvoke([HumanMessage(content=prompt)]))
+
+        for i, data in zip(missing, await asyncio.gather(*(score_one(i) for i in missing))):
+            matched[i] = data
+
+    return [matched[i] for i in range(len(comps))]
+
+
+def _swot_prompt(target: str, tech_blk: dict, market_eval: dict, scored_list: list) -> str:
     competitor_summary = "\n".join([
         f"- {s['company']}: overlap {s['overlap']}, moat {s['moat']}"
         for s in scored_list
     ])
     
-    swot_prompt = f"""
+    return f"""
 투자 심사용 SWOT 분석 (각 5-7개, 구체적 근거 포함):
 
 타겟: {target}
@@ -277,12 +431,9 @@ JSON 출력:
   "threats": ["OpenAI 경쟁으로 마진 50% 축소 위험", "..."]
 }}
 """
-    
-    response = llm.invoke([HumanMessage(content=swot_prompt)])
-    swot_data = extract_json_from_llm_response(response.content)
-    
-    print(f"  ✓ SWOT 완료")
-    
+
+
+def _competitor_update(state: GraphState, target: str, scored_list: list, swot_data: dict, competitor_sources: list) -> GraphState:
     # 5. 최종 출력
     output = {
         "company": target,
@@ -291,12 +442,133 @@ JSON 출력:
         "generated_at": datetime.now().isoformat()
     }
     
-    # State 업데이트
-    state_sources = state.get("sources", {})
-    state_sources["competitor"] = list(set(competitor_sources))  # 중복 제거
-    
+    # 회사명이 state에 없으면(단독 호출) 분석 대상 이름으로 기록
     return {
-        **state,
         "competitor": output,
-        "sources": state_sources
-    }
\ No newline at end of file
+        "sources": source_entry(state.get("current_company", target), "competitor", competitor_sources)
+    }
+
+
+def competitor_analysis(state: GraphState) -> GraphState:
+    """
+    경쟁사 분석 노드
+    
+    입력:
+        - current_company: 타겟 기업명
+        - tech: 기술 분석 결과
+        - market_eval: 시장 분석 결과
+    
+    출력:
+        - competitor: {...}
+        - sources[current_company]["competitor"]: 참고 출처
+    """
+    target = state.get("current_company", "Unknown")
+    tech = state.get("tech", {})
+    tech_blk = tech.get("technology", {})
+    market_eval = state.get("market_eval", {})
+    
+    logger.info(f"[경쟁사 분석] 시작: {target}")
+    
+    # ===== 출처 수집 =====
+    competitor_sources = []
+    
+    # 1. 경쟁사 발굴 (스타트업 2 + 대기업 2)
+    # Discovery FAISS 활용
+    startup_competitors = _search_startup_index(target, tech_blk)
+    
+    # 부족하면 웹 검색 (URL 수집 포함)
+    if len(startup_competitors) < 2:
+        needed = 2 - len(startup_competitors)
+        web_comps, web_urls = search_web_competitors(
+            target,
+            tech_blk.get('core_technology', ''),
+            max_results=needed,
+            exclude_companies=[c["company"] for c in startup_competitors]
+        )
+        startup_competitors.extend(web_comps)
+        competitor_sources.extend(web_urls)
+        logger.info(f"✓ 웹 검색: {len(web_comps)}개 추가")
+    
+    # 대기업 2개
+    bigtech = select_relevant_bigtech(target, tech_blk)
+    logger.info(f"✓ 대기업: {[c['company'] for c in bigtech]}")
+    
+    all_competitors = startup_competitors[:2] + bigtech[:2]
+    
+    # 2. 웹 리서치 (동시 실행, URL 수집)
+    research_data = research_competitors(all_competitors, competitor_sources)
+    
+    logger.info("✓ 웹 리서치 완료")
+    logger.info(f"✓ 수집된 출처: {len(competitor_sources)}개")
+    
+    # 3. 경쟁 포지셔닝 분석 (구조화 출력 일괄 채점)
+    scored_list = score_competitors(target, tech_blk, all_competitors, research_data)
+    
+    logger.info("✓ 포지셔닝 분석 완료")
+    
+    # 4. SWOT 분석
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    swot_prompt = _swot_prompt(target, tech_blk, market_eval, scored_list)
+    response = llm.invoke([HumanMessage(content=swot_prompt)])
+    swot_data = extract_json_from_llm_response(response.content)
+    
+    logger.info("✓ SWOT 완료")
+    
+    return _competitor_update(state, target, scored_list, swot_data, competitor_sources)
+
+
+async def acompetitor_analysis(state: GraphState) -> GraphState:
+    """
+    경쟁사 분석 노드 (async)
+
+    competitor_analysis와 같은 입력/출력. FAISS 검색은 워커 스레드에서,
+    LLM·웹 검색은 ainvoke로 실행.
+    """
+    target = state.get("current_company", "Unknown")
+    tech = state.get("tech", {})
+    tech_blk = tech.get("technology", {})
+    market_eval = state.get("market_eval", {})
+
+    logger.info(f"[경쟁사 분석] 시작: {target}")
+
+    competitor_sources = []
+
+    # 1. 경쟁사 발굴 (스타트업 2 + 대기업 2)
+    startup_competitors = await asyncio.to_thread(_search_startup_index, target, tech_blk)
+
+    if len(startup_competitors) < 2:
+        needed = 2 - len(startup_competitors)
+        web_comps, web_urls = await asearch_web_competitors(
+            target,
+            tech_blk.get('core_technology', ''),
+            max_results=needed,
+            exclude_companies=[c["company"] for c in startup_competitors]
+        )
+        startup_competitors.extend(web_comps)
+        competitor_sources.extend(web_urls)
+        logger.info(f"✓ 웹 검색: {len(web_comps)}개 추가")
+
+    bigtech = await aselect_relevant_bigtech(target, tech_blk)
+    logger.info(f"✓ 대기업: {[c['company'] for c in bigtech]}")
+
+    all_competitors = startup_competitors[:2] + bigtech[:2]
+
+    # 2. 웹 리서치 (동시 실행, URL 수집)
+    research_data = await aresearch_competitors(all_competitors, competitor_sources)
+
+    logger.info("✓ 웹 리서치 완료")
+    logger.info(f"✓ 수집된 출처: {len(competitor_sources)}개")
+
+    # 3. 경쟁 포지셔닝 분석 (구조화 출력 일괄 채점)
+    scored_list = await ascore_competitors(target, tech_blk, all_competitors, research_data)
+
+    logger.info("✓ 포지셔닝 분석 완료")
+
+    # 4. SWOT 분석
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    response = await llm.ainvoke([HumanMessage(content=_swot_prompt(target, tech_blk, market_eval, scored_list))])
+    swot_data = extract_json_from_llm_response(response.content)
+
+    logger.info("✓ SWOT 완료")
+
+    return _competitor_update(state, target, scored_list, swot_data, competitor_sources)
@@ -1,10 +1,13 @@
 # agents/discovery.py
 from typing import Dict, Any
-from invest_agent.states import GraphState
+from invest_agent.states import GraphState, source_entry
 
 import os
 import json
+import logging
 import re
+import time
+import threading
 import hashlib
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
@@ -13,13 +16,19 @@ from typing import List, Optional
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, ValidationError
 from langchain_openai import ChatOpenAI
-from langchain_community.embeddings import HuggingFaceBgeEmbeddings
 from langchain_community.vectorstores import FAISS
 from langchain_community.vectorstores.utils import filter_complex_metadata
 from langchain_community.retrievers import TavilySearchAPIRetriever
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.documents import Document
-from langchain_huggingface import HuggingFaceEmbeddings
+
+from invest_agent.infra.embedding_cache import get_cached_embeddings
+from invest_agent.infra.vectorstores import reload_index
+from invest_agent.infra.search_cache import retriever_search
+from invest_agent.infra.profiling import propagate
+from invest_agent.infra.log import SAMPLED
+
+logger = logging.getLogger(__name__)
 
 try:
     # LangChain >= 1.0 (분리 패키지)
@@ -35,16 +44,35 @@ except ImportError:
 
 load_dotenv()
 
+# ===== 증분 인덱스 설정 =====
+STARTUP_INDEX_PATH = "./faiss_startup_index"
+# 마지막으로 검색 결과에 다시 등장한 지 이 기간이 지난 청크는 tombstone 처리
+STALE_AFTER_DAYS = float(os.getenv("INVEST_AGENT_DISCOVERY_STALE_DAYS", 90))
+# tombstone 비율이 이 값 이상이면 인덱스에서 실제로 삭제(compaction)
+COMPACT_TOMBSTONE_RATIO = float(os.getenv("INVEST_AGENT_DISCOVERY_COMPACT_RATIO", 0.2))
+
+
+def content_hash(text: str) -> str:
+    """공백을 정규화한 본문의 sha256 (청크 ID로 사용)"""
+    normalized = re.sub(r"\s+", " ", text or "").strip()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def is_live_document(metadata: dict) -> bool:
+    """tombstone 처리되지 않은 문서만 검색 대상"""
+    return not metadata.get("tombstone")
+
+
 def check_api_keys():
     openai_key = os.getenv("OPENAI_API_KEY")
     tavily_key = os.getenv("TAVILY_API_KEY")
     if not openai_key:
-        print("❌ OPENAI_API_KEY가 설정되지 않았습니다.")
+        logger.error("❌ OPENAI_API_KEY가 설정되지 않았습니다.")
         return False
     if not tavily_key:
-        print("❌ TAVILY_API_KEY가 설정되지 않았습니다.")
+        logger.error("❌ TAVILY_API_KEY가 설정되지 않았습니다.")
         return False
-    print("✅ API 키가 올바르게 설정되었습니다.")
+    logger.info("✅ API 키가 올바르게 설정되었습니다.")
     return True
 
 
@@ -124,11 +152,11 @@ class GenerativeAIStartupRAG:
         web_search_tool = {"type": "web_search_preview"}
         self.web_search_llm_with_tools = self.web_search_llm.bind_tools([web_search_tool])
 
-        self.embeddings = HuggingFaceEmbeddings(
+        # 청크 임베딩은 content-hash 캐시를 거쳐 이미 계산한 벡터를 재사용
+        self.embeddings = get_cached_embeddings(
             model_name="BAAI/bge-base-en-v1.5",
-            model_kwargs={"device": "cpu"},
-            encode_kwargs={"normalize_embeddings": True},
-            # query_instruction="Represent this sentence for searching relevant passages: "
+            device="cpu",
+            normalize=True,
         )
 
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -148,7 +176,8 @@ class GenerativeAIStartupRAG:
 
         self.vector_store = None
         self.vector_retriever = None
-        self.query_cache = {}
+        # 이번 탐색에서 upsert한 (문서, ID) 묶음 → 저장 직전 최신 인덱스에 다시 반영
+        self._session_upserts: List[tuple] = []
 
         self.prompt = ChatPromptTemplate.from_template("""
 You are a generative AI startup analysis specialist.
@@ -205,21 +234,15 @@ Focus on startups in early funding stages (Angel to Series A only) **WITH AVAILA
 """)
 
     def create_vector_db_from_web_search(self, query: str) -> None:
-        print("🔍 웹에서 정보를 검색하고 있습니다...")
+        logger.info("🔍 웹에서 정보를 검색하고 있습니다...")
         try:
-            query_hash = hashlib.md5(query.encode()).hexdigest()
-            if query_hash in self.query_cache:
-                print("✅ 캐시된 검색 결과를 사용합니다.")
-                cached_docs = self.query_cache[query_hash]
-                self._build_vector_store(cached_docs)
-                return
-
-            print("🔄 병렬 웹 검색을 시작합니다...")
+            # 검색 결과는 search_cache(SQLite)에 영속 저장되어 재실행 시 재사용됨
+            logger.info("🔄 병렬 웹 검색을 시작합니다...")
 
             with ThreadPoolExecutor(max_workers=2) as executor:
-                future_general = executor.submit(self.web_retriever.invoke, query)
+                future_general = executor.submit(propagate(retriever_search), self.web_retriever, query)
                 ceo_query = query + " CEO current chief executive officer 대표"
-                future_ceo = executor.submit(self.web_retriever.invoke, ceo_query)
+                future_ceo = executor.submit(propagate(retriever_search), self.web_retriever, ceo_query)
 
                 web_docs = future_general.result()
                 ceo_docs = future_ceo.result()
@@ -234,51 +257,181 @@ Focus on startups in early funding stages (Angel to Series A only) **WITH AVAILA
                     all_docs.append(doc)
 
             if not all_docs:
-                print("❌ 웹 검색 결과가 없습니다.")
+                logger.error("❌ 웹 검색 결과가 없습니다.")
                 return
 
-            print(f"📄 {len(all_docs)}개의 고유 웹 문서를 찾았습니다.")
-            self.query_cache[query_hash] = all_docs
+            logger.info(f"📄 {len(all_docs)}개의 고유 웹 문서를 찾았습니다.")
             self._build_vector_store(all_docs)
 
         except Exception as e:
-            print(f"❌ 웹 검색 또는 벡터 DB 생성 중 오류 발생: {e}")
+            logger.error(f"❌ 웹 검색 또는 벡터 DB 생성 중 오류 발생: {e}")
             raise
 
     def _build_vector_store(self, docs):
-        print("🧹 복잡한 메타데이터를 필터링하고 있습니다...")
+        logger.info("🧹 복잡한 메타데이터를 필터링하고 있습니다...")
         filtered_docs = filter_complex_metadata(docs)
-        print(f"✅ {len(filtered_docs)}개의 문서에서 메타데이터 필터링 완료")
+        logger.info(f"✅ {len(filtered_docs)}개의 문서에서 메타데이터 필터링 완료")
 
         split_docs = self.text_splitter.split_documents(filtered_docs)
-        print(f"✂️ 문서를 {len(split_docs)}개 청크로 분할했습니다.")
+        logger.info(f"✂️ 문서를 {len(split_docs)}개 청크로 분할했습니다.")
 
-        print("🔄 FAISS 벡터 데이터베이스를 생성하고 있습니다...")
-        self.vector_store = FAISS.from_documents(
-            documents=split_docs,
-            embedding=self.embeddings
-        )
+        # 청크 ID = 본문 해시 → 이미 임베딩된 페이지는 건너뜀
+        logger.info("🔄 FAISS 벡터 데이터베이스에 증분 추가하고 있습니다...")
+        ids = [content_hash(doc.page_content) for doc in split_docs]
+        self._session_upserts.append((split_docs, ids))
+        added, skipped = self._upsert_documents(split_docs, ids)
+        logger.info(f"✅ 신규 청크 {added}개 임베딩, 기존 청크 {skipped}개 재사용")
 
-        self.vector_retriever = self.vector_store.as_retriever(
+        if self.vector_store is None:
+            logger.error("❌ 인덱싱할 청크가 없습니다.")
+            return
+
+        self.vector_retriever = self._make_retriever()
+        logger.info("✅ FAISS 벡터 데이터베이스 준비 완료!")
+
+    def _make_retriever(self):
+        return self.vector_store.as_retriever(
             search_type="mmr",
             search_kwargs={
                 "k": 15,
                 "fetch_k": 40,
-                "lambda_mult": 0.7
+                "lambda_mult": 0.7,
+                "filter": is_live_document,
             }
         )
-        print("✅ FAISS 벡터 데이터베이스 생성 완료!")
+
+    def _stored_document(self, doc_id: str) -> Optional[Document]:
+        doc = self.vector_store.docstore.search(doc_id)
+        return doc if isinstance(doc, Document) else None
+
+    def _upsert_documents(self, docs: List[Document], ids: List[str]) -> tuple:
+        """
+        ID 기준 upsert
+
+        - 같은 ID·같은 본문: 임베딩 생략, last_seen_at 갱신 및 tombstone 해제
+        - 같은 ID·다른 본문: 기존 벡터 삭제 후 다시 추가
+        - 새 ID: 추가
+
+        출력: (추가된 문서 수, 재사용된 문서 수)
+        """
+        now = time.time()
+        existing = set(self.vector_store.index_to_docstore_id.values()) if self.vector_store else set()
+
+        new_docs, new_ids, replaced = [], [], []
+        seen = set()
+        skipped = 0
+        for doc, doc_id in zip(docs, ids):
+            if doc_id in seen:
+                skipped += 1
+                continue
+            seen.add(doc_id)
+
+            digest = content_hash(doc.page_content)
+            if doc_id in existing:
+                stored = self._stored_document(doc_id)
+                if stored is not None and stored.metadata.get("content_hash") == digest:
+                    stored.metadata["last_seen_at"] = now
+                    stored.metadata["tombstone"] = False
+                    skipped += 1
+                    continue
+                replaced.append(doc_id)
+
+            doc.metadata.update({
+                "content_hash": digest,
+                "indexed_at": now,
+                "last_seen_at": now,
+                "tombstone": False,
+            })
+            new_docs.append(doc)
+            new_ids.append(doc_id)
+
+        if replaced:
+            self.vector_store.delete(replaced)
+        if new_docs:
+            if self.vector_store is None:
+                self.vector_store = FAISS.from_documents(
+                    documents=new_docs,
+                    embedding=self.embeddings,
+                    ids=new_ids,
+                )
+            else:
+                self.vector_store.add_documents(new_docs, ids=new_ids)
+        return len(new_docs), skipped
+
+    def tombstone_stale_documents(self, max_age_days: float = STALE_AFTER_DAYS) -> int:
+        """
+        오래 재등장하지 않은 웹 청크를 tombstone 처리 (검색에서 제외, compaction 때 삭제)
+
+        보완 데이터(enriched_startup_data)는 회사 단위로 upsert되므로 대상에서 제외.
+        last_seen_at이 없는 이전 인덱스 문서는 지금 시각으로 기록하고 유예함.
+        """
+        if not self.vector_store:
+            return 0
+
+        now = time.time()
+        cutoff = now - max_age_days * 24 * 3600
+        marked = 0
+        for doc_id in self.vector_store.index_to_docstore_id.values():
+            doc = self._stored_document(doc_id)
+            if doc is None or doc.metadata.get("tombstone"):
+                continue
+            if doc.metadata.get("type") == "enriched_startup_data":
+                continue
+            last_seen = doc.metadata.setdefault("last_seen_at", now)
+            if last_seen < cutoff:
+                doc.metadata["tombstone"] = True
+                marked += 1
+
+        if marked:
+            logger.info(f"🪦 오래된 청크 {marked}개를 tombstone 처리했습니다.")
+        return marked
+
+    def compact_vector_store(self, min_ratio: float = COMPACT_TOMBSTONE_RATIO) -> int:
+        """tombstone 비율이 min_ratio 이상이면 해당 벡터를 인덱스에서 삭제"""
+        if not self.vector_store:
+            return 0
+
+        doc_ids = list(self.vector_store.index_to_docstore_id.values())
+        dead = []
+        for doc_id in doc_ids:
+            doc = self._stored_document(doc_id)
+            if doc is not None and doc.metadata.get("tombstone"):
+                dead.append(doc_id)
+        if not dead or len(dead) / len(doc_ids) < min_ratio:
+            return 0
+
+        self.vector_store.delete(dead)
+        logger.info(f"🗜️ 인덱스 compaction: {len(dead)}개 삭제, {self.vector_store.index.ntotal}개 유지")
+        return len(dead)
+
+    def maintain_vector_store(self) -> None:
+        """저장 전 주기적 정리 (tombstone → compaction)"""
+        self.tombstone_stale_documents()
+        self.compact_vector_store()
+
+    def merge_into_saved_index(self, path: str = STARTUP_INDEX_PATH) -> None:
+        """
+        이번 탐색에서 upsert한 문서를 디스크의 최신 인덱스에 다시 반영한 뒤 정리·저장
+
+        탐색하는 동안 다른 작업이 같은 인덱스를 저장했을 수 있으므로 저장 직전에 다시 로드함.
+        인덱스 잠금(_startup_index_lock)을 잡은 상태로 호출해야 함.
+        """
+        if os.path.exists(os.path.join(path, "index.faiss")):
+            self.load_vector_store(path)
+            for docs, ids in self._session_upserts:
+                self._upsert_documents(docs, ids)
+        self.maintain_vector_store()
+        self.save_vector_store(path)
 
     def add_enriched_startups_to_vector_store(self, startups: List[GenerativeAIStartup]) -> None:
-        print("\n" + "=" * 60)
-        print("💾 보완된 스타트업 데이터를 FAISS 벡터 DB에 추가 중...")
-        print("=" * 60)
+        logger.info("💾 보완된 스타트업 데이터를 FAISS 벡터 DB에 추가 중...")
 
         if not self.vector_store:
-            print("⚠️ 벡터 스토어가 초기화되지 않았습니다.")
+            logger.warning("⚠️ 벡터 스토어가 초기화되지 않았습니다.")
             return
 
         enriched_docs = []
+        enriched_ids = []
 
         for startup in startups:
             enriched_text = f"""
@@ -306,51 +459,49 @@ CEO: {startup.ceo}
                 }
             )
             enriched_docs.append(doc)
-            print(f"   ✅ {startup.startup_name} 데이터 준비 완료")
+            # 회사당 하나의 문서: 같은 회사를 다시 발견하면 내용이 바뀐 경우에만 교체
+            enriched_ids.append("enriched:" + content_hash(startup.startup_name.lower()))
+            logger.info(f"✅ {startup.startup_name} 데이터 준비 완료", extra=SAMPLED)
 
         try:
-            print(f"\n🔄 {len(enriched_docs)}개의 보완된 문서를 임베딩 중...")
-            self.vector_store.add_documents(enriched_docs)
-            print(f"✅ {len(enriched_docs)}개의 보완된 스타트업 데이터가 벡터 DB에 추가되었습니다!")
+            logger.info(f"🔄 {len(enriched_docs)}개의 보완된 문서를 upsert 중...")
+            self._session_upserts.append((enriched_docs, enriched_ids))
+            added, skipped = self._upsert_documents(enriched_docs, enriched_ids)
+            logger.info(f"✅ 보완된 스타트업 데이터 {added}개 추가/갱신, {skipped}개 변경 없음")
 
             total_docs = self.vector_store.index.ntotal
-            print(f"📊 현재 벡터 DB 총 문서 수: {total_docs}")
+            logger.info(f"📊 현재 벡터 DB 총 문서 수: {total_docs}")
 
         except Exception as e:
-            print(f"❌ 벡터 DB 추가 중 오류: {e}")
+            logger.error(f"❌ 벡터 DB 추가 중 오류: {e}")
 
-    def save_vector_store(self, save_path: str = "./faiss_startup_index") -> None:
+    def save_vector_store(self, save_path: str = STARTUP_INDEX_PATH) -> None:
         if not self.vector_store:
-            print("⚠️ 저장할 벡터 스토어가 없습니다.")
+            logger.warning("⚠️ 저장할 벡터 스토어가 없습니다.")
             return
 
         try:
             self.vector_store.save_local(save_path)
-            print(f"💾 벡터 스토어가 저장되었습니다: {save_path}")
+            logger.info(f"💾 벡터 스토어가 저장되었습니다: {save_path}")
+            # 공유 인덱스 캐시(competitor 에이전트가 사용)를 새 벡터로 교체
+            reload_index(save_path, self.embeddings)
         except Exception as e:
-            print(f"❌ 벡터 스토어 저장 중 오류: {e}")
+            logger.error(f"❌ 벡터 스토어 저장 중 오류: {e}")
 
-    def load_vector_store(self, load_path: str = "./faiss_startup_index") -> None:
+    def load_vector_store(self, load_path: str = STARTUP_INDEX_PATH) -> None:
         try:
             self.vector_store = FAISS.load_local(
                 load_path, 
                 self.embeddings,
                 allow_dangerous_deserialization=True
             )
-            self.vector_retriever = self.vector_store.as_retriever(
-                search_type="mmr",
-                search_kwargs={
-                    "k": 15,
-                    "fetch_k": 40,
-                    "lambda_mult": 0.7
-                }
-            )
-            print(f"✅ 벡터 스토어가 로드되었습니다: {load_path}")
+            self.vector_retriever = self._make_retriever()
+            logger.info(f"✅ 벡터 스토어가 로드되었습니다: {load_path}")
         except Exception as e:
-            print(f"❌ 벡터 스토어 로드 중 오류: {e}")
+            logger.error(f"❌ 벡터 스토어 로드 중 오류: {e}")
 
     def sup_missing_ceo_with_gpt(self, company_name: str) -> str:
-        print(f"🤖 GPT 웹 검색으로 {company_name}의 CEO 이름을 찾는 중...")
+        logger.info(f"🤖 GPT 웹 검색으로 {company_name}의 CEO 이름을 찾는 중...", extra=SAMPLED)
 
         try:
             search_prompt = f"""
@@ -388,7 +539,7 @@ If the CEO information is not found, return exactly: "Information not available"
 
 Do not include any explanations, titles, or additional text.
 """
-            print(f"   🔎 GPT가 웹 검색을 시작합니다: {company_name} CEO")
+            logger.info(f"🔎 GPT가 웹 검색을 시작합니다: {company_name} CEO", extra=SAMPLED)
             response = self.web_search_llm_with_tools.invoke(search_prompt)
 
             if hasattr(response, 'content'):
@@ -406,35 +557,32 @@ Do not include any explanations, titles, or additional text.
             cleaned_ceo_name = extract_ceo_name_only(extracted_info)
 
             if cleaned_ceo_name != "Information not available":
-                print(f"   ✅ CEO 이름 추출 성공: {cleaned_ceo_name}")
+                logger.info(f"✅ CEO 이름 추출 성공: {cleaned_ceo_name}", extra=SAMPLED)
                 return cleaned_ceo_name
             else:
-                print(f"   ⚠️ CEO 정보를 찾지 못했습니다.")
+                logger.warning("⚠️ CEO 정보를 찾지 못했습니다.")
                 return "Information not available"
 
         except Exception as e:
-            print(f"   ❌ GPT 웹 검색 중 오류: {e}")
+            logger.error(f"❌ GPT 웹 검색 중 오류: {e}")
             return "Information not available"
 
     def sup_startup_data(self, startup: GenerativeAIStartup) -> GenerativeAIStartup:
-        print(f"\n{'='*60}")
-        print(f"🔍 {startup.startup_name} 데이터 보완 시작")
-        print(f"{'='*60}")
+        logger.info(f"🔍 {startup.startup_name} 데이터 보완 시작", extra=SAMPLED)
 
         if startup.ceo == "Information not available":
-            print(f"📍 CEO 정보 누락 감지")
+            logger.info("📍 CEO 정보 누락 감지", extra=SAMPLED)
             sup_ceo = self.sup_missing_ceo_with_gpt(startup.startup_name)
             if sup_ceo != "Information not available":
                 startup.ceo = sup_ceo
-                print(f"✅ CEO 정보 업데이트: {sup_ceo}")
+                logger.info(f"✅ CEO 정보 업데이트: {sup_ceo}", extra=SAMPLED)
         else:
-            print(f"📍 기존 CEO 정보 정리 중: {startup.ceo}")
+            logger.info(f"📍 기존 CEO 정보 정리 중: {startup.ceo}", extra=SAMPLED)
             cleaned_ceo = extract_ceo_name_only(startup.ceo)
             if cleaned_ceo != startup.ceo:
                 startup.ceo = cleaned_ceo
-                print(f"✅ CEO 이름 정리 완료: {cleaned_ceo}")
+                logger.info(f"✅ CEO 이름 정리 완료: {cleaned_ceo}", extra=SAMPLED)
 
-        print(f"{'='*60}\n")
         return startup
 
     def search_startup(self, query: str, save_enriched_to_db: bool = True) -> GenerativeAIStartupList:
@@ -448,7 +596,7 @@ Do not include any explanations, titles, or additional text.
         if not self.vector_retriever:
             raise ValueError("벡터 리트리버가 생성되지 않았습니다.")
 
-        print("🔗 커스텀 RAG 체인을 구성하고 있습니다...")
+        logger.info("🔗 커스텀 RAG 체인을 구성하고 있습니다...")
 
         def custom_rag_chain(inputs: dict) -> GenerativeAIStartupList:
             context_docs = self.vector_retriever.invoke(inputs["input"])
@@ -460,24 +608,22 @@ Do not include any explanations, titles, or additional text.
             result = self.structured_llm.invoke(formatted_prompt)
             return result
 
-        print("🤖 AI가 여러 스타트업을 분석하고 있습니다...")
+        logger.info("🤖 AI가 여러 스타트업을 분석하고 있습니다...")
         try:
             result = custom_rag_chain({"input": query})
 
-            print("\n🔄 초기 추출된 CEO 정보 정리 중...")
+            logger.info("🔄 초기 추출된 CEO 정보 정리 중...")
             for startup in result.items:
                 if startup.ceo != "Information not available":
                     cleaned = extract_ceo_name_only(startup.ceo)
                     if cleaned != startup.ceo:
-                        print(f"   - {startup.startup_name}: '{startup.ceo}' -> '{cleaned}'")
+                        logger.info(f"- {startup.startup_name}: '{startup.ceo}' -> '{cleaned}'", extra=SAMPLED)
                         startup.ceo = cleaned
 
-            print("\n" + "=" * 60)
-            print("🔄 GPT 웹 검색으로 누락된 CEO 정보를 보완 중...")
-            print("=" * 60)
+            logger.info("🔄 GPT 웹 검색으로 누락된 CEO 정보를 보완 중...")
 
             with ThreadPoolExecutor(max_workers=3) as executor:
-                sup_items = list(executor.map(self.sup_startup_data, result.items))
+                sup_items = list(executor.map(propagate(self.sup_startup_data), result.items))
 
             result.items = sup_items
 
@@ -486,7 +632,7 @@ Do not include any explanations, titles, or additional text.
 
             return result
         except ValidationError as ve:
-            print(f"⚠️ 구조화 출력 검증 실패: {ve}")
+            logger.warning(f"⚠️ 구조화 출력 검증 실패: {ve}")
             raise
 
     def cleanup(self):
@@ -507,73 +653,109 @@ def save_result_to_json(result: GenerativeAIStartupList, output_dir: str = "./re
     }
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(output_data, f, ensure_ascii=False, indent=4)
-    print(f"💾 JSON 파일 저장 완료: {filepath}")
+    logger.info(f"💾 JSON 파일 저장 완료: {filepath}")
     return filepath
 
 
 def main():
+    from invest_agent.infra.log import setup_logging
+
+    setup_logging()
     rag_system = None
     try:
         rag_system = GenerativeAIStartupRAG()
         user_query = "2015년도 이후에 한국에서 설립되고 2025년 9월까지 운영중이며, CEO 정보가 있는 50명 미만의 생성형 AI 스타트업 찾아줘"
 
-        print("=" * 60)
-        print("🚀 생성형 AI 스타트업 검색 시스템 실행")
-        print("=" * 60)
+        logger.info("🚀 생성형 AI 스타트업 검색 시스템 실행")
 
         result = rag_system.search_startup(user_query, save_enriched_to_db=True)
 
         if isinstance(result, GenerativeAIStartupList):
             print(json.dumps(result.model_dump(exclude_none=True), ensure_ascii=False, indent=2))
             save_result_to_json(result)
-            rag_system.save_vector_store("./faiss_startup_index")
+            rag_system.maintain_vector_store()
+            rag_system.save_vector_store(STARTUP_INDEX_PATH)
         else:
             print("예상하지 못한 결과:", result)
 
     except Exception as e:
-        print(f"❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ 오류 발생: {e}")
     finally:
         if rag_system:
             rag_system.cleanup()
 
 
 
+# 같은 프로세스의 여러 작업(batch 워커 등)이 startup 인덱스를 동시에 로드·저장하면
+# 나중에 저장한 쪽이 먼저 추가된 청크를 덮어쓰므로 인덱스 로드와 병합·저장만 직렬화함
+# (웹 검색·LLM 추출은 잠금 밖에서 병렬로 실행)
+_startup_index_lock = threading.Lock()
+
+
+def _target_query(targets: List[str]) -> str:
+    return " ".join(targets) + " 생성형 AI 스타트업 CEO 투자"
+
+
+def _select_target_items(items: List[Dict[str, Any]], targets: List[str]) -> List[Dict[str, Any]]:
+    """
+    지정한 회사만 남김 (이름 부분 일치, 대소문자 무시)
+
+    탐색 결과에 없는 회사는 이름만 있는 항목으로 추가하여 분석 단계가 웹 검색으로 보완하게 함.
+    """
+    selected = []
+    for target in targets:
+        needle = target.casefold().strip()
+        match = next(
+            (item for item in items
+             if needle in item.get("startup_name", "").casefold()
+             or item.get("startup_name", "").casefold() in needle),
+            None,
+        )
+        if match is None:
+            logger.warning(f"⚠ 탐색 결과에 없음, 이름만으로 분석: {target}")
+            match = {"startup_name": target, "source_urls": []}
+        selected.append(match)
+    return selected
+
+
 def startup_discovery(state: GraphState) -> GraphState:
     """
     Workflow용 래퍼: 기업 탐색
     
-    입력: state["query"]
+    입력: state["query"], state["target_companies"] (선택: 분석할 회사를 직접 지정)
     출력: state["discovery"], state["companies"]
     """
-    query = state.get("query", "")
+    targets = state.get("target_companies") or []
+    query = state.get("query", "") or (_target_query(targets) if targets else "")
     
     if not query:
         raise ValueError("query가 비어 있습니다.")
     
-    print(f"[기업 탐색] 시작: {query}")
+    logger.info(f"[기업 탐색] 시작: {query}")
     
     # 네 원본 클래스 사용
     rag_system = GenerativeAIStartupRAG()
     
     try:
-        # ===== 기존 FAISS 로드 시도 (누적 저장) =====
-        try:
-            rag_system.load_vector_store("./faiss_startup_index")
-            print(f"  ✓ 기존 FAISS DB 로드 완료")
-        except Exception as e:
-            print(f"  ℹ️ 기존 FAISS DB 없음, 새로 생성 예정")
-
-        # 네 원본 메서드 호출
+        with _startup_index_lock:
+            # ===== 기존 FAISS 로드 시도 (누적 저장) =====
+            try:
+                rag_system.load_vector_store(STARTUP_INDEX_PATH)
+                logger.info("✓ 기존 FAISS DB 로드 완료")
+            except Exception as e:
+                logger.info("ℹ️ 기존 FAISS DB 없음, 새로 생성 예정")
+
+        # 네 원본 메서드 호출 (잠금 밖: 다른 워커의 탐색과 병렬 실행)
         result = rag_system.search_startup(query, save_enriched_to_db=True)
-        
+    
         # Pydantic → dict 변환
         discovery_dict = result.model_dump(exclude_none=True)
-        
+        if targets:
+            discovery_dict["items"] = _select_target_items(discovery_dict["items"], targets)
+    
         # 회사명 리스트 추출
         companies = [item["startup_name"] for item in discovery_dict["items"]]
-        
+    
         # 출처 수집
         discovery_sources = []
         for item in discovery_dict["items"]:
@@ -584,20 +766,18 @@ def startup_discovery(state: GraphState) -> GraphState:
         # 중복 제거
         discovery_sources = list(set(discovery_sources))
 
-        # faiss 저장 
-        rag_system.save_vector_store("./faiss_startup_index") 
+        # 최신 인덱스에 이번 문서를 다시 반영하고 오래된 청크 정리 후 faiss 저장
+        with _startup_index_lock:
+            rag_system.merge_into_saved_index(STARTUP_INDEX_PATH)
 
-        state_sources = state.get("sources", {})
-        state_sources["discovery"] = discovery_sources
-        
-        print(f"  ✓ 발견: {len(companies)}개 스타트업")
+        logger.info(f"✓ 발견: {len(companies)}개 스타트업")
         
+        # 바뀐 키만 반환 (sources는 merge_sources reducer로 원장에 병합)
         return {
-            **state,
             "discovery": discovery_dict,
             "companies": companies,
             "idx": 0,
-            "sources": state_sources
+            "sources": source_entry("", "discovery", discovery_sources)
         }
         
     finally:
@@ -615,12 +795,9 @@ def pick_company(state: GraphState) -> GraphState:
     idx = state.get("idx", 0)
     
     if idx >= len(companies):
-        return {**state, "current_company": ""}
+        return {"current_company": ""}
     
     current_company = companies[idx]
-    print(f"[회사 선택] {idx + 1}/{len(companies)}: {current_company}")
+    logger.info(f"[회사 선택] {idx + 1}/{len(companies)}: {current_company}")
     
-    return {
-        # **state,
-        "current_company": current_company
-    }
\ No newline at end of file
+    return {"current_company": current_company}
\ No newline at end of file
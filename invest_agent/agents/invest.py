@@ -3,13 +3,41 @@ from typing import Dict, Any
 from invest_agent.states import GraphState
 import os
 import json
-import math
-import re
-from typing import TypedDict, List, Optional, Literal, Dict, Any
+import logging
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any
 
 from dotenv import load_dotenv
 import openai
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+
+from invest_agent.infra.llm_cache import cached_completion, acached_completion
+from invest_agent.infra.profiling import propagate
+# 상수·정규화·점수 계산은 LLM 의존성이 없는 agents/scoring.py에 있음 (기존 import 경로 유지용 재노출)
+from invest_agent.agents.scoring import (
+    DecisionStatus,
+    WEIGHTS,
+    INVEST_CUTOFF,
+    RISK_PENALTY_BUCKETS,
+    RED_FLAG_RULES,
+    clamp,
+    parse_usd_billion,
+    parse_percent,
+    normalize_input,
+    score_market,
+    score_technology,
+    score_competition,
+    score_traction,
+    score_deal_terms,
+    compute_scores,
+    apply_risk_penalty,
+    decide_status,
+    decision_label,
+)
+from invest_agent.infra.evaluation_archive import amount_texts, append_evaluation
+
+logger = logging.getLogger(__name__)
 """
 invest_decision_agent.py
 
@@ -25,365 +53,60 @@ if not api_key:
     raise RuntimeError("OPENAI_API_KEY not found in environment. Please set it in your .env file.")
 openai.api_key = api_key  # for legacy-style calls
 client = OpenAI()         # for new-style client calls
+aclient = AsyncOpenAI()   # for async node (ainvestment_decision)
 
 DEFAULT_MODEL = "gpt-4o"
 
 
-# ========= Schema & Constants =========
-
-DecisionStatus = Literal["invest", "fail"]
-
-WEIGHTS = {
-    "market": 0.35,
-    "technology": 0.25,
-    "competition": 0.20,
-    "traction": 0.10,
-    "deal": 0.10,
-}
-
-INVEST_CUTOFF = 65.0
-
-RISK_PENALTY_BUCKETS = [
-    (20.0, 5.0),
-    (35.0, 10.0),
-    (9999.0, 15.0),
-]
-
-RED_FLAG_RULES = {
-    "bigtech_keywords": [
-        "Sora",
-        "OpenAI",
-        "Adobe",
-        "Google",
-        "Meta",
-        "Amazon",
-        "Microsoft",
-    ],
-}
-
-
-def clamp(x: float, lo: float = 0.0, hi: float = 100.0) -> float:
-    return max(lo, min(hi, x))
-
-
-# ========= Normalizer =========
-
-def parse_usd_billion(text: str) -> Optional[float]:
-    """'6000억 달러' → 600.0  (억=100M → billions)"""
-    if not text:
-        return None
-    m = re.search(r"([\d\.]+)\s*억\s*달러", text)
-    if m:
-        return float(m.group(1)) / 10.0
-    m = re.search(r"([\d\.]+)\s*백만\s*달러", text)
-    if m:
-        return float(m.group(1)) / 1000.0
-    return None
-
-
-def parse_percent(text: str) -> Optional[float]:
-    """'17.3%' → 17.3"""
-    if not text:
-        return None
-    m = re.search(r"([\d\.]+)\s*%", text)
-    return float(m.group(1)) if m else None
-
-
-def normalize_input(raw: Dict[str, Any]) -> Dict[str, Any]: 
-    state: GraphState = {}
-
-    # Market
-    if "market" in raw:
-        market_raw = raw["market"]
-        state["market"] = {
-            "tam_usd_b": parse_usd_billion(market_raw.get("market_size", "")),
-            "cagr_pct": parse_percent(market_raw.get("cagr", "")),
-            "problem_fit_text": market_raw.get("problem_fit"),
-            "demand_drivers": market_raw.get("demand_drivers", []),
-        }
-
-    # Technology
-    if "technology" in raw:
-        tech_raw = raw["technology"]
-        state["technology"] = {
-            "technology_summary": tech_raw.get("technology_summary"),
-            "core_technology": tech_raw.get("core_technology"),
-            "sota_performance_note": tech_raw.get("sota_performance"),
-            "reproduction_difficulty": tech_raw.get("reproduction_difficulty", "unknown"),
-            "infrastructure_requirements": tech_raw.get("infrastructure_requirements", []),
-            "ip_patent_status": tech_raw.get("ip_patent_status", "unknown"),
-            "scalability_note": tech_raw.get("scalability"),
-            "tech_risks_texts": tech_raw.get("tech_risks", []),
-        }
-
-    # Competition
-    if "competition" in raw:
-        comp_raw = raw["competition"]
-        competitors = []
-        for c in comp_raw.get("competitors_analysis", []):
-            competitors.append(
-                {
-                    "name": c.get("company"),
-                    "overlap_0to10": c.get("overlap"),
-                    "differentiation_0to10": c.get("differentiation"),
-                    "moat_0to10": c.get("moat"),
-                    "positioning": c.get("positioning"),
-                }
-            )
-        state["competition"] = {
-            "competitors": competitors,
-            "swot_strengths": comp_raw.get("swot", {}).get("strengths", []),
-            "swot_weaknesses": comp_raw.get("swot", {}).get("weaknesses", []),
-            "swot_opportunities": comp_raw.get("swot", {}).get("opportunities", []),
-            "swot_threats": comp_raw.get("swot", {}).get("threats", []),
-        }
-
-    # Business
-    if "business" in raw:
-        biz_raw = raw["business"]
-        state["business"] = {
-            "arr_usd_m": parse_usd_billion(biz_raw.get("revenue_model", "")),
-            "pricing_model": biz_raw.get("pricing_examples"),
-            "customer_segments": biz_raw.get("customer_segments", []),
-            "funding_text": raw.get("traction", {}).get("funding"),
-            "investors": raw.get("traction", {}).get("investors", []),
-            "partnerships": raw.get("traction", {}).get("partnerships", []),
-        }
-
-    # Meta
-    if "meta" in raw:
-        state["meta"] = {
-            "name": raw["meta"].get("startup_name"),
-            "industry": raw["meta"].get("industry"),
-            "country": raw["meta"].get("country"),
-            "founded_year": raw["meta"].get("founded_year"),
-        }
-
-    return state
-
-
-# ========= Scoring =========
-
-def _safe_avg(values):
-    vals = [v for v in values if v is not None]
-    return sum(vals) / len(vals) if vals else None
-
-
-def _parse_arr_text(text: Optional[str]) -> Optional[float]:
-    if not text:
-        return None
-    m = re.search(r"([\d\.]+)\s*백만\s*달러", text)
-    if m:
-        return float(m.group(1))
-    m = re.search(r"([\d\.]+)\s*M", text)
-    if m:
-        return float(m.group(1))
-    return None
-
+# ========= LLM Helpers & Evaluators =========
 
-def _extract_pct_from_text(text: Optional[str]) -> Optional[float]:
-    if not text:
-        return None
-    m = re.search(r"([+\-]?\d+(\.\d+)?)\s*%", text)
-    if not m:
-        return None
-    try:
-        val = float(m.group(1))
-        if "+" in text[m.start(): m.end()] or "대비" in text:
-            return abs(val)
-        return val if val <= 30 else None
-    except Exception:
-        return None
+JSON_SYSTEM_PROMPT = "You are a strict JSON generator. Output only valid JSON."
 
 
-def score_market(market: Dict[str, Any]) -> float:
-    if not market:
-        return 60.0
-
-    tam_score = None
-    cagr_score = None
-    pf_score = None
-
-    if market.get("tam_usd_b"):
-        tam = max(1e-6, market["tam_usd_b"])
-        tam_score = clamp(((math.log10(tam) - 1) / 2) * 100, 0, 100)
-    if market.get("cagr_pct") is not None:
-        cagr_score = clamp((market["cagr_pct"] / 25.0) * 100, 0, 100)
-    if market.get("problem_fit_score_0to5") is not None:
-        pf_score = market["problem_fit_score_0to5"] * 20
-
-    quant_candidates = [v for v in [tam_score, cagr_score] if v is not None]
-    if quant_candidates:
-        quant_max = max(quant_candidates)
-        quant_avg = _safe_avg(quant_candidates) or quant_max
-        quant = 0.6 * quant_max + 0.4 * quant_avg
-    else:
-        quant = None
-
-    if pf_score is not None and quant is not None:
-        final = (quant + pf_score) / 2.0
-    elif pf_score is not None:
-        final = pf_score
-    elif quant is not None:
-        final = quant
-    else:
-        final = 60.0
-
-    return clamp(final, 0, 100)
-
-
-def score_technology(tech: Dict[str, Any]) -> float:
-    if not tech:
-        return 60.0
-
-    subs = [60]
-
-    if tech.get("perf_delta_pct") is not None:
-        subs.append(min(100, 60 + float(tech["perf_delta_pct"])))
-    if tech.get("speed_delta_pct") is not None:
-        subs.append(min(100, 60 + float(tech["speed_delta_pct"])))
-    if tech.get("csat_pct") is not None:
-        subs.append(clamp(float(tech["csat_pct"]), 0, 100))
-
-    note = tech.get("sota_performance_note", "")
-    delta = _extract_pct_from_text(note)
-    if delta is not None:
-        subs.append(min(100, 70 + delta))
-    elif isinstance(note, str) and ("초과" in note or "우수" in note):
-        subs.append(75)
-
-    checklist = [
-        tech.get(k, 0)
-        for k in [
-            "checklist_api",
-            "checklist_multi_tenancy",
-            "checklist_sdk_docs",
-            "checklist_automation",
-            "checklist_domain_extensibility",
-        ]
+def _json_messages(prompt: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": JSON_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt},
     ]
-    if any(v is not None for v in checklist):
-        checklist_score = (sum([(v or 0) for v in checklist]) / 5.0) * 100
-        subs.append(checklist_score)
-
-    ip_txt = (tech.get("ip_patent_status") or "").lower()
-    if "등록" in ip_txt or "granted" in ip_txt:
-        subs.append(85)
-    elif "출원" in ip_txt or "filed" in ip_txt:
-        subs.append(75)
-    else:
-        subs.append(55)
-
-    if tech.get("scalability_note"):
-        subs.append(75)
-
-    return clamp(sum(subs) / len(subs), 0, 100)
-
-
-def score_competition(comp: Dict[str, Any]) -> float:
-    if not comp:
-        return 60.0
-
-    diffs, moats, overlaps = [], [], []
-    for c in comp.get("competitors", []):
-        if c.get("differentiation_0to10") is not None:
-            diffs.append(c["differentiation_0to10"] * 10)
-        if c.get("moat_0to10") is not None:
-            moats.append(c["moat_0to10"] * 10)
-        if c.get("overlap_0to10") is not None:
-            overlaps.append(c["overlap_0to10"])
-
-    if diffs or moats:
-        base = 0.6 * (_safe_avg(diffs) or 60) + 0.4 * (_safe_avg(moats) or 60)
-    else:
-        base = 60.0
-
-    penalty = 0.0
-    if overlaps:
-        avg_overlap = sum(overlaps) / len(overlaps)
-        penalty = max(0.0, (avg_overlap - 5.0) * 5.0)
-
-    base_adj = clamp(base - penalty, 0, 100)
-
-    qpos = comp.get("qual_positioning_score_0to5")
-    if qpos is not None:
-        qpos_score = qpos * 20
-        return clamp((base_adj + qpos_score) / 2.0, 0, 100)
-    return base_adj
-
-
-def score_traction(biz: Dict[str, Any]) -> float:
-    if not biz:
-        return 60.0
-
-    score = 60.0
-
-    arr = biz.get("arr_usd_m")
-    if arr is None and biz.get("revenue_model"):
-        arr = _parse_arr_text(biz["revenue_model"])
-    if arr is not None:
-        arr_score = max(50.0, min(100.0, (float(arr) / 50.0) * 100.0))
-        score = arr_score
-
-    partners = biz.get("partnerships", [])
-    if partners:
-        if any(
-            "포춘" in p
-            or any(big in p for big in ["Microsoft", "AWS", "Amazon", "Google", "Meta"])
-            for p in partners
-        ):
-            score += 20
-        else:
-            score += 10
-
-    ftxt = biz.get("funding_text") or ""
-    if isinstance(ftxt, str) and ("억" in ftxt or "million" in ftxt.lower()):
-        score += 5
-
-    return clamp(score, 0, 100)
-
-
-def score_deal_terms(state: GraphState) -> float:
-    return 60.0
-
-
-def compute_scores(state: GraphState) -> GraphState:
-    scores: Dict[str, Any] = {
-        "market": score_market(state.get("market", {})),
-        "technology": score_technology(state.get("technology", {})),
-        "competition": score_competition(state.get("competition", {})),
-        "traction": score_traction(state.get("business", {})),
-        "deal": score_deal_terms(state),
-        "risk_penalty_pct": 0.0,
-    }
-    state["scores"] = scores
-    return state
 
 
-# ========= LLM Helpers & Evaluators =========
-
 def llm_call_json(prompt: str, model: str = DEFAULT_MODEL) -> Dict[str, Any]:
     """
     OpenAI chat completion with JSON response_format.
     """
-    resp = openai.chat.completions.create(
+    content = cached_completion(
+        openai.chat.completions.create,
         model=model,
-        messages=[
-            {"role": "system", "content": "You are a strict JSON generator. Output only valid JSON."},
-            {"role": "user", "content": prompt},
-        ],
+        messages=_json_messages(prompt),
         response_format={"type": "json_object"},
     )
-    return json.loads(resp.choices[0].message.content)
+    return json.loads(content)
 
 
-def eval_problem_fit(state: GraphState) -> GraphState:
+async def allm_call_json(prompt: str, model: str = DEFAULT_MODEL) -> Dict[str, Any]:
+    """
+    llm_call_json의 async 버전 (AsyncOpenAI).
+    """
+    content = await acached_completion(
+        aclient.chat.completions.create,
+        model=model,
+        messages=_json_messages(prompt),
+        response_format={"type": "json_object"},
+    )
+    return json.loads(content)
+
+
+# 각 평가기는 (프롬프트 생성, 결과 반영) 두 단계로 나뉘어 있어
+# sync / async 경로가 같은 프롬프트와 파싱 로직을 공유함.
+# 프롬프트 생성 함수가 None을 반환하면 LLM 호출 없이 state를 그대로 둠.
+
+def _problem_fit_prompt(state: GraphState) -> Optional[str]:
     text = state.get("market", {}).get("problem_fit_text")
     drivers = state.get("market", {}).get("demand_drivers", [])
     if not text:
-        return state
+        return None
 
-    prompt = f"""
+    return f"""
 Input:
 Problem Fit: {text}
 Demand Drivers: {drivers}
@@ -402,18 +125,20 @@ Return JSON:
   "rationale": "<short explanation>"
 }}
 """
-    out = llm_call_json(prompt)
+
+
+def _apply_problem_fit(state: GraphState, out: Dict[str, Any]) -> GraphState:
     score = int(out.get("problem_fit_score", 0))
     state.setdefault("market", {})["problem_fit_score_0to5"] = score
     state["market"]["problem_fit_rationale"] = [out.get("rationale", "")]
     return state
 
 
-def eval_tech_checklist(state: GraphState) -> GraphState:
+def _tech_checklist_prompt(state: GraphState) -> Optional[str]:
     note = state.get("technology", {}).get("scalability_note", "")
     summary = state.get("technology", {}).get("technology_summary", "")
 
-    prompt = f"""
+    return f"""
 Input:
 Technology Summary: {summary}
 Scalability Note: {note}
@@ -437,22 +162,24 @@ Return JSON:
   "rationale": "<short explanation>"
 }}
 """
-    out = llm_call_json(prompt)
+
+
+def _apply_tech_checklist(state: GraphState, out: Dict[str, Any]) -> GraphState:
     checklist = out.get("checklist", {})
     for key in ["api", "multi_tenancy", "sdk_docs", "automation", "domain_extensibility"]:
         state.setdefault("technology", {})[f"checklist_{key}"] = int(checklist.get(key, 0))
     return state
 
 
-def eval_competition_positioning(state: GraphState) -> GraphState:
+def _competition_positioning_prompt(state: GraphState) -> Optional[str]:
     comp = state.get("competition", {})
     comps = comp.get("competitors", [])
     if not comps:
-        return state
+        return None
 
     comp_texts = [f"{c.get('name')}: {c.get('positioning')}" for c in comps]
 
-    prompt = f"""
+    return f"""
 Target company positioning vs competitors:
 {comp_texts}
 
@@ -470,21 +197,23 @@ Return JSON:
   "notes": ["..."]
 }}
 """
-    out = llm_call_json(prompt)
+
+
+def _apply_competition_positioning(state: GraphState, out: Dict[str, Any]) -> GraphState:
     state.setdefault("competition", {})["qual_positioning_score_0to5"] = int(out.get("qual_positioning_score", 0))
     state["competition"]["qual_positioning_notes"] = out.get("notes", [])
     return state
 
 
-def eval_risks(state: GraphState) -> GraphState:
+def _risks_prompt(state: GraphState) -> Optional[str]:
     texts: List[str] = []
     texts += state.get("technology", {}).get("tech_risks_texts", [])
     texts += state.get("competition", {}).get("swot_weaknesses", [])
     texts += state.get("competition", {}).get("swot_threats", [])
     if not texts:
-        return state
+        return None
 
-    prompt = f"""
+    return f"""
 Input risk texts:
 {texts}
 
@@ -502,34 +231,110 @@ Return JSON:
   ]
 }}
 """
-    out = llm_call_json(prompt)
+
+
+def _apply_risks(state: GraphState, out: Dict[str, Any]) -> GraphState:
     risks = out.get("risks", [])
     state["risks"] = risks
     return state
 
 
-# ========= Aggregator & Decision =========
+def eval_problem_fit(state: GraphState) -> GraphState:
+    prompt = _problem_fit_prompt(state)
+    if prompt is None:
+        return state
+    return _apply_problem_fit(state, llm_call_json(prompt))
+
 
-def apply_risk_penalty(state: GraphState) -> float:
-    risks = state.get("risks", [])
-    if not risks:
-        return 0.0
+def eval_tech_checklist(state: GraphState) -> GraphState:
+    prompt = _tech_checklist_prompt(state)
+    return _apply_tech_checklist(state, llm_call_json(prompt))
 
-    agg = 0.0
-    for r in risks:
-        sev = r.get("severity_1to3", 1)
-        lik = r.get("likelihood_1to3", 1)
-        w = r.get("weight", 1.0)
-        agg += float(sev) * float(lik) * float(w)
 
-    for max_val, pct in RISK_PENALTY_BUCKETS:
-        if agg <= max_val:
-            state.setdefault("scores", {})["risk_penalty_pct"] = pct
-            return pct
-    return 0.0
+def eval_competition_positioning(state: GraphState) -> GraphState:
+    prompt = _competition_positioning_prompt(state)
+    if prompt is None:
+        return state
+    return _apply_competition_positioning(state, llm_call_json(prompt))
 
 
-def generate_investment_thesis(state: GraphState) -> str:
+def eval_risks(state: GraphState) -> GraphState:
+    prompt = _risks_prompt(state)
+    if prompt is None:
+        return state
+    return _apply_risks(state, llm_call_json(prompt))
+
+
+async def aeval_problem_fit(state: GraphState) -> GraphState:
+    prompt = _problem_fit_prompt(state)
+    if prompt is None:
+        return state
+    return _apply_problem_fit(state, await allm_call_json(prompt))
+
+
+async def aeval_tech_checklist(state: GraphState) -> GraphState:
+    prompt = _tech_checklist_prompt(state)
+    return _apply_tech_checklist(state, await allm_call_json(prompt))
+
+
+async def aeval_competition_positioning(state: GraphState) -> GraphState:
+    prompt = _competition_positioning_prompt(state)
+    if prompt is None:
+        return state
+    return _apply_competition_positioning(state, await allm_call_json(prompt))
+
+
+async def aeval_risks(state: GraphState) -> GraphState:
+    prompt = _risks_prompt(state)
+    if prompt is None:
+        return state
+    return _apply_risks(state, await allm_call_json(prompt))
+
+
+# 네 평가기는 정규화된 state의 서로 다른 부분만 읽고 쓰므로 동시에 호출할 수 있음.
+# 프롬프트는 모두 같은 입력 state에서 만들고, 결과는 아래 순서대로 반영하여 결정적으로 병합함.
+EVALUATORS = [
+    (_problem_fit_prompt, _apply_problem_fit),
+    (_tech_checklist_prompt, _apply_tech_checklist),
+    (_competition_positioning_prompt, _apply_competition_positioning),
+    (_risks_prompt, _apply_risks),
+]
+
+
+def _apply_evaluations(state: GraphState, outs: List[Optional[Dict[str, Any]]]) -> GraphState:
+    for (_, apply), out in zip(EVALUATORS, outs):
+        if out is not None:
+            state = apply(state, out)
+    return state
+
+
+def run_evaluators(state: GraphState) -> GraphState:
+    """4개 LLM 평가기를 스레드로 동시에 실행 (실패 시 EVALUATORS 순서상 첫 예외를 전파)"""
+    prompts = [build(state) for build, _ in EVALUATORS]
+    live = [p for p in prompts if p is not None]
+    if not live:
+        return state
+
+    with ThreadPoolExecutor(max_workers=len(live)) as executor:
+        futures = [executor.submit(propagate(llm_call_json), p) if p is not None else None for p in prompts]
+        outs = [f.result() if f is not None else None for f in futures]
+    return _apply_evaluations(state, outs)
+
+
+async def arun_evaluators(state: GraphState) -> GraphState:
+    """run_evaluators의 async 버전 (asyncio.gather)"""
+    prompts = [build(state) for build, _ in EVALUATORS]
+
+    async def call(prompt: Optional[str]) -> Optional[Dict[str, Any]]:
+        return None if prompt is None else await allm_call_json(prompt)
+
+    outs = await asyncio.gather(*(call(p) for p in prompts))
+    return _apply_evaluations(state, list(outs))
+
+
+# ========= Aggregator & Decision =========
+
+def _thesis_messages(state: GraphState) -> List[Dict[str, str]]:
     comp_scores = state["decision"]["component_scores"]
     risks = state["decision"]["risks"]
 
@@ -549,15 +354,31 @@ def generate_investment_thesis(state: GraphState) -> str:
 4. 마지막에 투자 권고/조건부 권고/재검토 필요 중 하나로 결론
 5. 한국어, 투자위원회 보고서 스타일
 """
-    response = client.chat.completions.create(
+    return [{"role": "user", "content": prompt}]
+
+
+def generate_investment_thesis(state: GraphState) -> str:
+    content = cached_completion(
+        client.chat.completions.create,
         model=DEFAULT_MODEL,
-        messages=[{"role": "user", "content": prompt}],
+        messages=_thesis_messages(state),
         max_tokens=400,
     )
-    return response.choices[0].message.content.strip()
+    return content.strip()
 
 
-def aggregate_scores(state: Dict[str, Any]) -> Dict[str, Any]:
+async def agenerate_investment_thesis(state: GraphState) -> str:
+    content = await acached_completion(
+        aclient.chat.completions.create,
+        model=DEFAULT_MODEL,
+        messages=_thesis_messages(state),
+        max_tokens=400,
+    )
+    return content.strip()
+
+
+def _build_decision(state: Dict[str, Any]) -> Dict[str, Any]:
+    """점수 가중합 + 리스크 페널티로 state["decision"] 생성 (투자 의견서 제외)"""
     comp_scores: Dict[str, Dict[str, Any]] = {
         "market": {"score": state["scores"]["market"], "rationale": "TAM·CAGR·problem-fit 기준 고성장 시장 평가"},
         "technology": {"score": state["scores"]["technology"], "rationale": "SOTA/성능·확장성·IP·체크리스트 반영"},
@@ -571,15 +392,7 @@ def aggregate_scores(state: Dict[str, Any]) -> Dict[str, Any]:
     penalty_pct = apply_risk_penalty(state)
     adjusted = total * (1 - penalty_pct / 100.0)
 
-    if adjusted >= 50:
-        status = "invest"
-        final_note = "투자 권고"
-    elif adjusted >= 30:
-        status = "invest"
-        final_note = "조건부 투자 권고"
-    else:
-        status = "fail"
-        final_note = "재검토 필요"
+    status, final_note = decide_status(adjusted)
 
     risks_texts = [r.get("text", "") for r in state.get("risks", [])]
 
@@ -592,33 +405,127 @@ def aggregate_scores(state: Dict[str, Any]) -> Dict[str, Any]:
         "investment_thesis": "LLM_PENDING",
         "final_note": final_note,
     }
+    return state
+
 
+def aggregate_scores(state: Dict[str, Any]) -> Dict[str, Any]:
+    state = _build_decision(state)
     thesis = generate_investment_thesis(state)
     state["decision"]["investment_thesis"] = thesis
     return state
 
 
+async def aaggregate_scores(state: Dict[str, Any]) -> Dict[str, Any]:
+    state = _build_decision(state)
+    thesis = await agenerate_investment_thesis(state)
+    state["decision"]["investment_thesis"] = thesis
+    return state
+
+
 # ========= Public Entrypoint =========
 
-def run_pipeline(raw_input: Dict[str, Any]) -> Dict[str, Any]:
+def _decision_or_raise(state: Dict[str, Any]) -> Dict[str, Any]:
+    decision = state.get("decision")
+    if not isinstance(decision, dict):
+        raise KeyError("`state['decision']` was not produced or is not a dict.")
+    return decision
+
+
+def _record(
+    record_as: Optional[str], inputs: Dict[str, Any], state: Dict[str, Any], raw_input: Dict[str, Any]
+) -> None:
+    # 재채점(rescore)용 기록. 기록 실패가 투자 판단을 막지 않도록 경고만 출력.
+    if record_as is None:
+        return
+    try:
+        append_evaluation(record_as, inputs, state, WEIGHTS, texts=amount_texts(raw_input))
+    except OSError as e:
+        logger.warning(f"⚠️ 평가 기록 실패: {e}")
+
+
+def run_pipeline(raw_input: Dict[str, Any], record_as: Optional[str] = None) -> Dict[str, Any]:
     """
     Execute the full pipeline and return ONLY the decision dict.
+    If `record_as` is given, the evaluation is appended to the archive under that company name.
     """
     state = normalize_input(raw_input)
     state = compute_scores(state)
-    state = eval_problem_fit(state)
-    state = eval_tech_checklist(state)
-    state = eval_competition_positioning(state)
-    state = eval_risks(state)
+    inputs = json.loads(json.dumps(state, default=str))  # 평가기가 state를 수정하기 전 스냅샷
+    state = run_evaluators(state)
     state = aggregate_scores(state)
+    decision = _decision_or_raise(state)
+    _record(record_as, inputs, state, raw_input)
+    return decision
 
-    decision = state.get("decision")
-    if not isinstance(decision, dict):
-        raise KeyError("`state['decision']` was not produced or is not a dict.")
+
+async def arun_pipeline(raw_input: Dict[str, Any], record_as: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Async variant of `run_pipeline` (AsyncOpenAI).
+    """
+    state = normalize_input(raw_input)
+    state = compute_scores(state)
+    inputs = json.loads(json.dumps(state, default=str))
+    state = await arun_evaluators(state)
+    state = await aaggregate_scores(state)
+    decision = _decision_or_raise(state)
+    _record(record_as, inputs, state, raw_input)
     return decision
 
 
-__all__ = ["run_pipeline"]
+__all__ = ["run_pipeline", "arun_pipeline"]
+
+
+def _raw_input_from_state(state: GraphState) -> Dict[str, Any]:
+    # GraphState → 네 원본 입력 형식으로 변환
+    return {
+        "meta": state.get("tech", {}).get("meta", {}),
+        "technology": state.get("tech", {}).get("technology", {}),
+        "market": state.get("market_eval", {}).get("market", {}),
+        "traction": state.get("market_eval", {}).get("traction", {}),
+        "business": state.get("market_eval", {}).get("business", {}),
+        "competition": state.get("competitor", {}),
+    }
+
+
+def _unify_decision(decision_output: Dict[str, Any]) -> Dict[str, Any]:
+    logger.info(f"✓ 총점: {decision_output.get('total_score', 0):.1f}")
+    logger.info(f"✓ 판단: {decision_output.get('status', 'unknown')}")
+    
+    # status를 workflow 호환 label로 변환
+    label = decision_label(decision_output.get("status", "fail"), decision_output.get("total_score", 0))
+    
+    # decision 형식 통일
+    return {
+        "label": label,
+        "total_100": int(decision_output.get("total_score", 0)),
+        "component_scores": decision_output.get("component_scores", {}),
+        "risks": decision_output.get("risks", []),
+        "red_flags": decision_output.get("red_flags", []),
+        "investment_thesis": decision_output.get("investment_thesis", ""),
+        "final_note": decision_output.get("final_note", ""),
+    }
+
+
+def _failed_decision(e: Exception) -> Dict[str, Any]:
+    logger.error(f"❌ 투자 판단 실패: {e}")
+    # fallback
+    return {
+        "label": "reject",
+        "total_100": 0,
+        "component_scores": {},
+        "risks": [str(e)],
+        "red_flags": [],
+        "investment_thesis": "분석 실패",
+        "final_note": "재검토 필요",
+    }
+
+
+def _decision_update(state: GraphState, current_company: str, unified_decision: Dict[str, Any]) -> GraphState:
+    # 회사별 결과 스냅샷 (병렬 모드 fan-in 및 배치 결과용, 출처는 sources 원장에 이미 회사별로 있음)
+    return {
+        "decision": unified_decision,
+        "decisions": {current_company: unified_decision},
+    }
 
 
 def investment_decision(state: GraphState) -> GraphState:
@@ -656,63 +563,29 @@ def investment_decision(state: GraphState) -> GraphState:
     - 출처는 각 분석 에이전트(Tech, Market, Competitor)가 수집한 것을 참조
     """
     current_company = state.get("current_company", "")
-    print(f"[투자 판단] 시작: {current_company}")
-    
-    # GraphState → 네 원본 입력 형식으로 변환
-    raw_input = {
-        "meta": state.get("tech", {}).get("meta", {}),
-        "technology": state.get("tech", {}).get("technology", {}),
-        "market": state.get("market_eval", {}).get("market", {}),
-        "traction": state.get("market_eval", {}).get("traction", {}),
-        "business": state.get("market_eval", {}).get("business", {}),
-        "competition": state.get("competitor", {}),
-    }
+    logger.info(f"[투자 판단] 시작: {current_company}")
     
     try:
         # 네 원본 파이프라인 실행
-        decision_output = run_pipeline(raw_input)
-        
-        print(f"  ✓ 총점: {decision_output.get('total_score', 0):.1f}")
-        print(f"  ✓ 판단: {decision_output.get('status', 'unknown')}")
-        
-        # status를 workflow 호환 label로 변환
-        status = decision_output.get("status", "fail")
-        if status == "invest":
-            if decision_output.get("total_score", 0) >= 50:
-                label = "recommend"
-            else:
-                label = "invest_conditional"
-        else:
-            label = "reject"
-        
-        # decision 형식 통일
-        unified_decision = {
-            "label": label,
-            "total_100": int(decision_output.get("total_score", 0)),
-            "component_scores": decision_output.get("component_scores", {}),
-            "risks": decision_output.get("risks", []),
-            "red_flags": decision_output.get("red_flags", []),
-            "investment_thesis": decision_output.get("investment_thesis", ""),
-            "final_note": decision_output.get("final_note", ""),
-        }
-        
-        return {
-            **state,
-            "decision": unified_decision
-        }
-        
+        decision_output = run_pipeline(_raw_input_from_state(state), record_as=current_company)
+        unified_decision = _unify_decision(decision_output)
     except Exception as e:
-        print(f"  ❌ 투자 판단 실패: {e}")
-        # fallback
-        return {
-            **state,
-            "decision": {
-                "label": "reject",
-                "total_100": 0,
-                "component_scores": {},
-                "risks": [str(e)],
-                "red_flags": [],
-                "investment_thesis": "분석 실패",
-                "final_note": "재검토 필요",
-            }
-        }
\ No newline at end of file
+        unified_decision = _failed_decision(e)
+
+    return _decision_update(state, current_company, unified_decision)
+
+
+async def ainvestment_decision(state: GraphState) -> GraphState:
+    """
+    투자 판단 노드 (async). investment_decision과 같은 입력/출력.
+    """
+    current_company = state.get("current_company", "")
+    logger.info(f"[투자 판단] 시작: {current_company}")
+
+    try:
+        decision_output = await arun_pipeline(_raw_input_from_state(state), record_as=current_company)
+        unified_decision = _unify_decision(decision_output)
+    except Exception as e:
+        unified_decision = _failed_decision(e)
+
+    return _decision_update(state, current_company, unified_decision)
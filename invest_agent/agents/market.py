@@ -1,30 +1,17 @@
 # agents/market.py
-from typing import Dict, Any, List, Tuple  # Tuple 추가
+from typing import Dict, Any, List, Tuple, Optional  # Tuple 추가
+import asyncio
 import json
-from pathlib import Path
+import logging
 
 from langchain_openai import ChatOpenAI
 # from langchain_community.retrievers import EnsembleRetriever
-from langchain_community.vectorstores import FAISS
-from langchain_core.embeddings import Embeddings
-from sentence_transformers import SentenceTransformer
 
-from invest_agent.states import GraphState
+from invest_agent.states import GraphState, source_entry
+from invest_agent.infra.vectorstores import get_index
+from invest_agent.infra.search_cache import tavily_search, atavily_search
 
-
-class BgeEmbeddings(Embeddings):
-    """BGE 임베딩 래퍼"""
-    def __init__(self, model_name: str, device: str = "cpu", normalize: bool = True):
-        self._model = SentenceTransformer(model_name, device=device)
-        self._normalize = normalize
-
-    def embed_documents(self, texts: list[str]) -> list[list[float]]:
-        embeddings = self._model.encode(texts, normalize_embeddings=self._normalize)
-        return embeddings.tolist()
-
-    def embed_query(self, text: str) -> list[float]:
-        embedding = self._model.encode(text, normalize_embeddings=self._normalize)
-        return embedding.tolist()
+logger = logging.getLogger(__name__)
 
 
 MARKET_JSON_SCHEMA = (
@@ -86,139 +73,113 @@ def _web_search(query: str, max_results: int = 3) -> Tuple[List[str], List[str]]
         (contents, urls) 튜플
     """
     try:
-        from langchain_community.tools.tavily_search import TavilySearchResults
-        search = TavilySearchResults(max_results=max_results)
-        results = search.invoke({"query": query})
-        
-        contents = []
-        urls = []
-        for r in results:
-            if r.get("content"):
-                contents.append(r["content"])
-            if r.get("url"):
-                urls.append(r["url"])
-        
-        return contents, urls
+        results = tavily_search(query, max_results=max_results)
+        return _split_results(results)
     except Exception:
         return [], []
 
 
-def market_eval(state: GraphState) -> GraphState:
-    """
-    시장 분석 노드
-    
-    입력:
-        - current_company: 현재 분석 중인 회사명
-        - discovery: 기업 탐색 결과 (industry 포함)
-    
-    출력:
-        - market_eval: {market, traction, business}
-        - sources["market"]: 참고한 출처 URL/파일 리스트
-    """
+async def _aweb_search(query: str, max_results: int = 3) -> Tuple[List[str], List[str]]:
+    """_web_search의 async 버전"""
+    try:
+        results = await atavily_search(query, max_results=max_results)
+        return _split_results(results)
+    except Exception:
+        return [], []
+
+
+def _split_results(results: List[dict]) -> Tuple[List[str], List[str]]:
+    contents = []
+    urls = []
+    for r in results:
+        if r.get("content"):
+            contents.append(r["content"])
+        if r.get("url"):
+            urls.append(r["url"])
+    return contents, urls
+
+
+def _find_target_item(state: GraphState) -> dict:
+    """현재 회사 데이터 찾기 (없으면 첫 번째 항목)"""
     current_company = state.get("current_company", "")
     discovery_items = state.get("discovery", {}).get("items", [])
-    
-    # 현재 회사 데이터 찾기
-    target_item = None
+
     for item in discovery_items:
         if item.get("startup_name") == current_company:
-            target_item = item
-            break
-    
-    if not target_item:
-        target_item = discovery_items[0] if discovery_items else {}
-    
-    industry = target_item.get("industry", "General")
-    print(f"[시장 분석] 시작: {current_company} (산업: {industry})")
-    
-    market_sources = []  # 출처 수집용
-    context_parts = []
+            return item
 
-    # 1. FAISS에서 산업별 시장 데이터 검색
+    return discovery_items[0] if discovery_items else {}
+
+
+def _search_market_index(industry: str, current_company: str) -> Tuple[Optional[str], List[str]]:
+    """
+    FAISS에서 산업별 시장 데이터 검색
+
+    Returns:
+        (context_part, sources) 튜플. 관련 데이터가 없으면 context_part는 None
+    """
+    market_sources = []
     try:
-        index_dir = Path("faiss_market_index")
+        vectorstore = get_index("faiss_market_index")
+        
+        if vectorstore is None:
+            logger.warning("⚠️ FAISS DB 없음. scripts/build_market_vectordb.py를 먼저 실행하세요.")
+            return None, market_sources
+
+        # 산업별 시장 데이터 검색 쿼리
+        search_queries = [
+            f"{industry} AI market size TAM SAM",
+            f"{industry} generative AI CAGR growth",
+            f"{industry} AI adoption trends",
+            f"{current_company} market analysis"
+        ]
+        
+        all_docs = []
+        for query in search_queries:
+            docs = vectorstore.similarity_search(query, k=3)
+            all_docs.extend(docs)
+        
+        # 중복 제거 및 산업 필터링
+        seen_content = set()
+        filtered_docs = []
+        
+        for doc in all_docs:
+            content_hash = hash(doc.page_content[:100])
+            if content_hash not in seen_content:
+                # 해당 산업과 관련된 문서만 선택
+                doc_industries = doc.metadata.get("industries", [])
+                if industry in doc_industries or "General" in doc_industries:
+                    seen_content.add(content_hash)
+                    filtered_docs.append(doc)
         
-        if not index_dir.exists():
-            print(f"  ⚠️ FAISS DB 없음. scripts/build_market_vectordb.py를 먼저 실행하세요.")
-        else:
-            embeddings = BgeEmbeddings(
-                model_name="BAAI/bge-base-en-v1.5",
-                device="cpu",
-                normalize=True
-            )
-            
-            vectorstore = FAISS.load_local(
-                str(index_dir),
-                embeddings,
-                allow_dangerous_deserialization=True
-            )
-            
-            # 산업별 시장 데이터 검색 쿼리
-            search_queries = [
-                f"{industry} AI market size TAM SAM",
-                f"{industry} generative AI CAGR growth",
-                f"{industry} AI adoption trends",
-                f"{current_company} market analysis"
-            ]
-            
-            all_docs = []
-            for query in search_queries:
-                docs = vectorstore.similarity_search(query, k=3)
-                all_docs.extend(docs)
-            
-            # 중복 제거 및 산업 필터링
-            seen_content = set()
-            filtered_docs = []
-            
-            for doc in all_docs:
-                content_hash = hash(doc.page_content[:100])
-                if content_hash not in seen_content:
-                    # 해당 산업과 관련된 문서만 선택
-                    doc_industries = doc.metadata.get("industries", [])
-                    if industry in doc_industries or "General" in doc_industries:
-                        seen_content.add(content_hash)
-                        filtered_docs.append(doc)
-            
-            if filtered_docs:
-                # 상위 5개만 사용
-                top_docs = filtered_docs[:5]
-                
-                vector_context = "\n\n".join([
-                    f"[{doc.metadata.get('source', 'N/A')} - Page {doc.metadata.get('page', 'N/A')}]\n"
-                    f"{doc.page_content[:600]}"
-                    for doc in top_docs
-                ])
-                
-                context_parts.append(f"[시장 리서치 보고서 - {industry} 산업]\n{vector_context}")
-                
-                # 출처 수집
-                for doc in top_docs:
-                    source = doc.metadata.get("source_file", "시장 리서치 보고서")
-                    if source not in market_sources:
-                        market_sources.append(source)
-                
-                print(f"  ✓ FAISS 검색: {len(top_docs)}개 관련 섹션 발견")
-            else:
-                print(f"  ⚠️ {industry} 산업 관련 데이터 없음")
+        if not filtered_docs:
+            logger.warning(f"⚠️ {industry} 산업 관련 데이터 없음")
+            return None, market_sources
+
+        # 상위 5개만 사용
+        top_docs = filtered_docs[:5]
+        
+        vector_context = "\n\n".join([
+            f"[{doc.metadata.get('source', 'N/A')} - Page {doc.metadata.get('page', 'N/A')}]\n"
+            f"{doc.page_content[:600]}"
+            for doc in top_docs
+        ])
+        
+        # 출처 수집
+        for doc in top_docs:
+            source = doc.metadata.get("source_file", "시장 리서치 보고서")
+            if source not in market_sources:
+                market_sources.append(source)
+        
+        logger.info(f"✓ FAISS 검색: {len(top_docs)}개 관련 섹션 발견")
+        return f"[시장 리서치 보고서 - {industry} 산업]\n{vector_context}", market_sources
     
     except Exception as e:
-        print(f"  ⚠️ FAISS 검색 실패: {e}")
-    
-    # 2. 웹 검색 (추가 최신 정보)
-    queries = _build_search_queries([target_item])
-    for query in queries[:3]:  # 3개로 줄임 (PDF가 메인 출처)
-        snippets, urls = _web_search(query, max_results=2)  # 2개로 줄임
-        if snippets:
-            web_context = f"[웹 검색: {query}]\n" + "\n".join(snippets)
-            context_parts.append(web_context)
-            market_sources.extend(urls)
-    
-    print(f"  ✓ 웹 검색 완료")
-    print(f"  ✓ 총 출처: {len(market_sources)}개")
-    
-    # 3. LLM 분석
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.0)
-    
+        logger.warning(f"⚠️ FAISS 검색 실패: {e}")
+        return None, market_sources
+
+
+def _market_messages(target_item: dict, industry: str, context_parts: List[str]) -> List[Dict[str, str]]:
     system_prompt = (
         f"You are a venture capital associate evaluating a {industry} startup's market potential. "  # industry 추가
         "Prioritize evidence from the market research report context. "  # 우선순위 명시
@@ -242,14 +203,16 @@ def market_eval(state: GraphState) -> GraphState:
         f"Context:\n{context_text}"
     )
     
-    response = llm.invoke([
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_prompt}
-    ])
-    
-    # JSON 파싱
+    ]
+
+
+def _parse_market_json(content: str, target_item: dict) -> Dict[str, Any]:
+    """LLM 응답 JSON 파싱 (실패 시 기본값)"""
     try:
-        content = response.content.strip()
+        content = content.strip()
         if content.startswith("```"):
             content = content.split("```")[1]
             if content.startswith("json"):
@@ -257,11 +220,12 @@ def market_eval(state: GraphState) -> GraphState:
         content = content.strip()
         
         market_data = json.loads(content)
-        print(f"  ✓ 시장 분석 완료")
+        logger.info("✓ 시장 분석 완료")
+        return market_data
         
     except json.JSONDecodeError as e:
-        print(f"  ⚠ JSON 파싱 실패: {e}")
-        market_data = {
+        logger.warning(f"⚠ JSON 파싱 실패: {e}")
+        return {
             "market": {
                 "market_size": "unknown",
                 "cagr": "unknown",
@@ -280,12 +244,104 @@ def market_eval(state: GraphState) -> GraphState:
                 "monetization_stage": "초기"
             }
         }
-    
-    # State 업데이트
-    state_sources = state.get("sources", {})
-    state_sources["market"] = list(set(market_sources))  # 중복 제거
-    
+
+
+def _market_update(state: GraphState, market_data: Dict[str, Any], market_sources: List[str]) -> GraphState:
     return {
         "market_eval": market_data,
-        "sources": state_sources
-    }
\ No newline at end of file
+        "sources": source_entry(state.get("current_company", ""), "market", market_sources)
+    }
+
+
+def market_eval(state: GraphState) -> GraphState:
+    """
+    시장 분석 노드
+    
+    입력:
+        - current_company: 현재 분석 중인 회사명
+        - discovery: 기업 탐색 결과 (industry 포함)
+    
+    출력:
+        - market_eval: {market, traction, business}
+        - sources[current_company]["market"]: 참고한 출처 URL/파일
+    """
+    current_company = state.get("current_company", "")
+    target_item = _find_target_item(state)
+    
+    industry = target_item.get("industry", "General")
+    logger.info(f"[시장 분석] 시작: {current_company} (산업: {industry})")
+    
+    market_sources = []  # 출처 수집용
+    context_parts = []
+
+    # 1. FAISS에서 산업별 시장 데이터 검색
+    vector_part, vector_sources = _search_market_index(industry, current_company)
+    if vector_part:
+        context_parts.append(vector_part)
+    market_sources.extend(vector_sources)
+    
+    # 2. 웹 검색 (추가 최신 정보)
+    queries = _build_search_queries([target_item])
+    for query in queries[:3]:  # 3개로 줄임 (PDF가 메인 출처)
+        snippets, urls = _web_search(query, max_results=2)  # 2개로 줄임
+        if snippets:
+            web_context = f"[웹 검색: {query}]\n" + "\n".join(snippets)
+            context_parts.append(web_context)
+            market_sources.extend(urls)
+    
+    logger.info("✓ 웹 검색 완료")
+    logger.info(f"✓ 총 출처: {len(market_sources)}개")
+    
+    # 3. LLM 분석
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.0)
+    response = llm.invoke(_market_messages(target_item, industry, context_parts))
+    
+    # JSON 파싱
+    market_data = _parse_market_json(response.content, target_item)
+    
+    return _market_update(state, market_data, market_sources)
+
+
+async def amarket_eval(state: GraphState) -> GraphState:
+    """
+    시장 분석 노드 (async)
+
+    market_eval과 같은 입력/출력. FAISS 검색은 워커 스레드에서 실행하고,
+    웹 검색 쿼리는 동시에 보낸 뒤 원래 순서대로 컨텍스트에 합침.
+    """
+    current_company = state.get("current_company", "")
+    target_item = _find_target_item(state)
+
+    industry = target_item.get("industry", "General")
+    logger.info(f"[시장 분석] 시작: {current_company} (산업: {industry})")
+
+    market_sources = []
+    context_parts = []
+
+    # 1. FAISS 검색 (CPU 작업)과 웹 검색을 함께 진행
+    queries = _build_search_queries([target_item])[:3]
+    vector_task = asyncio.to_thread(_search_market_index, industry, current_company)
+    web_tasks = [_aweb_search(query, max_results=2) for query in queries]
+    (vector_part, vector_sources), *web_results = await asyncio.gather(vector_task, *web_tasks)
+
+    if vector_part:
+        context_parts.append(vector_part)
+    market_sources.extend(vector_sources)
+
+    # 2. 웹 검색 결과 병합 (쿼리 순서 유지)
+    for query, (snippets, urls) in zip(queries, web_results):
+        if snippets:
+            web_context = f"[웹 검색: {query}]\n" + "\n".join(snippets)
+            context_parts.append(web_context)
+            market_sources.extend(urls)
+
+    logger.info("✓ 웹 검색 완료")
+    logger.info(f"✓ 총 출처: {len(market_sources)}개")
+
+    # 3. LLM 분석
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.0)
+    response = await llm.ainvoke(_market_messages(target_item, industry, context_parts))
+
+    market_data = _parse_market_json(response.content, target_item)
+
+    return _market_update(state, market_data, market_sources)
@@ -1,5 +1,12 @@
 from .node import report_writer
 from .config import ReportConfig
-from .llm import local_llm_call, default_llm_refiner
 
 __all__ = ["report_writer", "ReportConfig", "local_llm_call", "default_llm_refiner"]
+
+
+def __getattr__(name):
+    # 로컬 LLM(transformers/torch)은 실제로 쓸 때만 import
+    if name in ("local_llm_call", "default_llm_refiner"):
+        from . import llm
+        return getattr(llm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
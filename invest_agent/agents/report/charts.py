@@ -1,51 +1,138 @@
 # invest_agent/agents/report/charts.py
-import io
+"""
+보고서 차트
+
+기본은 svg_charts.py의 SVG 차트(matplotlib 불필요)이고, 이 모듈의 matplotlib PNG 차트는
+chart_backend="matplotlib"이거나 SVG 생성이 실패했을 때 쓰는 대체 경로임.
+
+matplotlib은 처음 차트를 그릴 때만 import함 → 보고서 단계까지 가지 않는 실행은 비용을 내지 않음.
+한글 폰트 탐색 결과는 디스크에 저장해 다음 실행부터는 폰트 목록을 다시 훑지 않음.
+PNG 차트도 현재 프로세스에서 Agg 백엔드로 그림 (pyplot 전역 상태 때문에 잠금으로 직렬화).
+spawn 프로세스 풀은 워커마다 __main__ 스크립트(app.py → workflow, langchain, FAISS)를 다시
+import해 차트 몇 장보다 시작 비용이 컸고, 호출 측이 바로 결과를 기다려 겹치는 작업도 거의 없었음.
+
+환경 변수:
+    INVEST_AGENT_FONT_CACHE     폰트 선택 캐시 파일 (기본 .cache/chart_font.json)
+"""
 import base64
-import matplotlib.pyplot as plt
-from matplotlib import font_manager, rcParams
-
-# ✅ 모듈 로드 시 한 번만 한글 폰트 세팅
-def _set_korean_font():
-    # 우선순위: Windows(맑은고딕) → 배포용(Nanum) → Apple → Noto
-    candidates = [
-        "Malgun Gothic",          # Windows 기본
-        "NanumGothic", "Nanum Gothic",
-        "Apple SD Gothic Neo",    # macOS 기본
-        "Noto Sans CJK KR", "Noto Sans KR",
-    ]
-
-    # 시스템에 설치된 폰트 이름 수집
-    installed = {f.name for f in font_manager.fontManager.ttflist}
+import io
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from .svg_charts import svg_charts
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FONT_CACHE_PATH = ".cache/chart_font.json"
+
+# 우선순위: Windows(맑은고딕) → 배포용(Nanum) → Apple → Noto
+FONT_CANDIDATES = [
+    "Malgun Gothic",          # Windows 기본
+    "NanumGothic", "Nanum Gothic",
+    "Apple SD Gothic Neo",    # macOS 기본
+    "Noto Sans CJK KR", "Noto Sans KR",
+]
+FONT_PATHS = [
+    r"C:\Windows\Fonts\malgun.ttf",  # Windows
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",  # macOS
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",  # Ubuntu (nanum)
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",  # Noto
+]
+
+_plt = None
+_mpl_lock = threading.Lock()
+
+
+def _font_cache_path() -> Optional[str]:
+    path = os.getenv("INVEST_AGENT_FONT_CACHE", DEFAULT_FONT_CACHE_PATH)
+    if path.lower() in {"", "0", "off", "false", "none"}:
+        return None
+    return path
+
+
+def _load_font_choice() -> Optional[dict]:
+    path = _font_cache_path()
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            choice = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    # 폰트 파일이 지워졌으면 다시 탐색
+    if choice.get("path") and not os.path.exists(choice["path"]):
+        return None
+    return choice
 
+
+def _save_font_choice(choice: dict) -> None:
+    path = _font_cache_path()
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(choice, f, ensure_ascii=False)
+    except OSError as e:
+        logger.warning(f"폰트 캐시 저장 실패: {e}")
+
+
+def _discover_korean_font(font_manager) -> dict:
+    """설치된 폰트에서 한글 폰트 선택 ({"family": 이름, "path": 직접 등록한 파일 또는 None})"""
     # 1) 이름으로 매칭
-    for name in candidates:
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    for name in FONT_CANDIDATES:
         if name in installed:
-            rcParams["font.family"] = name
-            break
-    else:
-        # 2) 경로로 직접 등록 (필요 시)
-        font_paths = [
-            r"C:\Windows\Fonts\malgun.ttf",  # Windows
-            "/System/Library/Fonts/AppleSDGothicNeo.ttc",  # macOS
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",  # Ubuntu (nanum)
-            "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",  # Noto
-        ]
-        for p in font_paths:
+            return {"family": name, "path": None}
+
+    # 2) 경로로 직접 등록 (필요 시)
+    for p in FONT_PATHS:
+        if os.path.exists(p):
             try:
                 font_manager.fontManager.addfont(p)
-                rcParams["font.family"] = font_manager.FontProperties(fname=p).get_name()
-                break
+                return {"family": font_manager.FontProperties(fname=p).get_name(), "path": p}
             except Exception:
                 pass
+    return {"family": None, "path": None}
+
 
+def _set_korean_font(font_manager, rcParams) -> None:
+    choice = _load_font_choice()
+    if choice is None:
+        choice = _discover_korean_font(font_manager)
+        _save_font_choice(choice)
+    elif choice.get("path"):
+        font_manager.fontManager.addfont(choice["path"])
+
+    if choice.get("family"):
+        rcParams["font.family"] = choice["family"]
     # 마이너스 기호가 □로 나오지 않도록
     rcParams["axes.unicode_minus"] = False
 
-_set_korean_font()  # ← 호출!
+
+def _pyplot():
+    """matplotlib을 Agg 백엔드로 처음 한 번만 준비"""
+    global _plt
+    if _plt is None:
+        with _mpl_lock:
+            if _plt is None:
+                import matplotlib
+                matplotlib.use("Agg")
+                import matplotlib.pyplot as plt
+                from matplotlib import font_manager, rcParams
+
+                _set_korean_font(font_manager, rcParams)
+                _plt = plt
+    return _plt
+
 
 # ─────────────────────────────────────────────────────────────
-# 이하 기존 함수들
+# 차트 함수
 def _img_bar_scores(scores: dict) -> str:
+    plt = _pyplot()
     labels = list(scores.keys())
     values = [scores[k] for k in labels if k != "total_100"]
 
@@ -61,3 +148,30 @@ def _img_bar_scores(scores: dict) -> str:
 def _img_kpi_table(kpis: dict) -> str:
     # … 기존 구현 그대로 …
     ...
+
+
+def render_charts(scores: dict, kpis: dict) -> Dict[str, Any]:
+    """matplotlib PNG 차트 → 템플릿 변수 {"scores_img", "kpi_table_img"} (실패하면 빈 값)"""
+    try:
+        _pyplot()  # 첫 호출은 _mpl_lock을 잡으므로(재진입 불가) 잠금 전에 준비
+        # pyplot은 figure 목록을 전역으로 관리하므로 여러 회사 보고서가 동시에 그리지 않게 함
+        with _mpl_lock:
+            return {"scores_img": _img_bar_scores(scores), "kpi_table_img": _img_kpi_table(kpis)}
+    except Exception as e:
+        logger.warning(f"차트 생성 중 오류 발생: {e}")
+        return {}
+
+
+def build_charts(scores: dict, kpis: dict, backend: str = "svg") -> Dict[str, Any]:
+    """
+    차트 템플릿 변수 생성
+
+    svg: 문자열로 생성 (실패하면 matplotlib으로 대체)
+    matplotlib: PNG 생성 (실패하면 빈 dict → 템플릿 기본 표시)
+    """
+    if backend != "matplotlib":
+        try:
+            return svg_charts(scores, kpis)
+        except Exception as e:
+            logger.warning(f"SVG 차트 생성 실패, matplotlib으로 대체: {e}")
+    return render_charts(scores, kpis)
@@ -10,3 +10,5 @@ class ReportConfig:
     renderer: str = "playwright"   # "pdfkit" | "playwright" | "none"
     wkhtmltopdf_path: Optional[str] = None
     out_dir: str = "."
+    chart_backend: str = "svg"     # "svg" | "matplotlib"
+    stream_html: bool = False      # True면 HTML을 산출물 저장소에 바로 스트리밍하고 PDF도 파일에서 렌더링
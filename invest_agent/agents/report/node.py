@@ -1,10 +1,17 @@
 # agents/report/node.py
 
 from typing import Dict, Any, List
+import logging
+import os
 import re
+import time
+from invest_agent.infra.artifacts import get_artifact_store
+from invest_agent.states import company_sources
 from .config import ReportConfig
-from .render import render_html, html_to_pdf
-from .llm import default_llm_refiner
+from .render import render_html, stream_html, html_to_pdf
+from .charts import build_charts
+
+logger = logging.getLogger(__name__)
 
 def _safe_filename(name: str) -> str:
     return re.sub(r'[^가-힣a-zA-Z0-9._()-]+', '_', name).strip('_')
@@ -79,7 +86,7 @@ CAGR: {market_meta.get('cagr', '-')}
         lines = [line.strip() for line in response.split('\n') if line.strip().startswith('-')]
         return [line.lstrip('- ').strip() for line in lines][:4]
     except Exception as e:
-        print(f"  ⚠️ LLM Summary 생성 실패: {e}")
+        logger.warning(f"⚠️ LLM Summary 생성 실패: {e}")
         return []
 
 
@@ -162,14 +169,14 @@ def report_writer(state: Dict[str, Any]) -> Dict[str, Any]:
       - market_eval: 시장 분석 결과
       - competitor: 경쟁사 분석 결과
       - decision: 투자 판단 결과
-      - sources: 각 에이전트가 수집한 출처
+      - sources: 출처 원장 {회사: {에이전트: (url, ...)}}
     """
 
     # 0) 의사결정 정규화
     decision_raw = state.get("decision", {}) or {}
     norm = _normalize_decision(decision_raw)
     label = norm["label"]
-    print(f"[REPORT] 투자 판단 '{label}' - 보고서 생성 시작")
+    logger.info(f"[REPORT] 투자 판단 '{label}' - 보고서 생성 시작")
 
     # 1) 회사명
     discovery_items = _get(state, ["discovery", "items"], [])
@@ -196,6 +203,24 @@ def report_writer(state: Dict[str, Any]) -> Dict[str, Any]:
         "runway_months": "-"
     }
 
+    # 보고서 설정
+    cfg_data = state.get("report_config") or {}
+    if isinstance(cfg_data, ReportConfig):
+        cfg = cfg_data
+    else:
+        cfg = ReportConfig(
+            version=cfg_data.get("version", "v1.0"),
+            author=cfg_data.get("author", "투자팀"),
+            renderer=cfg_data.get("renderer", "playwright"),
+            out_dir=cfg_data.get("out_dir", "./outputs"),
+            wkhtmltopdf_path=cfg_data.get("wkhtmltopdf_path"),
+            stream_html=bool(cfg_data.get("stream_html", False)),
+            chart_backend=cfg_data.get("chart_backend", "svg"),
+        )
+
+    # 차트 템플릿 변수 (SVG 기본, chart_backend="matplotlib"이면 PNG)
+    charts = build_charts(norm["scores_dict"], kpis, backend=cfg.chart_backend)
+
     # 3) 기술 정보
     tech = state.get("tech", {}) or {}
     tech_blk = tech.get("technology", {}) or {}
@@ -237,8 +262,8 @@ def report_writer(state: Dict[str, Any]) -> Dict[str, Any]:
                 })
                 seen.add(url)
 
-    # State에서 각 에이전트 출처 수집
-    state_sources = state.get("sources", {})
+    # State의 출처 원장에서 이 회사 출처만 수집 (다른 회사 출처가 섞이지 않음)
+    state_sources = company_sources(state.get("sources"), company)
 
     # Tech 출처
     for url in (state_sources.get("tech") or []):
@@ -277,7 +302,7 @@ def report_writer(state: Dict[str, Any]) -> Dict[str, Any]:
             })
             seen.add(url)
 
-    print(f"[REPORT] 총 출처: {len(sources)}개 수집")
+    logger.info(f"[REPORT] 총 출처: {len(sources)}개 수집")
 
     # 6) 회사 개요
     matched_item = None
@@ -405,26 +430,31 @@ def report_writer(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     # 14) HTML/PDF
-    html = render_html(final_json, meta)
-    cfg_data = state.get("report_config") or {}
-    if isinstance(cfg_data, ReportConfig):
-        cfg = cfg_data
+    # HTML은 content-addressed 저장소에 쓰고 state에는 handle만 남김
+    stem = f"{_safe_filename(company)}_투자메모_{cfg.version}"
+    out_path = f"{cfg.out_dir.rstrip('/')}/{stem}.pdf"
+    store = get_artifact_store(os.path.join(cfg.out_dir, "artifacts"))
+
+    started = time.perf_counter()
+    if cfg.stream_html:
+        # 큰 보고서도 HTML 전체를 메모리에 만들지 않음 (저장소로 스트리밍 → PDF도 파일에서 렌더링)
+        html = None
+        with store.writer(".html") as w:
+            for chunk in stream_html(final_json, meta, charts=charts):
+                w.write(chunk)
+        w.handle["render_seconds"] = round(time.perf_counter() - started, 3)
+        html_handle = w.handle
     else:
-        cfg = ReportConfig(
-            version=cfg_data.get("version", "v1.0"),
-            author=cfg_data.get("author", "투자팀"),
-            renderer=cfg_data.get("renderer", "playwright"),
-            out_dir=cfg_data.get("out_dir", "./outputs"),
-            wkhtmltopdf_path=cfg_data.get("wkhtmltopdf_path"),
-        )
-    fname = f"{_safe_filename(company)}_투자메모_{cfg.version}.pdf"
-    out_path = f"{cfg.out_dir.rstrip('/')}/{fname}"
+        html = render_html(final_json, meta, charts=charts)
+        html_handle = store.put_text(html, render_seconds=time.perf_counter() - started)
     if cfg.renderer != "none":
-        html_to_pdf(html, out_path, renderer=cfg.renderer, wkhtmltopdf_path=cfg.wkhtmltopdf_path)
+        html_to_pdf(
+            html, out_path, renderer=cfg.renderer, wkhtmltopdf_path=cfg.wkhtmltopdf_path,
+            html_path=html_handle["path"],
+        )
 
-    print(f"[REPORT] 보고서 생성 완료: {out_path}")
+    logger.info(f"[REPORT] 보고서 생성 완료: {out_path} (HTML {html_handle['size']:,} bytes, sha256 {html_handle['sha256'][:12]})")
 
-    # 15) State 업데이트
-    reports = list(state.get("reports", []))
-    reports.append({"company": company, "pdf": out_path, "html": html})
-    return {"reports": reports}
\ No newline at end of file
+    # 15) State 업데이트: 새 보고서만 반환 (merge_reports reducer가 기존 목록에 추가,
+    #     HTML 본문은 load_report_html로 필요할 때 읽음)
+    return {"reports": [{"company": company, "pdf": out_path, "html_artifact": html_handle}]}
@@ -0,0 +1,265 @@
+# agents/report/pdf_pool.py
+"""
+Playwright 브라우저 풀 (HTML → PDF)
+
+전용 스레드 하나가 asyncio 이벤트 루프와 Chromium 인스턴스를 실행 내내 유지하고,
+보고서 노드(여러 스레드 / 이벤트 루프)는 렌더링 요청만 넘김.
+    - 브라우저 시작 비용(1–3초)을 보고서마다 내지 않음
+    - 같은 브라우저에서 여러 탭으로 동시에 렌더링 (browsers × tabs 개까지)
+    - 브라우저 하나가 pages_per_browser 장을 렌더링하면 새 브라우저로 교체해 메모리 누적을 막음
+      (교체된 브라우저는 진행 중인 탭이 끝난 뒤 닫힘)
+
+환경 변수:
+    INVEST_AGENT_PDF_BROWSERS       유지할 브라우저 수 (기본 1)
+    INVEST_AGENT_PDF_TABS           브라우저당 동시 탭 수 (기본 4)
+    INVEST_AGENT_PDF_RECYCLE_PAGES  브라우저 교체 주기 (렌더링 장수, 기본 50)
+"""
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PDF_OPTIONS: Dict[str, Any] = {
+    "format": "A4",
+    "print_background": True,
+    "margin": {"top": "10mm", "bottom": "12mm", "left": "10mm", "right": "10mm"},
+}
+
+
+class _BrowserSlot:
+    """브라우저 1개와 렌더링 카운터"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.rendered = 0
+        self.in_flight = 0
+        self.retired = False
+
+
+class BrowserPool:
+    """
+    Args:
+        browsers: 유지할 브라우저 수
+        tabs_per_browser: 브라우저당 동시 탭 수
+        pages_per_browser: 이 장수를 렌더링한 브라우저는 새 브라우저로 교체
+        timeout: 렌더링 1건 제한 시간 (초)
+    """
+
+    def __init__(
+        self,
+        browsers: int = 1,
+        tabs_per_browser: int = 4,
+        pages_per_browser: int = 50,
+        timeout: float = 120.0,
+    ):
+        self.browsers = max(1, browsers)
+        self.tabs_per_browser = max(1, tabs_per_browser)
+        self.pages_per_browser = max(1, pages_per_browser)
+        self.timeout = timeout
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # 아래는 풀 스레드의 이벤트 루프 안에서만 다룸
+        self._playwright = None
+        self._slots: List[_BrowserSlot] = []
+        self._tabs: Optional[asyncio.Semaphore] = None
+        self._slot_lock: Optional[asyncio.Lock] = None
+        self._next = 0
+
+        self.pages_rendered = 0
+        self.browsers_launched = 0
+
+    # ===== 풀 스레드 =====
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="pdf-browser-pool", daemon=True)
+                thread.start()
+                try:
+                    asyncio.run_coroutine_threadsafe(self._start(), loop).result()
+                except BaseException:
+                    # playwright 미설치 / 브라우저 실행 실패 → 스레드를 남기지 않음
+                    loop.call_soon_threadsafe(loop.stop)
+                    thread.join(timeout=5)
+                    loop.close()
+                    raise
+                self._thread = thread
+                self._loop = loop
+        return self._loop
+
+    async def _start(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self._tabs = asyncio.Semaphore(self.browsers * self.tabs_per_browser)
+        self._slot_lock = asyncio.Lock()
+        logger.info(
+            f"PDF 브라우저 풀 시작: 브라우저 {self.browsers}개 × 탭 {self.tabs_per_browser}개, "
+            f"{self.pages_per_browser}장마다 교체"
+        )
+
+    async def _launch(self) -> _BrowserSlot:
+        browser = await self._playwright.chromium.launch(headless=True)
+        self.browsers_launched += 1
+        return _BrowserSlot(browser)
+
+    async def _close_slot(self, slot: _BrowserSlot) -> None:
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            logger.warning(f"브라우저 종료 실패: {e}")
+
+    async def _acquire_slot(self) -> _BrowserSlot:
+        """렌더링할 브라우저 선택 (교체 주기에 도달했거나 끊긴 브라우저는 새로 띄움)"""
+        async with self._slot_lock:
+            while len(self._slots) < self.browsers:
+                self._slots.append(await self._launch())
+
+            index = self._next % len(self._slots)
+            self._next += 1
+            slot = self._slots[index]
+
+            if slot.rendered + slot.in_flight >= self.pages_per_browser or not slot.browser.is_connected():
+                slot.retired = True
+                if slot.in_flight == 0:
+                    await self._close_slot(slot)
+                slot = await self._launch()
+                self._slots[index] = slot
+
+            slot.in_flight += 1
+            return slot
+
+    async def _release_slot(self, slot: _BrowserSlot) -> None:
+        async with self._slot_lock:
+            slot.in_flight -= 1
+            slot.rendered += 1
+            if slot.retired and slot.in_flight == 0:
+                await self._close_slot(slot)
+
+    async def _render(
+        self, html: Optional[str], out_path: str, pdf_options: Dict[str, Any], url: Optional[str] = None
+    ) -> None:
+        async with self._tabs:
+            slot = await self._acquire_slot()
+            try:
+                page = await slot.browser.new_page()
+                try:
+                    if url is not None:
+                        await page.goto(url, wait_until="load")
+                    else:
+                        await page.set_content(html, wait_until="load")
+                    await page.pdf(path=out_path, **pdf_options)
+                finally:
+                    await page.close()
+            finally:
+                await self._release_slot(slot)
+        self.pages_rendered += 1
+
+    # ===== 호출 측 API =====
+
+    def render(self, html: str, out_path: str, pdf_options: Optional[Dict[str, Any]] = None) -> None:
+        """HTML → PDF (호출 스레드는 렌더링이 끝날 때까지 대기)"""
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(
+            self._render(html, out_path, pdf_options or PDF_OPTIONS), loop
+        )
+        try:
+            future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def render_file(self, html_path: str, out_path: str, pdf_options: Optional[Dict[str, Any]] = None) -> None:
+        """HTML 파일 → PDF (HTML 문자열을 메모리에 올리지 않고 file:// 로 엶)"""
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(
+            self._render(None, out_path, pdf_options or PDF_OPTIONS, url=Path(html_path).resolve().as_uri()),
+            loop,
+        )
+        try:
+            future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def arender(self, html: str, out_path: str, pdf_options: Optional[Dict[str, Any]] = None) -> None:
+        """render의 async 버전 (호출 측 이벤트 루프를 막지 않음)"""
+        loop = await asyncio.to_thread(self._ensure_started)
+        future = asyncio.run_coroutine_threadsafe(
+            self._render(html, out_path, pdf_options or PDF_OPTIONS), loop
+        )
+        await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+
+    async def _shutdown(self) -> None:
+        for slot in self._slots:
+            await self._close_slot(slot)
+        self._slots = []
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def close(self) -> None:
+        """브라우저와 풀 스레드 종료 (다시 render하면 새로 시작)"""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+            except Exception as e:
+                logger.warning(f"PDF 브라우저 풀 종료 중 오류: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5)
+            loop.close()
+            self._loop = None
+            self._thread = None
+            logger.info(
+                f"PDF 브라우저 풀 종료: {self.pages_rendered}장 렌더링, 브라우저 {self.browsers_launched}회 시작"
+            )
+
+    def stats(self) -> Dict[str, int]:
+        return {"pages_rendered": self.pages_rendered, "browsers_launched": self.browsers_launched}
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pdf_pool() -> BrowserPool:
+    """프로세스 공유 브라우저 풀 (첫 렌더링 때 브라우저를 띄우고 종료 시 자동으로 닫음)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = BrowserPool(
+                    browsers=_env_int("INVEST_AGENT_PDF_BROWSERS", 1),
+                    tabs_per_browser=_env_int("INVEST_AGENT_PDF_TABS", 4),
+                    pages_per_browser=_env_int("INVEST_AGENT_PDF_RECYCLE_PAGES", 50),
+                )
+                atexit.register(_pool.close)
+    return _pool
+
+
+def close_pdf_pool() -> None:
+    """공유 풀 종료 (실행 마지막에 명시적으로 정리하고 싶을 때)"""
+    if _pool is not None:
+        _pool.close()
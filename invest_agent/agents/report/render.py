@@ -1,19 +1,49 @@
 import datetime
 import logging
-from typing import Dict, Any, Optional
-from jinja2 import Environment, BaseLoader
+import os
+import threading
+from typing import Dict, Any, Iterator, Optional
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, Template
 from .template import HTML_TMPL
-from .charts import _img_bar_scores, _img_kpi_table
+from .charts import build_charts
+from .pdf_pool import get_pdf_pool
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_NAME = "report.html"
+
+# 컴파일된 템플릿은 프로세스 전체에서 공유 (보고서마다 다시 파싱하지 않음).
+# INVEST_AGENT_JINJA_CACHE=<디렉터리>를 지정하면 컴파일 결과(bytecode)를 디스크에도 저장해
+# 새 프로세스에서도 컴파일을 생략함.
+_template: Optional[Template] = None
+_template_lock = threading.Lock()
+
+def _make_environment() -> Environment:
+    cache_dir = os.getenv("INVEST_AGENT_JINJA_CACHE")
+    bytecode_cache = None
+    if cache_dir and cache_dir.lower() not in {"0", "off", "false", "none"}:
+        os.makedirs(cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(cache_dir)
+    return Environment(
+        loader=DictLoader({TEMPLATE_NAME: HTML_TMPL}),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+    )
+
+def get_template() -> Template:
+    global _template
+    if _template is None:
+        with _template_lock:
+            if _template is None:
+                _template = _make_environment().get_template(TEMPLATE_NAME)
+    return _template
+
 def _today() -> str:
     return datetime.date.today().isoformat()
 
-def render_html(final_json: Dict[str, Any], meta: Dict[str, Any]) -> str:
-    env = Environment(loader=BaseLoader())
-    tmpl = env.from_string(HTML_TMPL)
-
+def _template_context(
+    final_json: Dict[str, Any], meta: Dict[str, Any], charts: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     decision_map = {
         "invest": "투자 추천",
         "invest_conditional": "조건부 투자 추천",
@@ -23,15 +53,13 @@ def render_html(final_json: Dict[str, Any], meta: Dict[str, Any]) -> str:
         "draft": "초안",
     }
 
-    try:
-        scores_img = _img_bar_scores(final_json.get("scores", {}))
-        kpi_table_img = _img_kpi_table(final_json.get("kpis", {}))
-    except Exception as e:
-        logger.warning(f"차트 생성 중 오류 발생: {e}")
-        scores_img = ""
-        kpi_table_img = ""
+    # charts: build_charts 결과 (없으면 여기서 SVG로 생성)
+    if charts is None:
+        charts = build_charts(final_json.get("scores", {}), final_json.get("kpis", {}))
+    chart_vars = {"scores_svg": "", "kpi_table_svg": "", "scores_img": "", "kpi_table_img": ""}
+    chart_vars.update(charts)
 
-    html = tmpl.render(
+    return dict(
         company=final_json.get("company", "Unknown"),
         version=meta.get("version", "v1.0"),
         today=_today(),
@@ -55,8 +83,7 @@ def render_html(final_json: Dict[str, Any], meta: Dict[str, Any]) -> str:
         mitigations=final_json.get("mitigations", []),
         required_data=final_json.get("recommendations", {}).get("required_data", []),
         kpi_scenarios_table=meta.get("kpi_scenarios_table", ""),
-        scores_img=scores_img,
-        kpi_table_img=kpi_table_img,
+        **chart_vars,
         sources=final_json.get("sources", []),
         # ✅ 추가: 누락된 변수들
         traction=final_json.get("traction", {}),
@@ -66,37 +93,49 @@ def render_html(final_json: Dict[str, Any], meta: Dict[str, Any]) -> str:
         red_flags=final_json.get("red_flags", []),
         appendix=final_json.get("appendix", {}),
     )
+
+def render_html(final_json: Dict[str, Any], meta: Dict[str, Any], charts: Optional[Dict[str, Any]] = None) -> str:
+    html = get_template().render(**_template_context(final_json, meta, charts))
     logger.info(f"HTML 렌더링 완료: {final_json.get('company', 'Unknown')}")
     return html
 
+def stream_html(final_json: Dict[str, Any], meta: Dict[str, Any], charts: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """render_html과 같은 HTML을 조각 단위로 생성 (전체 문자열을 만들지 않음)"""
+    return get_template().generate(**_template_context(final_json, meta, charts))
+
+def render_html_to_file(
+    final_json: Dict[str, Any], meta: Dict[str, Any], out_path: str, charts: Optional[Dict[str, Any]] = None
+) -> str:
+    """HTML을 파일에 바로 스트리밍해 쓰고 경로를 반환"""
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        for chunk in stream_html(final_json, meta, charts):
+            f.write(chunk)
+    logger.info(f"HTML 렌더링 완료 (스트리밍): {out_path}")
+    return out_path
+
 
 def html_to_pdf(
-    html: str,
+    html: Optional[str],
     out_path: str,
     renderer: str = "playwright",
     wkhtmltopdf_path: Optional[str] = None,
+    html_path: Optional[str] = None,
 ) -> None:
-    """HTML → PDF 변환 (Playwright 기반)"""
+    """HTML → PDF 변환 (Playwright 브라우저 풀 기반). html 대신 html_path(파일)를 줄 수 있음."""
     if renderer == "none":
         logger.info("renderer=none → PDF 생성 스킵")
         return
 
     if renderer == "playwright":
         try:
-            from playwright.sync_api import sync_playwright
-
             logger.info(f"Playwright PDF 생성 시작: {out_path}")
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.set_content(html, wait_until="load")
-                page.pdf(
-                    path=out_path,
-                    format="A4",
-                    print_background=True,
-                    margin={"top": "10mm", "bottom": "12mm", "left": "10mm", "right": "10mm"},
-                )
-                browser.close()
+            # 실행 내내 유지되는 브라우저 풀에서 탭 하나로 렌더링
+            pool = get_pdf_pool()
+            if html is None and html_path:
+                pool.render_file(html_path, out_path)
+            else:
+                pool.render(html, out_path)
             logger.info(f"Playwright PDF 생성 완료: {out_path}")
         except Exception as e:
             logger.error(f"Playwright PDF 생성 실패: {e}")
@@ -9,9 +9,11 @@ from pathlib import Path
 # 프로젝트 루트를 sys.path에 추가 (네 디렉토리 구조에 맞게 유지)
 ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT.parent))  # invest_agent.infra
 
 from agents.report.config import ReportConfig
 from agents.report.node import report_writer
+from invest_agent.infra.artifacts import load_report_html
 # from nodes.report.llm import local_llm_call  # 필요 시 사용
 
 
@@ -176,7 +178,7 @@ def main():
                 print(f"PDF:  {rep['pdf']}")
                 html_path = Path(cfg.out_dir) / f"{rep['company']}_{tag.replace('/', '_')}_preview.html"
                 with open(html_path, "w", encoding="utf-8") as f:
-                    f.write(rep["html"])
+                    f.write(load_report_html(rep))
                 print(f"HTML: {html_path.resolve()}")
             else:
                 print("보고서 생성 안됨")
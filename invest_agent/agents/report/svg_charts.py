@@ -0,0 +1,118 @@
+# invest_agent/agents/report/svg_charts.py
+"""
+보고서용 SVG 차트 (matplotlib 없이 문자열 템플릿으로 생성)
+
+HTML에 그대로 인라인되는 벡터 차트라 PNG(base64)보다 훨씬 작고 PDF에서도 선명함.
+글꼴은 페이지 CSS를 그대로 따르므로 한글 폰트 설정이 따로 필요 없음.
+"""
+from typing import Any, Dict, List, Tuple
+from xml.sax.saxutils import escape
+
+BAR_COLOR = "#0066cc"
+GRID_COLOR = "#e5e7eb"
+TEXT_COLOR = "#1a1a1a"
+MUTED_COLOR = "#666666"
+
+# 값 열에 한 줄로 들어가는 최대 글자 수
+KPI_MAX_CHARS = 48
+
+KPI_LABELS = [
+    ("arr", "ARR"),
+    ("qoq", "QoQ 성장률"),
+    ("ndr", "NDR"),
+    ("gross_margin", "Gross Margin"),
+    ("burn", "Burn Rate"),
+    ("runway_months", "Runway"),
+]
+
+_BAR_ROW = (
+    '<text x="{label_x}" y="{text_y}" text-anchor="end" fill="{text}">{label}</text>'
+    '<rect x="{x}" y="{y}" width="{w:.1f}" height="{h}" rx="3" fill="{color}"/>'
+    '<text x="{value_x:.1f}" y="{text_y}" fill="{text}">{value}</text>'
+)
+
+
+def _numeric_scores(scores: Dict[str, Any]) -> List[Tuple[str, float]]:
+    items = []
+    for name, value in scores.items():
+        if name == "total_100":
+            continue
+        try:
+            items.append((str(name), float(value)))
+        except (TypeError, ValueError):
+            continue
+    return items
+
+
+def svg_bar_scores(scores: Dict[str, Any], width: int = 560, max_score: float = 100.0) -> str:
+    """영역별 점수 가로 막대 차트 (숫자 점수가 없으면 빈 문자열)"""
+    items = _numeric_scores(scores)
+    if not items:
+        return ""
+
+    row_h, bar_h, top, label_w, value_w = 30, 18, 34, 110, 44
+    plot_x = label_w + 10
+    plot_w = width - plot_x - value_w
+    height = top + row_h * len(items) + 10
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="100%" '
+        f'font-size="12" role="img" aria-label="컴포넌트 점수">',
+        f'<text x="0" y="16" font-size="14" font-weight="600" fill="{TEXT_COLOR}">컴포넌트 점수</text>',
+    ]
+    # 0 / 50 / 100 눈금
+    for tick in (0.0, 0.5, 1.0):
+        gx = plot_x + plot_w * tick
+        parts.append(
+            f'<line x1="{gx:.1f}" y1="{top - 6}" x2="{gx:.1f}" y2="{height - 8}" stroke="{GRID_COLOR}"/>'
+        )
+
+    for i, (name, value) in enumerate(items):
+        y = top + i * row_h
+        ratio = max(0.0, min(1.0, value / max_score))
+        parts.append(_BAR_ROW.format(
+            label_x=label_w, text_y=y + bar_h - 4, label=escape(name),
+            x=plot_x, y=y, w=plot_w * ratio, h=bar_h, color=BAR_COLOR,
+            value_x=plot_x + plot_w * ratio + 6, value=f"{value:.1f}", text=TEXT_COLOR,
+        ))
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def svg_kpi_table(kpis: Dict[str, Any], width: int = 560) -> str:
+    """
+    KPI 표
+
+    값이 하나도 없거나 한 줄에 들어가지 않는 긴 문장이 있으면 빈 문자열을 반환함
+    (SVG 텍스트는 줄바꿈이 안 되므로 템플릿의 HTML 표를 그대로 사용).
+    """
+    rows = [(label, str(kpis.get(key, "-"))) for key, label in KPI_LABELS]
+    if all(value in ("", "-", "None") for _, value in rows):
+        return ""
+    if any(len(value) > KPI_MAX_CHARS for _, value in rows):
+        return ""
+
+    row_h, label_w = 28, 130
+    height = row_h * (len(rows) + 1)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" width="100%" '
+        f'font-size="12" role="img" aria-label="KPI">',
+        f'<rect x="0" y="0" width="{width}" height="{row_h}" fill="#f1f5f9"/>',
+        f'<text x="8" y="{row_h - 9}" font-weight="600" fill="{TEXT_COLOR}">지표</text>',
+        f'<text x="{label_w + 8}" y="{row_h - 9}" font-weight="600" fill="{TEXT_COLOR}">값</text>',
+    ]
+    for i, (label, value) in enumerate(rows, start=1):
+        y = row_h * i
+        parts.append(f'<line x1="0" y1="{y}" x2="{width}" y2="{y}" stroke="{GRID_COLOR}"/>')
+        parts.append(f'<text x="8" y="{y + row_h - 9}" fill="{MUTED_COLOR}">{escape(label)}</text>')
+        parts.append(
+            f'<text x="{label_w + 8}" y="{y + row_h - 9}" fill="{TEXT_COLOR}">'
+            f'{escape(value)}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def svg_charts(scores: Dict[str, Any], kpis: Dict[str, Any]) -> Dict[str, str]:
+    """템플릿 변수 {"scores_svg", "kpi_table_svg"}"""
+    return {"scores_svg": svg_bar_scores(scores), "kpi_table_svg": svg_kpi_table(kpis)}
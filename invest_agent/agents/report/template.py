@@ -199,7 +199,9 @@ HTML_TMPL = r"""<!doctype html>
       <div>
         <div class="info-card">
           <h3>주요 지표 (KPIs)</h3>
-          {% if kpi_table_img %}
+          {% if kpi_table_svg %}
+          {{ kpi_table_svg }}
+          {% elif kpi_table_img %}
           <img src="data:image/png;base64,{{ kpi_table_img }}" alt="KPI Table">
           {% else %}
           <table>
@@ -238,7 +240,9 @@ HTML_TMPL = r"""<!doctype html>
               <div class="label">총점 (100점 만점)</div>
             </div>
           </div>
-          {% if scores_img %}
+          {% if scores_svg %}
+          <div style="margin-top:16px;">{{ scores_svg }}</div>
+          {% elif scores_img %}
           <img src="data:image/png;base64,{{ scores_img }}" alt="Scores Bar" style="margin-top:16px;">
           {% endif %}
         </div>
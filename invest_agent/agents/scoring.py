@@ -0,0 +1,352 @@
+# agents/scoring.py
+"""
+투자 판단 점수 계산 (LLM 호출 없음)
+
+정규화(normalize_input), 영역별 점수(score_*), 리스크 페널티, 판단 임계값을 담음.
+invest.py의 파이프라인과 scoring_engine.py의 벡터화 엔진이 같은 상수를 공유하며,
+OpenAI 키 없이 import할 수 있어 과거 평가 재채점에도 사용됨.
+"""
+import math
+from typing import Any, Dict, List, Literal, Tuple
+
+from invest_agent.states import GraphState
+from invest_agent.agents.amounts import (
+    extract_pct_delta,
+    parse_percent,
+    parse_usd_billion,
+    parse_usd_million,
+)
+
+
+# ========= Schema & Constants =========
+
+DecisionStatus = Literal["invest", "fail"]
+
+WEIGHTS = {
+    "market": 0.35,
+    "technology": 0.25,
+    "competition": 0.20,
+    "traction": 0.10,
+    "deal": 0.10,
+}
+
+INVEST_CUTOFF = 65.0
+
+RISK_PENALTY_BUCKETS = [
+    (20.0, 5.0),
+    (35.0, 10.0),
+    (9999.0, 15.0),
+]
+
+RED_FLAG_RULES = {
+    "bigtech_keywords": [
+        "Sora",
+        "OpenAI",
+        "Adobe",
+        "Google",
+        "Meta",
+        "Amazon",
+        "Microsoft",
+    ],
+}
+
+
+def clamp(x: float, lo: float = 0.0, hi: float = 100.0) -> float:
+    return max(lo, min(hi, x))
+
+
+# ========= Normalizer =========
+# 금액·비율 파싱은 agents/amounts.py (정규식 사전 컴파일 + 단위 표)
+
+
+def normalize_input(raw: Dict[str, Any]) -> Dict[str, Any]: 
+    state: GraphState = {}
+
+    # Market
+    if "market" in raw:
+        market_raw = raw["market"]
+        state["market"] = {
+            "tam_usd_b": parse_usd_billion(market_raw.get("market_size", "")),
+            "cagr_pct": parse_percent(market_raw.get("cagr", "")),
+            "problem_fit_text": market_raw.get("problem_fit"),
+            "demand_drivers": market_raw.get("demand_drivers", []),
+        }
+
+    # Technology
+    if "technology" in raw:
+        tech_raw = raw["technology"]
+        state["technology"] = {
+            "technology_summary": tech_raw.get("technology_summary"),
+            "core_technology": tech_raw.get("core_technology"),
+            "sota_performance_note": tech_raw.get("sota_performance"),
+            "reproduction_difficulty": tech_raw.get("reproduction_difficulty", "unknown"),
+            "infrastructure_requirements": tech_raw.get("infrastructure_requirements", []),
+            "ip_patent_status": tech_raw.get("ip_patent_status", "unknown"),
+            "scalability_note": tech_raw.get("scalability"),
+            "tech_risks_texts": tech_raw.get("tech_risks", []),
+        }
+
+    # Competition
+    if "competition" in raw:
+        comp_raw = raw["competition"]
+        competitors = []
+        for c in comp_raw.get("competitors_analysis", []):
+            competitors.append(
+                {
+                    "name": c.get("company"),
+                    "overlap_0to10": c.get("overlap"),
+                    "differentiation_0to10": c.get("differentiation"),
+                    "moat_0to10": c.get("moat"),
+                    "positioning": c.get("positioning"),
+                }
+            )
+        state["competition"] = {
+            "competitors": competitors,
+            "swot_strengths": comp_raw.get("swot", {}).get("strengths", []),
+            "swot_weaknesses": comp_raw.get("swot", {}).get("weaknesses", []),
+            "swot_opportunities": comp_raw.get("swot", {}).get("opportunities", []),
+            "swot_threats": comp_raw.get("swot", {}).get("threats", []),
+        }
+
+    # Business
+    if "business" in raw:
+        biz_raw = raw["business"]
+        state["business"] = {
+            "arr_usd_m": parse_usd_million(biz_raw.get("revenue_model", "")),
+            "pricing_model": biz_raw.get("pricing_examples"),
+            "customer_segments": biz_raw.get("customer_segments", []),
+            "funding_text": raw.get("traction", {}).get("funding"),
+            "investors": raw.get("traction", {}).get("investors", []),
+            "partnerships": raw.get("traction", {}).get("partnerships", []),
+        }
+
+    # Meta
+    if "meta" in raw:
+        state["meta"] = {
+            "name": raw["meta"].get("startup_name"),
+            "industry": raw["meta"].get("industry"),
+            "country": raw["meta"].get("country"),
+            "founded_year": raw["meta"].get("founded_year"),
+        }
+
+    return state
+
+
+# ========= Scoring =========
+
+def _safe_avg(values):
+    vals = [v for v in values if v is not None]
+    return sum(vals) / len(vals) if vals else None
+
+
+# 기존 이름 유지 (scoring_engine 등에서 사용)
+_parse_arr_text = parse_usd_million
+_extract_pct_from_text = extract_pct_delta
+
+
+def score_market(market: Dict[str, Any]) -> float:
+    if not market:
+        return 60.0
+
+    tam_score = None
+    cagr_score = None
+    pf_score = None
+
+    if market.get("tam_usd_b"):
+        tam = max(1e-6, market["tam_usd_b"])
+        tam_score = clamp(((math.log10(tam) - 1) / 2) * 100, 0, 100)
+    if market.get("cagr_pct") is not None:
+        cagr_score = clamp((market["cagr_pct"] / 25.0) * 100, 0, 100)
+    if market.get("problem_fit_score_0to5") is not None:
+        pf_score = market["problem_fit_score_0to5"] * 20
+
+    quant_candidates = [v for v in [tam_score, cagr_score] if v is not None]
+    if quant_candidates:
+        quant_max = max(quant_candidates)
+        quant_avg = _safe_avg(quant_candidates) or quant_max
+        quant = 0.6 * quant_max + 0.4 * quant_avg
+    else:
+        quant = None
+
+    if pf_score is not None and quant is not None:
+        final = (quant + pf_score) / 2.0
+    elif pf_score is not None:
+        final = pf_score
+    elif quant is not None:
+        final = quant
+    else:
+        final = 60.0
+
+    return clamp(final, 0, 100)
+
+
+def score_technology(tech: Dict[str, Any]) -> float:
+    if not tech:
+        return 60.0
+
+    subs = [60]
+
+    if tech.get("perf_delta_pct") is not None:
+        subs.append(min(100, 60 + float(tech["perf_delta_pct"])))
+    if tech.get("speed_delta_pct") is not None:
+        subs.append(min(100, 60 + float(tech["speed_delta_pct"])))
+    if tech.get("csat_pct") is not None:
+        subs.append(clamp(float(tech["csat_pct"]), 0, 100))
+
+    note = tech.get("sota_performance_note", "")
+    delta = _extract_pct_from_text(note)
+    if delta is not None:
+        subs.append(min(100, 70 + delta))
+    elif isinstance(note, str) and ("초과" in note or "우수" in note):
+        subs.append(75)
+
+    checklist = [
+        tech.get(k, 0)
+        for k in [
+            "checklist_api",
+            "checklist_multi_tenancy",
+            "checklist_sdk_docs",
+            "checklist_automation",
+            "checklist_domain_extensibility",
+        ]
+    ]
+    if any(v is not None for v in checklist):
+        checklist_score = (sum([(v or 0) for v in checklist]) / 5.0) * 100
+        subs.append(checklist_score)
+
+    ip_txt = (tech.get("ip_patent_status") or "").lower()
+    if "등록" in ip_txt or "granted" in ip_txt:
+        subs.append(85)
+    elif "출원" in ip_txt or "filed" in ip_txt:
+        subs.append(75)
+    else:
+        subs.append(55)
+
+    if tech.get("scalability_note"):
+        subs.append(75)
+
+    return clamp(sum(subs) / len(subs), 0, 100)
+
+
+def score_competition(comp: Dict[str, Any]) -> float:
+    if not comp:
+        return 60.0
+
+    diffs, moats, overlaps = [], [], []
+    for c in comp.get("competitors", []):
+        if c.get("differentiation_0to10") is not None:
+            diffs.append(c["differentiation_0to10"] * 10)
+        if c.get("moat_0to10") is not None:
+            moats.append(c["moat_0to10"] * 10)
+        if c.get("overlap_0to10") is not None:
+            overlaps.append(c["overlap_0to10"])
+
+    if diffs or moats:
+        base = 0.6 * (_safe_avg(diffs) or 60) + 0.4 * (_safe_avg(moats) or 60)
+    else:
+        base = 60.0
+
+    penalty = 0.0
+    if overlaps:
+        avg_overlap = sum(overlaps) / len(overlaps)
+        penalty = max(0.0, (avg_overlap - 5.0) * 5.0)
+
+    base_adj = clamp(base - penalty, 0, 100)
+
+    qpos = comp.get("qual_positioning_score_0to5")
+    if qpos is not None:
+        qpos_score = qpos * 20
+        return clamp((base_adj + qpos_score) / 2.0, 0, 100)
+    return base_adj
+
+
+def score_traction(biz: Dict[str, Any]) -> float:
+    if not biz:
+        return 60.0
+
+    score = 60.0
+
+    arr = biz.get("arr_usd_m")
+    if arr is None and biz.get("revenue_model"):
+        arr = _parse_arr_text(biz["revenue_model"])
+    if arr is not None:
+        arr_score = max(50.0, min(100.0, (float(arr) / 50.0) * 100.0))
+        score = arr_score
+
+    partners = biz.get("partnerships", [])
+    if partners:
+        if any(
+            "포춘" in p
+            or any(big in p for big in ["Microsoft", "AWS", "Amazon", "Google", "Meta"])
+            for p in partners
+        ):
+            score += 20
+        else:
+            score += 10
+
+    ftxt = biz.get("funding_text") or ""
+    if isinstance(ftxt, str) and ("억" in ftxt or "million" in ftxt.lower()):
+        score += 5
+
+    return clamp(score, 0, 100)
+
+
+def score_deal_terms(state: GraphState) -> float:
+    return 60.0
+
+
+def compute_scores(state: GraphState) -> GraphState:
+    scores: Dict[str, Any] = {
+        "market": score_market(state.get("market", {})),
+        "technology": score_technology(state.get("technology", {})),
+        "competition": score_competition(state.get("competition", {})),
+        "traction": score_traction(state.get("business", {})),
+        "deal": score_deal_terms(state),
+        "risk_penalty_pct": 0.0,
+    }
+    state["scores"] = scores
+    return state
+
+
+# ========= Risk Penalty =========
+
+def apply_risk_penalty(state: GraphState) -> float:
+    risks = state.get("risks", [])
+    if not risks:
+        return 0.0
+
+    agg = 0.0
+    for r in risks:
+        sev = r.get("severity_1to3", 1)
+        lik = r.get("likelihood_1to3", 1)
+        w = r.get("weight", 1.0)
+        agg += float(sev) * float(lik) * float(w)
+
+    for max_val, pct in RISK_PENALTY_BUCKETS:
+        if agg <= max_val:
+            state.setdefault("scores", {})["risk_penalty_pct"] = pct
+            return pct
+    return 0.0
+
+
+# (하한, status, final_note) — 위에서부터 처음 만족하는 구간을 사용
+DECISION_THRESHOLDS: List[Tuple[float, DecisionStatus, str]] = [
+    (50.0, "invest", "투자 권고"),
+    (30.0, "invest", "조건부 투자 권고"),
+]
+FAIL_NOTE = "재검토 필요"
+
+
+def decide_status(adjusted: float) -> Tuple[DecisionStatus, str]:
+    """페널티 반영 총점 → (status, final_note)"""
+    for floor, status, note in DECISION_THRESHOLDS:
+        if adjusted >= floor:
+            return status, note
+    return "fail", FAIL_NOTE
+
+
+def decision_label(status: DecisionStatus, total_score: float) -> str:
+    """(status, 총점) → workflow label (recommend / invest_conditional / reject)"""
+    if status == "invest":
+        return "recommend" if total_score >= DECISION_THRESHOLDS[0][0] else "invest_conditional"
+    return "reject"
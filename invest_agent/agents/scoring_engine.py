@@ -0,0 +1,386 @@
+# agents/scoring_engine.py
+"""
+벡터화 점수 엔진
+
+N개 회사의 정규화된 state(normalize_input + LLM 평가 결과)를 열 단위 NumPy 배열로
+바꾼 뒤, 영역별 점수·가중합·리스크 페널티·판단을 한 번에 계산함.
+가중치만 바꿔 수천 건을 재채점할 때는 features_from_states를 한 번만 실행하고
+score_batch를 반복 호출하면 됨.
+
+scalar 경로(scoring.score_* / invest._build_decision)와 같은 규칙을 그대로 따름:
+    - 평균이 0이면 60으로 대체되는 `or 60` 동작 (competition)
+    - 체크리스트 키가 없으면 0으로 간주
+    - TAM은 0/None이면 제외 (truthiness)
+    - 리스크는 severity_1to3 / likelihood_1to3 / weight 키 (기본 1)
+    - 판단 임계값 50 / 30 (DECISION_THRESHOLDS)
+가변 길이 목록(경쟁사, 리스크)과 텍스트 판정은 특징 추출 단계에서 scalar와 같은
+순서로 합산해 두므로 결과가 일치함 (log10만 구현 차이로 1e-12 수준 오차 가능).
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from invest_agent.agents.scoring import (
+    DECISION_THRESHOLDS,
+    RISK_PENALTY_BUCKETS,
+    WEIGHTS,
+    _extract_pct_from_text,
+    _parse_arr_text,
+)
+
+CHECKLIST_KEYS = [
+    "checklist_api",
+    "checklist_multi_tenancy",
+    "checklist_sdk_docs",
+    "checklist_automation",
+    "checklist_domain_extensibility",
+]
+
+BIGTECH_PARTNERS = ["Microsoft", "AWS", "Amazon", "Google", "Meta"]
+
+# 판단 코드 (status_code) → workflow label
+LABELS = np.array(["recommend", "invest_conditional", "reject"])
+
+FEATURE_COLUMNS = [
+    # market
+    "market_present", "tam_usd_b", "cagr_pct", "problem_fit_0to5",
+    # technology
+    "tech_present", "perf_delta_pct", "speed_delta_pct", "csat_pct",
+    "note_delta_pct", "note_claims_sota", "checklist_present", "checklist_sum",
+    "ip_score", "has_scalability_note",
+    # competition
+    "comp_present", "diff_sum", "diff_n", "moat_sum", "moat_n",
+    "overlap_sum", "overlap_n", "qual_positioning_0to5",
+    # traction
+    "biz_present", "arr_usd_m", "partner_bonus", "funding_mentioned",
+    # risk
+    "risk_present", "risk_agg",
+]
+
+_NAN = float("nan")
+
+
+def _num(value: Any) -> float:
+    return _NAN if value is None else float(value)
+
+
+# ========= 특징 추출 (회사당 한 번) =========
+
+def _market_features(m: Mapping[str, Any]) -> Tuple:
+    if not m:
+        return (0.0, _NAN, _NAN, _NAN)
+    tam = m.get("tam_usd_b")
+    return (
+        1.0,
+        float(tam) if tam else _NAN,  # scalar: `if market.get("tam_usd_b")`
+        _num(m.get("cagr_pct")),
+        _num(m.get("problem_fit_score_0to5")),
+    )
+
+
+def _ip_score(tech: Mapping[str, Any]) -> float:
+    ip_txt = (tech.get("ip_patent_status") or "").lower()
+    if "등록" in ip_txt or "granted" in ip_txt:
+        return 85.0
+    if "출원" in ip_txt or "filed" in ip_txt:
+        return 75.0
+    return 55.0
+
+
+def _tech_features(t: Mapping[str, Any]) -> Tuple:
+    if not t:
+        return (0.0, _NAN, _NAN, _NAN, _NAN, 0.0, 0.0, 0.0, 55.0, 0.0)
+
+    note = t.get("sota_performance_note", "")
+    delta = _extract_pct_from_text(note)
+    claims = isinstance(note, str) and ("초과" in note or "우수" in note)
+
+    checklist = [t.get(k, 0) for k in CHECKLIST_KEYS]
+    present = any(v is not None for v in checklist)
+
+    return (
+        1.0,
+        _num(t.get("perf_delta_pct")),
+        _num(t.get("speed_delta_pct")),
+        _num(t.get("csat_pct")),
+        _num(delta),
+        1.0 if claims else 0.0,
+        1.0 if present else 0.0,
+        float(sum([(v or 0) for v in checklist])),
+        _ip_score(t),
+        1.0 if t.get("scalability_note") else 0.0,
+    )
+
+
+def _comp_features(c: Mapping[str, Any]) -> Tuple:
+    if not c:
+        return (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, _NAN)
+
+    diffs, moats, overlaps = [], [], []
+    for comp in c.get("competitors", []):
+        if comp.get("differentiation_0to10") is not None:
+            diffs.append(comp["differentiation_0to10"] * 10)
+        if comp.get("moat_0to10") is not None:
+            moats.append(comp["moat_0to10"] * 10)
+        if comp.get("overlap_0to10") is not None:
+            overlaps.append(comp["overlap_0to10"])
+
+    return (
+        1.0,
+        float(sum(diffs)), float(len(diffs)),
+        float(sum(moats)), float(len(moats)),
+        float(sum(overlaps)), float(len(overlaps)),
+        _num(c.get("qual_positioning_score_0to5")),
+    )
+
+
+def _biz_features(b: Mapping[str, Any]) -> Tuple:
+    if not b:
+        return (0.0, _NAN, 0.0, 0.0)
+
+    arr = b.get("arr_usd_m")
+    if arr is None and b.get("revenue_model"):
+        arr = _parse_arr_text(b["revenue_model"])
+
+    partners = b.get("partnerships", [])
+    bonus = 0.0
+    if partners:
+        big = any("포춘" in p or any(name in p for name in BIGTECH_PARTNERS) for p in partners)
+        bonus = 20.0 if big else 10.0
+
+    ftxt = b.get("funding_text") or ""
+    funded = isinstance(ftxt, str) and ("억" in ftxt or "million" in ftxt.lower())
+
+    return (1.0, _num(arr), bonus, 1.0 if funded else 0.0)
+
+
+def _risk_features(risks: Optional[Sequence[Mapping[str, Any]]]) -> Tuple:
+    if not risks:
+        return (0.0, 0.0)
+    agg = 0.0
+    for r in risks:
+        agg += float(r.get("severity_1to3", 1)) * float(r.get("likelihood_1to3", 1)) * float(r.get("weight", 1.0))
+    return (1.0, agg)
+
+
+def feature_row(state: Mapping[str, Any]) -> Tuple:
+    """정규화된 state 1건 → FEATURE_COLUMNS 순서의 튜플"""
+    return (
+        _market_features(state.get("market", {}))
+        + _tech_features(state.get("technology", {}))
+        + _comp_features(state.get("competition", {}))
+        + _biz_features(state.get("business", {}))
+        + _risk_features(state.get("risks", []))
+    )
+
+
+def features_from_states(states: Iterable[Mapping[str, Any]]) -> Dict[str, np.ndarray]:
+    """정규화된 state 목록 → {열 이름: float64 배열}"""
+    rows = [feature_row(s) for s in states]
+    matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(FEATURE_COLUMNS))
+    return {name: matrix[:, i] for i, name in enumerate(FEATURE_COLUMNS)}
+
+
+def _columns(features) -> Dict[str, np.ndarray]:
+    """dict 또는 pandas.DataFrame을 열 배열 dict로 변환"""
+    if hasattr(features, "columns"):
+        return {name: features[name].to_numpy(dtype=np.float64) for name in FEATURE_COLUMNS}
+    return {name: np.asarray(features[name], dtype=np.float64) for name in FEATURE_COLUMNS}
+
+
+# ========= 벡터화 점수 =========
+
+def _clamp(x: np.ndarray, lo: float = 0.0, hi: float = 100.0) -> np.ndarray:
+    return np.maximum(lo, np.minimum(hi, x))
+
+
+def _present(x: np.ndarray) -> np.ndarray:
+    return ~np.isnan(x)
+
+
+def market_scores(f: Dict[str, np.ndarray]) -> np.ndarray:
+    tam, cagr, pf = f["tam_usd_b"], f["cagr_pct"], f["problem_fit_0to5"]
+    has_tam, has_cagr, has_pf = _present(tam), _present(cagr), _present(pf)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tam_score = _clamp(((np.log10(np.maximum(1e-6, tam)) - 1) / 2) * 100)
+        cagr_score = _clamp((cagr / 25.0) * 100)
+    pf_score = pf * 20
+
+    n_quant = has_tam.astype(np.float64) + has_cagr
+    quant_max = np.where(
+        has_tam & has_cagr, np.maximum(tam_score, cagr_score),
+        np.where(has_tam, tam_score, cagr_score),
+    )
+    quant_sum = np.where(has_tam, tam_score, 0.0) + np.where(has_cagr, cagr_score, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        quant_avg = quant_sum / n_quant
+    quant_avg = np.where(quant_avg == 0, quant_max, quant_avg)  # `_safe_avg(...) or quant_max`
+    quant = 0.6 * quant_max + 0.4 * quant_avg
+    has_quant = n_quant > 0
+
+    final = np.where(
+        has_pf & has_quant, (quant + pf_score) / 2.0,
+        np.where(has_pf, pf_score, np.where(has_quant, quant, 60.0)),
+    )
+    return np.where(f["market_present"] > 0, _clamp(final), 60.0)
+
+
+def technology_scores(f: Dict[str, np.ndarray]) -> np.ndarray:
+    # scalar와 같은 순서로 누적 (없는 항목은 +0.0이라 합계가 바뀌지 않음)
+    total = np.full(f["tech_present"].shape, 60.0)
+    count = np.ones_like(total)
+
+    def add(mask: np.ndarray, value: np.ndarray) -> None:
+        nonlocal total, count
+        total = total + np.where(mask, value, 0.0)
+        count = count + mask
+
+    for col in ("perf_delta_pct", "speed_delta_pct"):
+        add(_present(f[col]), np.minimum(100, 60 + f[col]))
+    add(_present(f["csat_pct"]), _clamp(f["csat_pct"]))
+
+    has_delta = _present(f["note_delta_pct"])
+    add(has_delta, np.minimum(100, 70 + f["note_delta_pct"]))
+    add(~has_delta & (f["note_claims_sota"] > 0), np.full_like(total, 75.0))
+
+    add(f["checklist_present"] > 0, (f["checklist_sum"] / 5.0) * 100)
+    add(np.ones_like(total, dtype=bool), f["ip_score"])
+    add(f["has_scalability_note"] > 0, np.full_like(total, 75.0))
+
+    return np.where(f["tech_present"] > 0, _clamp(total / count), 60.0)
+
+
+def competition_scores(f: Dict[str, np.ndarray]) -> np.ndarray:
+    diff_n, moat_n, overlap_n = f["diff_n"], f["moat_n"], f["overlap_n"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_diff = f["diff_sum"] / diff_n
+        avg_moat = f["moat_sum"] / moat_n
+        avg_overlap = f["overlap_sum"] / overlap_n
+
+    # `_safe_avg(...) or 60`: 값이 없거나 평균이 0이면 60
+    avg_diff = np.where((diff_n > 0) & (avg_diff != 0), avg_diff, 60.0)
+    avg_moat = np.where((moat_n > 0) & (avg_moat != 0), avg_moat, 60.0)
+    base = np.where((diff_n > 0) | (moat_n > 0), 0.6 * avg_diff + 0.4 * avg_moat, 60.0)
+
+    penalty = np.where(overlap_n > 0, np.maximum(0.0, (avg_overlap - 5.0) * 5.0), 0.0)
+    base_adj = _clamp(base - penalty)
+
+    qpos = f["qual_positioning_0to5"]
+    final = np.where(_present(qpos), _clamp((base_adj + qpos * 20) / 2.0), base_adj)
+    return np.where(f["comp_present"] > 0, final, 60.0)
+
+
+def traction_scores(f: Dict[str, np.ndarray]) -> np.ndarray:
+    arr = f["arr_usd_m"]
+    score = np.where(_present(arr), np.maximum(50.0, np.minimum(100.0, (arr / 50.0) * 100.0)), 60.0)
+    score = score + f["partner_bonus"]
+    score = score + np.where(f["funding_mentioned"] > 0, 5.0, 0.0)
+    return np.where(f["biz_present"] > 0, _clamp(score), 60.0)
+
+
+def risk_penalties(
+    f: Dict[str, np.ndarray],
+    buckets: Sequence[Tuple[float, float]] = RISK_PENALTY_BUCKETS,
+) -> np.ndarray:
+    """리스크 합계가 처음으로 max_val 이하가 되는 구간의 페널티(%) (리스크 없으면 0)"""
+    maxes = np.array([b[0] for b in buckets], dtype=np.float64)
+    pcts = np.append(np.array([b[1] for b in buckets], dtype=np.float64), 0.0)
+    idx = np.searchsorted(maxes, f["risk_agg"], side="left")
+    return np.where(f["risk_present"] > 0, pcts[idx], 0.0)
+
+
+def score_batch(
+    features,
+    weights: Optional[Mapping[str, float]] = None,
+    penalty_buckets: Sequence[Tuple[float, float]] = RISK_PENALTY_BUCKETS,
+    thresholds: Optional[Tuple[float, float]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    영역별 점수 + 가중합 + 페널티 + 판단을 N건에 대해 한 번에 계산
+
+    Args:
+        features: features_from_states 결과 (또는 같은 열을 가진 pandas.DataFrame)
+        weights: 영역별 가중치 (None이면 WEIGHTS)
+        penalty_buckets: [(리스크 합계 상한, 페널티 %), ...] (오름차순)
+        thresholds: (투자 권고 하한, 조건부 투자 권고 하한) (None이면 DECISION_THRESHOLDS)
+
+    Returns:
+        {"market", "technology", "competition", "traction", "deal",
+         "risk_penalty_pct", "total", "adjusted", "status_code", "label"}
+        status_code: 0=투자 권고, 1=조건부 투자 권고, 2=재검토 필요
+    """
+    f = _columns(features)
+    weights = WEIGHTS if weights is None else weights
+
+    components = {
+        "market": market_scores(f),
+        "technology": technology_scores(f),
+        "competition": competition_scores(f),
+        "traction": traction_scores(f),
+        "deal": np.full(f["market_present"].shape, 60.0),
+    }
+
+    total = np.zeros_like(components["deal"])
+    for key in weights:  # scalar와 같은 합산 순서
+        total = total + weights[key] * components[key]
+
+    penalty = risk_penalties(f, penalty_buckets)
+    adjusted = total * (1 - penalty / 100.0)
+
+    floors = list(thresholds) if thresholds is not None else [floor for floor, _, _ in DECISION_THRESHOLDS]
+    status_code = np.select([adjusted >= fl for fl in floors], list(range(len(floors))), default=len(floors))
+
+    return {
+        **components,
+        "risk_penalty_pct": penalty,
+        "total": total,
+        "adjusted": adjusted,
+        "status_code": status_code,
+        "label": LABELS[status_code],
+    }
+
+
+def score_states(states: Sequence[Mapping[str, Any]], **kwargs) -> Dict[str, np.ndarray]:
+    """features_from_states + score_batch"""
+    return score_batch(features_from_states(states), **kwargs)
+
+
+def to_frame(result: Dict[str, np.ndarray], index: Optional[List[Any]] = None):
+    """score_batch 결과를 pandas.DataFrame으로 (pandas 필요)"""
+    import pandas as pd
+    return pd.DataFrame(result, index=index)
+
+
+def verify_against_scalar(states: Sequence[Mapping[str, Any]], atol: float = 1e-9) -> List[int]:
+    """
+    scalar 경로(compute_scores + 리스크 페널티 + decide_status)와 결과가 다른 행 번호 목록
+
+    states는 compute_scores 시점의 정규화 state에 평가기가 만든 risks가 더해진 형태여야 함
+    (파이프라인은 LLM 평가 전에 점수를 계산하므로).
+    """
+    from copy import deepcopy
+
+    from invest_agent.agents.scoring import apply_risk_penalty, compute_scores, decide_status
+
+    result = score_states(states)
+    mismatched: List[int] = []
+    for i, state in enumerate(states):
+        s = compute_scores(deepcopy(dict(state)))
+        scores = s["scores"]
+        total = sum(WEIGHTS[k] * scores[k] for k in WEIGHTS)
+        adjusted = total * (1 - apply_risk_penalty(s) / 100.0)
+        status, note = decide_status(adjusted)
+        expected_code = next(
+            (n for n, (_, st, nt) in enumerate(DECISION_THRESHOLDS) if (st, nt) == (status, note)),
+            len(DECISION_THRESHOLDS),
+        )
+
+        same = all(
+            np.isclose(result[k][i], scores[k], rtol=0.0, atol=atol)
+            for k in ("market", "technology", "competition", "traction", "deal")
+        )
+        same = same and np.isclose(result["adjusted"][i], adjusted, rtol=0.0, atol=atol)
+        if not same or result["status_code"][i] != expected_code:
+            mismatched.append(i)
+    return mismatched
@@ -1,97 +1,17 @@
 # agents/tech.py
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional
 import json
+import logging
 
 from langchain_openai import ChatOpenAI
-from langchain_community.tools.tavily_search import TavilySearchResults
 
-from invest_agent.states import GraphState
+from invest_agent.states import GraphState, source_entry
+from invest_agent.infra.search_cache import tavily_search, atavily_search
 
+logger = logging.getLogger(__name__)
 
-def tech_summary(state: GraphState) -> GraphState:
-    """
-    기술 요약 노드
-    
-    입력:
-        - current_company: 현재 분석 중인 회사명
-        - discovery: 기업 탐색 결과 (items 리스트)
-    
-    출력:
-        - tech: {technology: {...}, meta: {...}}
-        - sources["tech"]: 참고한 출처 URL 리스트
-    """
-    current_company = state.get("current_company", "")
-    discovery_items = state.get("discovery", {}).get("items", [])
-    
-    # 현재 회사 데이터 찾기
-    startup_data = None
-    for item in discovery_items:
-        if item.get("startup_name") == current_company:
-            startup_data = item
-            break
-    
-    if not startup_data:
-        print(f"[기술 요약] 경고: {current_company} 데이터 없음")
-        return {
-            "tech": {
-                "technology": {"technology_summary": "데이터 없음"},
-                "meta": {"startup_name": current_company}
-            }
-        }
-    
-    print(f"[기술 요약] 시작: {current_company}")
-    
-    # ===== 출처 수집 시작 =====
-    tech_sources = []
-    
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
-    
-    # 1. 키워드 추출
-    tech_desc = startup_data.get("technology_description", "")
-    core_tech = startup_data.get("core_technology", "")
-    startup_name = startup_data.get("startup_name", "")
-    
-    keyword_prompt = f"""
-다음 스타트업 정보에서 웹 검색에 최적화된 키워드를 추출해주세요.
-스타트업명: {startup_name}
-기술 설명: {tech_desc}
-핵심 기술: {core_tech}
 
-검색 키워드 (영어, 3-5개 단어):
-"""
-    
-    response = llm.invoke([{"role": "user", "content": keyword_prompt}])
-    keywords = response.content.strip()
-    print(f"  ✓ 키워드: {keywords}")
-    
-    # 2. 웹 검색 (URL 수집 포함)
-    web_content = ""
-    try:
-        search = TavilySearchResults(max_results=3)
-        search_results = search.invoke(keywords)
-        
-        # 콘텐츠 수집
-        web_content = "\n".join([result.get("content", "") for result in search_results])
-        
-        # URL 수집
-        for result in search_results:
-            if result.get("url"):
-                tech_sources.append(result["url"])
-        
-        print(f"  ✓ 웹 검색: {len(search_results)}개 결과")
-        print(f"  ✓ 수집된 URL: {len(tech_sources)}개")
-        
-    except Exception as e:
-        print(f"  ⚠ 웹 검색 실패, fallback 사용: {e}")
-        web_content = f"""
-{keywords} 관련 최신 기술 동향:
-- AI 기술의 급속한 발전
-- 멀티모달 AI 모델의 상용화 가속화
-- 엔터프라이즈 시장에서의 수요 증가
-"""
-    
-    # 3. 웹 결과 요약
-    summary_prompt = """
+SUMMARY_PROMPT = """
 아래 웹 검색 결과에서 기술 분석에 필요한 내용만 추출해주세요.
 
 추출 기준:
@@ -105,16 +25,8 @@ def tech_summary(state: GraphState) -> GraphState:
 
 출력 형식: bullet point
 """
-    
-    web_summary_response = llm.invoke([
-        {"role": "system", "content": summary_prompt},
-        {"role": "user", "content": web_content}
-    ])
-    web_summary = web_summary_response.content
-    print(f"  ✓ 웹 요약 완료")
-    
-    # 4. 최종 JSON 생성
-    system_prompt = """
+
+TECH_SYSTEM_PROMPT = """
 너는 스타트업 기술 분석 전문가입니다.
 주어진 정보를 바탕으로 전문적인 기술 분석을 수행하고, 모든 필드를 의미 있는 내용으로 채워주세요.
 
@@ -147,12 +59,77 @@ JSON 스키마:
   }
 }
 """
-    
+
+
+# ===== 공통 헬퍼 (sync / async 노드가 함께 사용) =====
+
+def _find_startup(state: GraphState) -> Optional[Dict[str, Any]]:
+    """현재 회사 데이터 찾기"""
+    current_company = state.get("current_company", "")
+    for item in state.get("discovery", {}).get("items", []):
+        if item.get("startup_name") == current_company:
+            return item
+    return None
+
+
+def _missing_startup_result(current_company: str) -> GraphState:
+    logger.warning(f"[기술 요약] 경고: {current_company} 데이터 없음")
+    return {
+        "tech": {
+            "technology": {"technology_summary": "데이터 없음"},
+            "meta": {"startup_name": current_company}
+        }
+    }
+
+
+def _keyword_messages(startup_data: Dict[str, Any]) -> List[Dict[str, str]]:
+    keyword_prompt = f"""
+다음 스타트업 정보에서 웹 검색에 최적화된 키워드를 추출해주세요.
+스타트업명: {startup_data.get("startup_name", "")}
+기술 설명: {startup_data.get("technology_description", "")}
+핵심 기술: {startup_data.get("core_technology", "")}
+
+검색 키워드 (영어, 3-5개 단어):
+"""
+    return [{"role": "user", "content": keyword_prompt}]
+
+
+def _collect_search_results(search_results: List[dict], tech_sources: List[str]) -> str:
+    """검색 결과에서 콘텐츠를 모으고 URL은 tech_sources에 추가"""
+    web_content = "\n".join([result.get("content", "") for result in search_results])
+
+    for result in search_results:
+        if result.get("url"):
+            tech_sources.append(result["url"])
+
+    logger.info(f"✓ 웹 검색: {len(search_results)}개 결과")
+    logger.info(f"✓ 수집된 URL: {len(tech_sources)}개")
+    return web_content
+
+
+def _fallback_web_content(keywords: str, error: Exception) -> str:
+    logger.warning(f"⚠ 웹 검색 실패, fallback 사용: {error}")
+    return f"""
+{keywords} 관련 최신 기술 동향:
+- AI 기술의 급속한 발전
+- 멀티모달 AI 모델의 상용화 가속화
+- 엔터프라이즈 시장에서의 수요 증가
+"""
+
+
+def _summary_messages(web_content: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": SUMMARY_PROMPT},
+        {"role": "user", "content": web_content}
+    ]
+
+
+def _final_messages(startup_data: Dict[str, Any], web_summary: str) -> List[Dict[str, str]]:
     user_prompt = f"""
 스타트업 정보:
 - 스타트업명: {startup_data.get('startup_name', '')}
-- 기술 설명: {tech_desc}
-- 핵심 기술: {core_tech}
+- 기술 설명: {startup_data.get("technology_description", "")}
+- 핵심 기술: {startup_data.get("core_technology", "")}
 - 산업: {startup_data.get('industry', '')}
 - 국가: {startup_data.get('country', '')}
 - 설립연도: {startup_data.get('founded_year', '')}
@@ -160,32 +137,34 @@ JSON 스키마:
 [웹 검색 결과 요약]
 {web_summary}
 """
-    
-    final_response = llm.invoke([
-        {"role": "system", "content": system_prompt},
+    return [
+        {"role": "system", "content": TECH_SYSTEM_PROMPT},
         {"role": "user", "content": user_prompt}
-    ])
-    
-    # JSON 파싱
+    ]
+
+
+def _parse_tech_json(content: str, startup_data: Dict[str, Any]) -> Dict[str, Any]:
+    """최종 LLM 응답 JSON 파싱 (실패 시 discovery 데이터로 fallback)"""
     try:
         # 마크다운 코드 블록 제거
-        content = final_response.content.strip()
+        content = content.strip()
         if content.startswith("```"):
             content = content.split("```")[1]
             if content.startswith("json"):
                 content = content[4:]
         content = content.strip()
-        
+
         tech_data = json.loads(content)
-        print(f"  ✓ 기술 요약 완료")
-        
+        logger.info("✓ 기술 요약 완료")
+        return tech_data
+
     except json.JSONDecodeError as e:
-        print(f"  ⚠ JSON 파싱 실패: {e}")
+        logger.warning(f"⚠ JSON 파싱 실패: {e}")
         # fallback
-        tech_data = {
+        return {
             "technology": {
-                "technology_summary": tech_desc,
-                "core_technology": core_tech,
+                "technology_summary": startup_data.get("technology_description", ""),
+                "core_technology": startup_data.get("core_technology", ""),
                 "differentiation": "분석 중",
                 "sota_performance": "N/A",
                 "reproduction_difficulty": "중간",
@@ -195,18 +174,109 @@ JSON 스키마:
                 "tech_risks": ["데이터 품질", "경쟁 심화"]
             },
             "meta": {
-                "startup_name": startup_name,
+                "startup_name": startup_data.get("startup_name", ""),
                 "industry": startup_data.get('industry', ''),
                 "country": startup_data.get('country', ''),
                 "founded_year": startup_data.get('founded_year', '')
             }
         }
-    
-    # ===== State 업데이트 (출처 포함) =====
-    state_sources = state.get("sources", {})
-    state_sources["tech"] = list(set(tech_sources))  # 중복 제거
-    
+
+
+def _tech_update(state: GraphState, tech_data: Dict[str, Any], tech_sources: List[str]) -> GraphState:
+    # ===== State 업데이트 =====
     return {
         "tech": tech_data,
-        "sources": state_sources
-    }
\ No newline at end of file
+        "sources": source_entry(state.get("current_company", ""), "tech", tech_sources)
+    }
+
+
+# ===== 노드 =====
+
+def tech_summary(state: GraphState) -> GraphState:
+    """
+    기술 요약 노드
+
+    입력:
+        - current_company: 현재 분석 중인 회사명
+        - discovery: 기업 탐색 결과 (items 리스트)
+
+    출력:
+        - tech: {technology: {...}, meta: {...}}
+        - sources[current_company]["tech"]: 참고한 출처 URL
+    """
+    current_company = state.get("current_company", "")
+    startup_data = _find_startup(state)
+    if not startup_data:
+        return _missing_startup_result(current_company)
+
+    logger.info(f"[기술 요약] 시작: {current_company}")
+
+    # ===== 출처 수집 시작 =====
+    tech_sources = []
+
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+
+    # 1. 키워드 추출
+    response = llm.invoke(_keyword_messages(startup_data))
+    keywords = response.content.strip()
+    logger.info(f"✓ 키워드: {keywords}")
+
+    # 2. 웹 검색 (URL 수집 포함)
+    try:
+        search_results = tavily_search(keywords, max_results=3)
+        web_content = _collect_search_results(search_results, tech_sources)
+    except Exception as e:
+        web_content = _fallback_web_content(keywords, e)
+
+    # 3. 웹 결과 요약
+    web_summary_response = llm.invoke(_summary_messages(web_content))
+    web_summary = web_summary_response.content
+    logger.info("✓ 웹 요약 완료")
+
+    # 4. 최종 JSON 생성
+    final_response = llm.invoke(_final_messages(startup_data, web_summary))
+    tech_data = _parse_tech_json(final_response.content, startup_data)
+
+    return _tech_update(state, tech_data, tech_sources)
+
+
+async def atech_summary(state: GraphState) -> GraphState:
+    """
+    기술 요약 노드 (async)
+
+    tech_summary와 같은 입력/출력. LLM·웹 검색을 ainvoke로 호출하여
+    이벤트 루프를 막지 않음.
+    """
+    current_company = state.get("current_company", "")
+    startup_data = _find_startup(state)
+    if not startup_data:
+        return _missing_startup_result(current_company)
+
+    logger.info(f"[기술 요약] 시작: {current_company}")
+
+    tech_sources = []
+
+    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
+
+    # 1. 키워드 추출
+    response = await llm.ainvoke(_keyword_messages(startup_data))
+    keywords = response.content.strip()
+    logger.info(f"✓ 키워드: {keywords}")
+
+    # 2. 웹 검색 (URL 수집 포함)
+    try:
+        search_results = await atavily_search(keywords, max_results=3)
+        web_content = _collect_search_results(search_results, tech_sources)
+    except Exception as e:
+        web_content = _fallback_web_content(keywords, e)
+
+    # 3. 웹 결과 요약
+    web_summary_response = await llm.ainvoke(_summary_messages(web_content))
+    web_summary = web_summary_response.content
+    logger.info("✓ 웹 요약 완료")
+
+    # 4. 최종 JSON 생성
+    final_response = await llm.ainvoke(_final_messages(startup_data, web_summary))
+    tech_data = _parse_tech_json(final_response.content, startup_data)
+
+    return _tech_update(state, tech_data, tech_sources)
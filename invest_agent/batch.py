@@ -0,0 +1,364 @@
+# invest_agent/batch.py
+"""
+배치 실행 CLI
+
+JSONL / CSV에 담긴 쿼리(또는 회사 목록)를 워크플로로 일괄 평가함.
+항목별 결과는 결과 JSONL에 한 줄씩 바로 기록되며, 이 파일이 곧 체크포인트라
+중단된 배치를 같은 명령으로 다시 실행하면 이미 성공한 항목은 건너뜀.
+
+입력 형식:
+    JSONL  {"id": "fin-01", "query": "한국 핀테크 생성형 AI 스타트업"}
+           {"id": "watch-01", "companies": ["뤼튼", "업스테이지"]}
+    CSV    id,query,companies   (companies는 ';' 또는 '|'로 구분)
+
+    python -m invest_agent.batch --input jobs.jsonl --output results.jsonl --workers 4
+"""
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .workflow import build_app
+from .infra.checkpoint import make_checkpointer
+from .infra.log import log_context, setup_logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchItem:
+    id: str
+    query: str = ""
+    companies: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchSummary:
+    total: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed / self.processed if self.processed else 0.0
+
+    @property
+    def items_per_minute(self) -> float:
+        return self.processed / self.elapsed_seconds * 60 if self.elapsed_seconds else 0.0
+
+    def latency_percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+# ===== 입력 =====
+
+def _split_companies(raw: Any) -> List[str]:
+    if isinstance(raw, list):
+        return [str(c).strip() for c in raw if str(c).strip()]
+    if not raw:
+        return []
+    for sep in (";", "|"):
+        if sep in raw:
+            return [c.strip() for c in raw.split(sep) if c.strip()]
+    return [raw.strip()]
+
+
+def _item_id(query: str, companies: List[str]) -> str:
+    raw = json.dumps({"query": query, "companies": companies}, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def _to_item(row: Dict[str, Any]) -> Optional[BatchItem]:
+    query = (row.get("query") or "").strip()
+    companies = _split_companies(row.get("companies"))
+    if not query and not companies:
+        return None
+    item_id = str(row.get("id") or "").strip() or _item_id(query, companies)
+    return BatchItem(id=item_id, query=query, companies=companies)
+
+
+def load_items(path: str) -> List[BatchItem]:
+    """JSONL 또는 CSV(확장자로 판단)에서 작업 목록 읽기. id가 중복되면 처음 것만 사용."""
+    rows: List[Dict[str, Any]] = []
+    if path.lower().endswith(".csv"):
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    logger.warning(f"⚠️ {path}:{line_no} JSON 파싱 실패, 건너뜀: {e}")
+
+    items: List[BatchItem] = []
+    seen = set()
+    for row in rows:
+        item = _to_item(row)
+        if item is None or item.id in seen:
+            continue
+        seen.add(item.id)
+        items.append(item)
+    return items
+
+
+def load_completed(path: str, include_failed: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    결과 JSONL에서 처리가 끝난 항목 (id → 레코드)
+
+    기본은 성공한 항목만 반환함 (실패 항목은 재실행 대상). 마지막 줄이 깨져 있어도 무시.
+    """
+    done: Dict[str, Dict[str, Any]] = {}
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") == "ok" or include_failed:
+                done[record["id"]] = record
+    return done
+
+
+# ===== 실행 =====
+
+class ResultWriter:
+    """스레드 안전한 append-only JSONL 기록기 (줄마다 flush + fsync)"""
+
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._f = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self._lock:
+            self._f.write(line + "\n")
+            self._f.flush()
+            os.fsync(self._f.fileno())
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def _initial_state(item: BatchItem, report_config: Dict[str, Any]) -> Dict[str, Any]:
+    state: Dict[str, Any] = {
+        "query": item.query,
+        "report_config": dict(report_config),
+    }
+    if item.companies:
+        state["target_companies"] = item.companies
+    return state
+
+
+def _result_record(item: BatchItem, out: Dict[str, Any], elapsed: float) -> Dict[str, Any]:
+    decisions = {
+        company: {
+            "label": d.get("label"),
+            "total_100": d.get("total_100"),
+            "component_scores": d.get("component_scores", {}),
+            "red_flags": d.get("red_flags", []),
+        }
+        for company, d in (out.get("decisions") or {}).items()
+    }
+    return {
+        "id": item.id,
+        "status": "ok",
+        "query": item.query,
+        "companies": out.get("companies", []),
+        "decisions": decisions,
+        # HTML 본문은 산출물 저장소에 있으므로 결과 파일에는 handle만 남김
+        "reports": [
+            {"company": r.get("company"), "pdf": r.get("pdf"), "html_artifact": r.get("html_artifact")}
+            for r in out.get("reports", [])
+        ],
+        "elapsed_seconds": round(elapsed, 2),
+        "finished_at": datetime.now().isoformat(),
+    }
+
+
+def run_item(runner, item: BatchItem, report_config: Dict[str, Any], checkpointer=None) -> Dict[str, Any]:
+    """
+    항목 하나 실행 (예외는 error 레코드로 변환)
+
+    thread_id가 항목 id로 고정되어 있어, 체크포인터를 쓰면 이전에 실패한 항목은
+    마지막으로 완료된 노드부터 이어서 실행됨. 성공한 항목의 thread는 바로 삭제함
+    (남겨 두면 배치가 길어질수록 체크포인트가 쌓이고, 같은 항목을 다시 실행할 때
+    이전 결과가 reducer로 새 결과에 섞임).
+    """
+    started = time.perf_counter()
+    thread_id = f"batch-{item.id}"
+    config = {"configurable": {"thread_id": thread_id}}
+    try:
+        # 이 항목에서 남긴 로그에는 run_id=항목 id가 붙음
+        with log_context(run_id=item.id):
+            state = _initial_state(item, report_config)
+            if checkpointer is not None:
+                snapshot = runner.get_state(config)
+                if snapshot.next:
+                    logger.info(f"[배치] 🔁 {item.id}: {list(snapshot.next)}부터 재개")
+                    state = None
+                elif snapshot.values:
+                    # 이미 끝난 thread → 새로 실행
+                    checkpointer.delete_thread(thread_id)
+            out = runner.invoke(state, config=config)
+            if checkpointer is not None:
+                checkpointer.delete_thread(thread_id)
+        return _result_record(item, out, time.perf_counter() - started)
+    except Exception as e:
+        return {
+            "id": item.id,
+            "status": "error",
+            "query": item.query,
+            "companies": item.companies,
+            "error": f"{type(e).__name__}: {e}",
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            "finished_at": datetime.now().isoformat(),
+        }
+
+
+def run_batch(
+    items: List[BatchItem],
+    output_path: str,
+    workers: int = 4,
+    parallel: bool = False,
+    max_concurrency: Optional[int] = None,
+    report_config: Optional[Dict[str, Any]] = None,
+    retry_failed: bool = True,
+    checkpoint_db: Optional[str] = None,
+) -> BatchSummary:
+    """
+    작업 목록 실행
+
+    Args:
+        items: 작업 목록
+        output_path: 결과 JSONL (재실행 시 체크포인트로 사용)
+        workers: 동시에 실행할 항목 수
+        parallel: 항목 내부에서도 회사별 병렬 분석 사용
+        max_concurrency: 항목 내부 동시 작업 수 상한
+        report_config: 모든 항목에 공통으로 넣을 report_config
+        retry_failed: False면 이전에 실패한 항목도 건너뜀
+        checkpoint_db: SQLite 체크포인트 파일 (기본 INVEST_AGENT_CHECKPOINT_DB, 실패 항목을 노드 단위로 재개;
+            없으면 체크포인터 없이 실행)
+    """
+    summary = BatchSummary(total=len(items))
+    completed = load_completed(output_path, include_failed=not retry_failed)
+
+    pending = [item for item in items if item.id not in completed]
+    summary.skipped = len(items) - len(pending)
+    if summary.skipped:
+        logger.info(f"⏭️ 이미 처리된 {summary.skipped}개 항목은 건너뜁니다.")
+
+    # 재개할 수 없는 MemorySaver는 항목마다 전체 체크포인트를 메모리에 쌓기만 하므로 쓰지 않음
+    checkpoint_db = checkpoint_db or os.getenv("INVEST_AGENT_CHECKPOINT_DB")
+    checkpointer = make_checkpointer(checkpoint_db) if checkpoint_db else None
+    runner = build_app(
+        parallel=parallel,
+        max_concurrency=max_concurrency,
+        checkpointer=checkpointer if checkpointer is not None else False,
+    )
+    writer = ResultWriter(output_path)
+    started = time.perf_counter()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(run_item, runner, item, report_config or {}, checkpointer): item
+                for item in pending
+            }
+            for n, future in enumerate(as_completed(futures), start=1):
+                record = future.result()
+                writer.write(record)
+                summary.latencies.append(record["elapsed_seconds"])
+                if record["status"] == "ok":
+                    summary.succeeded += 1
+                    logger.info(f"[배치] {n}/{len(pending)} ✅ {record['id']} ({record['elapsed_seconds']}s)")
+                else:
+                    summary.failed += 1
+                    logger.error(f"[배치] {n}/{len(pending)} ❌ {record['id']}: {record['error']}")
+    finally:
+        summary.elapsed_seconds = time.perf_counter() - started
+        writer.close()
+
+    return summary
+
+
+def print_summary(summary: BatchSummary) -> None:
+    print("\n" + "=" * 60)
+    print("📊 배치 실행 요약")
+    print("=" * 60)
+    print(f"  전체: {summary.total}개 (건너뜀 {summary.skipped}개)")
+    print(f"  처리: {summary.processed}개 — 성공 {summary.succeeded} / 실패 {summary.failed}")
+    print(f"  오류율: {summary.error_rate:.1%}")
+    print(f"  소요 시간: {summary.elapsed_seconds:.1f}s")
+    print(f"  처리량: {summary.items_per_minute:.2f}개/분")
+    print(f"  지연: p50 {summary.latency_percentile(50):.1f}s / p95 {summary.latency_percentile(95):.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="InvestAgent 배치 실행")
+    parser.add_argument("--input", required=True, help="작업 목록 (JSONL 또는 CSV)")
+    parser.add_argument("--output", default="outputs/batch_results.jsonl", help="결과 JSONL (체크포인트 겸용)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 실행할 항목 수")
+    parser.add_argument("--parallel", action="store_true", help="항목 내부에서 회사별 병렬 분석")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="항목 내부 동시 작업 수 상한")
+    parser.add_argument("--out-dir", default="outputs", help="보고서 출력 디렉터리")
+    parser.add_argument("--renderer", default="none", help="보고서 렌더러 (playwright / pdfkit / none)")
+    parser.add_argument("--chart-backend", default="svg", choices=["svg", "matplotlib"], help="보고서 차트 생성 방식")
+    parser.add_argument("--stream-html", action="store_true", help="보고서 HTML을 메모리 대신 파일로 스트리밍")
+    parser.add_argument("--skip-failed", action="store_true", help="이전에 실패한 항목도 다시 실행하지 않음")
+    parser.add_argument("--checkpoint-db", default=None, help="SQLite 체크포인트 파일 (실패 항목을 중단 지점부터 재개)")
+    parser.add_argument("--log-format", default=None, choices=["text", "json"], help="로그 형식 (기본 INVEST_AGENT_LOG_FORMAT 또는 text)")
+    parser.add_argument("--log-file", default=None, help="로그를 추가로 기록할 파일")
+    args = parser.parse_args()
+    setup_logging(fmt=args.log_format, log_file=args.log_file)
+
+    items = load_items(args.input)
+    print(f"📥 작업 {len(items)}개 로드: {args.input}")
+
+    summary = run_batch(
+        items,
+        args.output,
+        workers=args.workers,
+        parallel=args.parallel,
+        max_concurrency=args.max_concurrency,
+        report_config={
+            "out_dir": args.out_dir,
+            "renderer": args.renderer,
+            "stream_html": args.stream_html,
+            "chart_backend": args.chart_backend,
+        },
+        retry_failed=not args.skip_failed,
+        checkpoint_db=args.checkpoint_db,
+    )
+    print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
+
+# python -m invest_agent.batch --input jobs.jsonl --output outputs/batch_results.jsonl --workers 4
+# python -m invest_agent.batch --input watchlist.csv --workers 2 --parallel --max-concurrency 3
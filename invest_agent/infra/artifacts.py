@@ -0,0 +1,126 @@
+# invest_agent/infra/artifacts.py
+"""
+content-addressed 산출물 저장소
+
+보고서 HTML처럼 큰 산출물은 디스크에 sha256 이름으로 저장하고, 그래프 state에는
+가벼운 handle만 넣음 → 이후 노드 복사·체크포인트 직렬화 비용이 본문 크기와 무관해짐.
+같은 내용은 한 번만 저장되며, 본문은 load_text / load_report_html로 필요할 때만 읽음.
+
+    <root>/<sha256 앞 2자리>/<sha256><suffix>
+
+handle 형식:
+    {"path", "sha256", "size", "render_seconds", "created_at"}
+
+환경 변수:
+    INVEST_AGENT_ARTIFACT_DIR  저장소 루트 (지정하면 호출 측 root보다 우선, 기본 outputs/artifacts)
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+DEFAULT_ARTIFACT_DIR = "outputs/artifacts"
+
+
+class ArtifactWriter:
+    """
+    쓰면서 sha256을 계산하는 파일 writer (with 블록이 끝나면 내용 주소로 이동)
+
+    큰 HTML을 문자열로 만들지 않고 조각 단위로 저장할 때 사용.
+    """
+
+    def __init__(self, store: "ArtifactStore", suffix: str, render_seconds: Optional[float] = None):
+        self._store = store
+        self._suffix = suffix
+        self._hash = hashlib.sha256()
+        self._size = 0
+        fd, self._tmp_path = tempfile.mkstemp(dir=store.root, prefix=".tmp-", suffix=suffix)
+        self._f = os.fdopen(fd, "wb")
+        self.render_seconds = render_seconds
+        self.handle: Optional[Dict[str, Any]] = None
+
+    def write(self, chunk: str) -> None:
+        data = chunk.encode("utf-8")
+        self._hash.update(data)
+        self._size += len(data)
+        self._f.write(data)
+
+    def __enter__(self) -> "ArtifactWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._f.close()
+        if exc_type is not None:
+            os.unlink(self._tmp_path)
+            return
+        self.handle = self._store._commit(
+            self._tmp_path, self._hash.hexdigest(), self._size, self._suffix, self.render_seconds
+        )
+
+
+class ArtifactStore:
+    def __init__(self, root: str = DEFAULT_ARTIFACT_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, sha256: str, suffix: str) -> str:
+        return os.path.join(self.root, sha256[:2], f"{sha256}{suffix}")
+
+    def _commit(
+        self, tmp_path: str, sha256: str, size: int, suffix: str, render_seconds: Optional[float]
+    ) -> Dict[str, Any]:
+        path = self.path_for(sha256, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            os.unlink(tmp_path)  # 같은 내용이 이미 있음
+        else:
+            os.replace(tmp_path, path)
+        return {
+            "path": path,
+            "sha256": sha256,
+            "size": size,
+            "render_seconds": round(render_seconds, 3) if render_seconds is not None else None,
+            "created_at": datetime.now().isoformat(),
+        }
+
+    def writer(self, suffix: str = ".html", render_seconds: Optional[float] = None) -> ArtifactWriter:
+        return ArtifactWriter(self, suffix, render_seconds)
+
+    def put_text(self, text: str, suffix: str = ".html", render_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """문자열 저장 → handle"""
+        with self.writer(suffix, render_seconds) as w:
+            w.write(text)
+        return w.handle
+
+
+def load_text(handle: Dict[str, Any], verify: bool = False) -> str:
+    """handle의 본문 읽기 (verify=True면 sha256 확인)"""
+    with open(handle["path"], "rb") as f:
+        data = f.read()
+    if verify and hashlib.sha256(data).hexdigest() != handle.get("sha256"):
+        raise ValueError(f"산출물 내용이 handle과 다릅니다: {handle['path']}")
+    return data.decode("utf-8")
+
+
+def load_report_html(report: Dict[str, Any]) -> Optional[str]:
+    """보고서 항목의 HTML (handle이면 디스크에서 읽고, 예전 형식의 인라인 html도 지원)"""
+    if report.get("html_artifact"):
+        return load_text(report["html_artifact"])
+    return report.get("html")
+
+
+_stores: Dict[str, ArtifactStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_artifact_store(root: Optional[str] = None) -> ArtifactStore:
+    """루트 디렉터리당 공유 저장소"""
+    root = os.path.abspath(os.getenv("INVEST_AGENT_ARTIFACT_DIR") or root or DEFAULT_ARTIFACT_DIR)
+    with _stores_lock:
+        store = _stores.get(root)
+        if store is None:
+            store = ArtifactStore(root)
+            _stores[root] = store
+        return store
@@ -0,0 +1,203 @@
+# invest_agent/infra/cache_store.py
+"""
+SQLite 기반 key → bytes 캐시 저장소
+
+LLM 응답 캐시와 웹 검색 캐시가 공통으로 사용. TTL 만료, 항목 수/용량 기준
+LRU 축출, hit/miss 카운터를 제공하며 여러 스레드에서 동시에 사용해도 안전함.
+"""
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class CacheRecord:
+    value: bytes
+    created_at: float
+    expires_at: Optional[float]
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.created_at
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return self.expires_at is not None and (now or time.time()) >= self.expires_at
+
+
+class SQLiteCacheStore:
+    """
+    Args:
+        path: SQLite 파일 경로
+        table: 테이블 이름 (한 파일에 여러 캐시를 둘 때 구분용)
+        ttl_seconds: 기본 TTL (None이면 만료 없음)
+        max_entries: 최대 항목 수 (초과 시 가장 오래 접근하지 않은 항목부터 삭제)
+        max_bytes: 최대 값 크기 합계
+        evict_every: set 호출 몇 번마다 축출을 검사할지
+    """
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "cache",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        evict_every: int = 64,
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"잘못된 테이블 이름: {table}")
+        self.path = path
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evict_every = max(1, evict_every)
+
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " expires_at REAL)"
+        )
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table}(accessed_at)")
+
+    # ----- 조회 -----
+
+    def get_record(self, key: str) -> Optional[CacheRecord]:
+        """만료 여부와 관계없이 레코드 반환 (카운터는 갱신하지 않음)"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, created_at, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return CacheRecord(value=row[0], created_at=row[1], expires_at=row[2])
+
+    def get(self, key: str) -> Optional[bytes]:
+        """만료되지 않은 값 반환. 접근 시각을 갱신해 LRU 순서에 반영."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, expires_at = row
+            if expires_at is not None and now >= expires_at:
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return value
+
+    def touch(self, key: str, hit: bool = True) -> None:
+        """get_record로 직접 판단한 경우 카운터/접근 시각 반영"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+                self._conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            else:
+                self.misses += 1
+
+    # ----- 저장 -----
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = now + ttl if ttl else None
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, size, created_at, accessed_at, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now, expires_at),
+            )
+            self._writes_since_evict += 1
+            if self._writes_since_evict >= self.evict_every:
+                self._writes_since_evict = 0
+                self._evict_locked(now)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    # ----- 축출 -----
+
+    def evict(self) -> int:
+        """만료 항목 삭제 후 용량 한도까지 LRU 삭제. 삭제된 항목 수 반환."""
+        with self._lock:
+            return self._evict_locked(time.time())
+
+    def _evict_locked(self, now: float) -> int:
+        removed = self._conn.execute(
+            f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        ).rowcount
+
+        count, total = self._conn.execute(f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}").fetchone()
+        over_entries = count - self.max_entries if self.max_entries else 0
+        if over_entries > 0:
+            removed += self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN"
+                f" (SELECT key FROM {self.table} ORDER BY accessed_at ASC LIMIT ?)",
+                (over_entries,),
+            ).rowcount
+
+        if self.max_bytes:
+            count, total = self._conn.execute(f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}").fetchone()
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                freed = 0
+                victims = []
+                for key, size in self._conn.execute(f"SELECT key, size FROM {self.table} ORDER BY accessed_at ASC"):
+                    victims.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                self._conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", victims)
+                removed += len(victims)
+
+        self.evictions += removed
+        return removed
+
+    # ----- 통계 -----
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self._conn.execute(f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
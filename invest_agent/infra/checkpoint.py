@@ -0,0 +1,384 @@
+# invest_agent/infra/checkpoint.py
+"""
+SQLite 기반 LangGraph 체크포인터
+
+MemorySaver와 달리 상태를 디스크에 저장하므로, 프로세스가 죽어도 같은 thread_id로
+마지막으로 완료된 노드부터 이어서 실행할 수 있음
+(app.invoke(None, {"configurable": {"thread_id": ...}})).
+체크포인트/중간 쓰기 blob은 zlib으로 압축하고, 오래된 체크포인트는 주기적으로 정리함.
+
+보존 정책:
+    keep_last     thread(+namespace)별로 최근 N개 체크포인트만 유지 (None이면 전부)
+    max_age_days  마지막 체크포인트가 이 기간보다 오래된 thread는 통째로 삭제
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+
+try:
+    from langgraph.checkpoint.base import get_checkpoint_metadata
+except ImportError:
+    def get_checkpoint_metadata(config: RunnableConfig, metadata: CheckpointMetadata) -> CheckpointMetadata:
+        return metadata
+
+logger = logging.getLogger(__name__)
+
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS checkpoints ("
+    " thread_id TEXT NOT NULL,"
+    " checkpoint_ns TEXT NOT NULL DEFAULT '',"
+    " checkpoint_id TEXT NOT NULL,"
+    " parent_checkpoint_id TEXT,"
+    " type TEXT,"
+    " checkpoint BLOB,"
+    " metadata_type TEXT,"
+    " metadata BLOB,"
+    " created_at REAL NOT NULL,"
+    " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))",
+    "CREATE TABLE IF NOT EXISTS writes ("
+    " thread_id TEXT NOT NULL,"
+    " checkpoint_ns TEXT NOT NULL DEFAULT '',"
+    " checkpoint_id TEXT NOT NULL,"
+    " task_id TEXT NOT NULL,"
+    " task_path TEXT NOT NULL DEFAULT '',"
+    " idx INTEGER NOT NULL,"
+    " channel TEXT NOT NULL,"
+    " type TEXT,"
+    " value BLOB,"
+    " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx))",
+    "CREATE INDEX IF NOT EXISTS checkpoints_created ON checkpoints(created_at)",
+)
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """
+    Args:
+        path: SQLite 파일 경로
+        keep_last: thread별 보존할 체크포인트 수 (None이면 제한 없음)
+        max_age_days: 이 기간 동안 갱신되지 않은 thread 삭제 (None이면 제한 없음)
+        prune_every: put 호출 몇 번마다 정리를 실행할지
+        compress_level: zlib 압축 수준 (0이면 압축하지 않음)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        keep_last: Optional[int] = 20,
+        max_age_days: Optional[float] = 14,
+        prune_every: int = 50,
+        compress_level: int = 6,
+        serde=None,
+    ):
+        super().__init__(serde=serde)
+        self.path = path
+        self.keep_last = keep_last
+        self.max_age_days = max_age_days
+        self.prune_every = max(1, prune_every)
+        self.compress_level = compress_level
+
+        self._lock = threading.Lock()
+        self._puts_since_prune = 0
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for stmt in _SCHEMA:
+            self._conn.execute(stmt)
+
+    # ===== 직렬화 =====
+
+    def _dump(self, obj: Any) -> Tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        if self.compress_level:
+            data = zlib.compress(data, self.compress_level)
+        return type_, data
+
+    def _load(self, type_: str, data: bytes) -> Any:
+        if self.compress_level:
+            data = zlib.decompress(data)
+        return self.serde.loads_typed((type_, data))
+
+    # ===== 조회 =====
+
+    def _pending_writes(self, thread_id: str, ns: str, checkpoint_id: str) -> List[Tuple[str, str, Any]]:
+        rows = self._conn.execute(
+            "SELECT task_id, channel, type, value FROM writes"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?"
+            " ORDER BY task_id, idx",
+            (thread_id, ns, checkpoint_id),
+        ).fetchall()
+        return [(task_id, channel, self._load(type_, value)) for task_id, channel, type_, value in rows]
+
+    def _to_tuple(self, row) -> CheckpointTuple:
+        thread_id, ns, checkpoint_id, parent_id, type_, blob, m_type, m_blob = row
+        parent_config = None
+        if parent_id:
+            parent_config = {
+                "configurable": {"thread_id": thread_id, "checkpoint_ns": ns, "checkpoint_id": parent_id}
+            }
+        return CheckpointTuple(
+            config={"configurable": {"thread_id": thread_id, "checkpoint_ns": ns, "checkpoint_id": checkpoint_id}},
+            checkpoint=self._load(type_, blob),
+            metadata=self._load(m_type, m_blob),
+            parent_config=parent_config,
+            pending_writes=self._pending_writes(thread_id, ns, checkpoint_id),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+
+        columns = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,"
+            " type, checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        with self._lock:
+            if checkpoint_id:
+                row = self._conn.execute(
+                    columns + " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    columns + " WHERE thread_id = ? AND checkpoint_ns = ?"
+                    " ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, ns),
+                ).fetchone()
+            return self._to_tuple(row) if row else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        where, params = [], []
+        if config is not None:
+            configurable = config["configurable"]
+            where.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            if configurable.get("checkpoint_ns") is not None:
+                where.append("checkpoint_ns = ?")
+                params.append(configurable["checkpoint_ns"])
+            if get_checkpoint_id(config):
+                where.append("checkpoint_id = ?")
+                params.append(get_checkpoint_id(config))
+        if before is not None and get_checkpoint_id(before):
+            where.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,"
+            " type, checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            results = []
+            for row in rows:
+                tup = self._to_tuple(row)
+                # metadata 필터는 압축 blob 안에 있으므로 파이썬에서 적용
+                if filter and not all(tup.metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                results.append(tup)
+                if limit is not None and len(results) >= limit:
+                    break
+        yield from results
+
+    # ===== 기록 =====
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        ns = configurable.get("checkpoint_ns", "")
+        parent_id = configurable.get("checkpoint_id")
+
+        type_, blob = self._dump(checkpoint)
+        m_type, m_blob = self._dump(get_checkpoint_metadata(config, metadata))
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints"
+                " (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id,"
+                "  type, checkpoint, metadata_type, metadata, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, ns, checkpoint["id"], parent_id, type_, blob, m_type, m_blob, time.time()),
+            )
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= self.prune_every:
+                self._puts_since_prune = 0
+                self._prune_locked()
+
+        return {"configurable": {"thread_id": thread_id, "checkpoint_ns": ns, "checkpoint_id": checkpoint["id"]}}
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+
+        # 특수 채널(에러/인터럽트 등)은 같은 자리에 덮어쓰고, 일반 쓰기는 처음 것을 유지
+        verb = "INSERT OR REPLACE" if all(w[0] in WRITES_IDX_MAP for w in writes) else "INSERT OR IGNORE"
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            type_, blob = self._dump(value)
+            rows.append((
+                thread_id, ns, checkpoint_id, task_id, task_path,
+                WRITES_IDX_MAP.get(channel, idx), channel, type_, blob,
+            ))
+
+        with self._lock:
+            self._conn.executemany(
+                f"{verb} INTO writes"
+                " (thread_id, checkpoint_ns, checkpoint_id, task_id, task_path, idx, channel, type, value)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            self._conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+
+    # ===== 보존/정리 =====
+
+    def _prune_locked(self) -> int:
+        removed = 0
+        if self.max_age_days is not None:
+            cutoff = time.time() - self.max_age_days * 24 * 3600
+            stale = [
+                t for (t,) in self._conn.execute(
+                    "SELECT thread_id FROM checkpoints GROUP BY thread_id HAVING MAX(created_at) < ?",
+                    (cutoff,),
+                )
+            ]
+            for thread_id in stale:
+                removed += self._conn.execute(
+                    "DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,)
+                ).rowcount
+                self._conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+
+        if self.keep_last:
+            # checkpoint_id는 시간순 정렬되는 uuid6이므로 ID 순서로 최근 N개를 남김
+            removed += self._conn.execute(
+                "DELETE FROM checkpoints WHERE rowid IN ("
+                " SELECT rowid FROM ("
+                "  SELECT rowid, ROW_NUMBER() OVER ("
+                "   PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC) AS rn"
+                "  FROM checkpoints)"
+                " WHERE rn > ?)",
+                (self.keep_last,),
+            ).rowcount
+            self._conn.execute(
+                "DELETE FROM writes WHERE NOT EXISTS ("
+                " SELECT 1 FROM checkpoints c WHERE c.thread_id = writes.thread_id"
+                " AND c.checkpoint_ns = writes.checkpoint_ns AND c.checkpoint_id = writes.checkpoint_id)"
+            )
+        return removed
+
+    def prune(self) -> int:
+        """보존 정책에 따라 오래된 체크포인트 삭제 (삭제된 체크포인트 수 반환)"""
+        with self._lock:
+            removed = self._prune_locked()
+        if removed:
+            logger.info(f"[체크포인트] 오래된 체크포인트 {removed}개 정리")
+        return removed
+
+    def vacuum(self) -> None:
+        """삭제 후 파일 크기 회수"""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ===== async (sqlite3는 블로킹이므로 스레드로 위임) =====
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+def make_checkpointer(path: Optional[str] = None, **kwargs):
+    """
+    체크포인터 선택
+
+    path(또는 INVEST_AGENT_CHECKPOINT_DB)가 있으면 SQLiteCheckpointSaver, 없으면 MemorySaver.
+    """
+    path = path or os.getenv("INVEST_AGENT_CHECKPOINT_DB")
+    if not path:
+        from langgraph.checkpoint.memory import MemorySaver
+        return MemorySaver()
+    return SQLiteCheckpointSaver(path, **kwargs)
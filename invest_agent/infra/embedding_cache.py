@@ -0,0 +1,268 @@
+# invest_agent/infra/embedding_cache.py
+"""
+청크 단위 임베딩 캐시
+
+sha256(model_id + 청크 텍스트)를 키로 float32 벡터를 저장함.
+벡터는 모델별 memmap 파일(<hash>.f32)에 행 단위로 이어 붙이고,
+키 → 행 번호 매핑은 SQLite(index.sqlite)에 저장함.
+같은 기사가 다음 날 다시 검색되어도 모델을 다시 호출하지 않음.
+
+환경 변수:
+    INVEST_AGENT_EMBEDDING_CACHE  캐시 디렉터리 (기본 .cache/embeddings, "off"면 비활성)
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from invest_agent.infra.embeddings import DEFAULT_EMBEDDING_MODEL, BgeEmbeddings, get_embeddings
+from invest_agent.infra.profiling import span
+
+DEFAULT_EMBEDDING_CACHE_DIR = ".cache/embeddings"
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 조회를 나눔
+_LOOKUP_BATCH = 500
+
+
+class EmbeddingVectorCache:
+    """한 모델(model_id)의 content-addressed 벡터 저장소"""
+
+    def __init__(self, directory: str, model_id: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.model_id = model_id
+
+        slug = hashlib.sha256(model_id.encode("utf-8")).hexdigest()[:16]
+        self._vec_path = self.directory / f"{slug}.f32"
+        self._vec_path.touch(exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.directory / "index.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY, model TEXT NOT NULL, row INTEGER NOT NULL, dim INTEGER NOT NULL)"
+        )
+        self._conn.commit()
+
+        row = self._conn.execute(
+            "SELECT dim FROM embeddings WHERE model = ? LIMIT 1", (model_id,)
+        ).fetchone()
+        self.dim: Optional[int] = row[0] if row else None
+
+        self._view: Optional[np.memmap] = None
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_id}\0{text}".encode("utf-8")).hexdigest()
+
+    def _row_count(self) -> int:
+        if not self.dim:
+            return 0
+        return self._vec_path.stat().st_size // (self.dim * 4)
+
+    def _rows_view(self, needed_rows: int) -> np.memmap:
+        """needed_rows까지 읽을 수 있는 memmap (파일이 커졌으면 다시 매핑)"""
+        if self._view is None or self._view.shape[0] < needed_rows:
+            self._view = np.memmap(
+                self._vec_path, dtype=np.float32, mode="r",
+                shape=(self._row_count(), self.dim),
+            )
+        return self._view
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """텍스트별 캐시된 벡터 (없으면 None)"""
+        keys = [self.key(t) for t in texts]
+        rows: Dict[str, int] = {}
+        with self._lock:
+            for i in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[i:i + _LOOKUP_BATCH]
+                marks = ",".join("?" * len(batch))
+                for key, row in self._conn.execute(
+                    f"SELECT key, row FROM embeddings WHERE key IN ({marks})", batch
+                ):
+                    rows[key] = row
+
+            out: List[Optional[np.ndarray]] = [None] * len(keys)
+            if rows:
+                view = self._rows_view(max(rows.values()) + 1)
+                for i, key in enumerate(keys):
+                    if key in rows:
+                        out[i] = np.array(view[rows[key]])
+
+            found = sum(v is not None for v in out)
+            self.hits += found
+            self.misses += len(out) - found
+        return out
+
+    def put_many(self, texts: Sequence[str], vectors: np.ndarray) -> None:
+        """새 벡터 저장 (이미 있는 키는 무시)"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(texts) != vectors.shape[0]:
+            raise ValueError("texts와 vectors의 개수가 맞지 않습니다.")
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+            elif self.dim != vectors.shape[1]:
+                raise ValueError(f"임베딩 차원 불일치: {self.dim} != {vectors.shape[1]}")
+
+            keys = [self.key(t) for t in texts]
+            existing = set()
+            for i in range(0, len(keys), _LOOKUP_BATCH):
+                batch = keys[i:i + _LOOKUP_BATCH]
+                marks = ",".join("?" * len(batch))
+                existing.update(
+                    k for (k,) in self._conn.execute(
+                        f"SELECT key FROM embeddings WHERE key IN ({marks})", batch
+                    )
+                )
+
+            picked: List[int] = []
+            for i, key in enumerate(keys):
+                if key not in existing:
+                    existing.add(key)
+                    picked.append(i)
+            if not picked:
+                return
+
+            # 벡터를 먼저 기록하고 인덱스를 나중에 커밋 → 중단되어도 잘못된 행을 가리키지 않음
+            start_row = self._row_count()
+            with open(self._vec_path, "ab") as f:
+                f.write(vectors[picked].tobytes())
+
+            self._conn.executemany(
+                "INSERT INTO embeddings (key, model, row, dim) VALUES (?, ?, ?, ?)",
+                [(keys[i], self.model_id, start_row + n, self.dim) for n, i in enumerate(picked)],
+            )
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            "vectors": self._row_count(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._view = None
+            self._conn.close()
+
+
+_vector_caches: Dict[Tuple[str, str], EmbeddingVectorCache] = {}
+_vector_caches_lock = threading.Lock()
+
+
+def get_vector_cache(directory: str, model_id: str) -> EmbeddingVectorCache:
+    """(디렉터리, model_id)당 하나의 저장소 (같은 파일에 여러 writer가 생기지 않도록)"""
+    key = (os.path.abspath(directory), model_id)
+    with _vector_caches_lock:
+        cache = _vector_caches.get(key)
+        if cache is None:
+            cache = EmbeddingVectorCache(directory, model_id)
+            _vector_caches[key] = cache
+        return cache
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    BgeEmbeddings 앞단의 캐시
+
+    embed_documents / encode는 캐시에 없는 청크만 모델로 계산함.
+    쿼리 임베딩은 건마다 새로 들어오는 짧은 문장이라 그대로 모델에 위임함.
+    """
+
+    def __init__(self, base: BgeEmbeddings, directory: str):
+        self.base = base
+        self.directory = directory
+        self._caches: Dict[bool, EmbeddingVectorCache] = {}
+
+    @property
+    def model(self):
+        return self.base.model
+
+    @property
+    def model_name(self) -> str:
+        return self.base.model_name
+
+    def _cache_for(self, normalize: bool) -> EmbeddingVectorCache:
+        cache = self._caches.get(normalize)
+        if cache is None:
+            model_id = f"{self.base.model_name}|normalize={bool(normalize)}"
+            cache = get_vector_cache(self.directory, model_id)
+            self._caches[normalize] = cache
+        return cache
+
+    def _encode_cached(self, texts: List[str], normalize: bool, **kwargs) -> np.ndarray:
+        cache = self._cache_for(normalize)
+        with span("embed", kind="embedding", model=self.base.model_name, texts=len(texts)) as s:
+            cached = cache.get_many(texts)
+            missing = [i for i, v in enumerate(cached) if v is None]
+            s.set(cached=len(texts) - len(missing), cache_hit=not missing)
+
+            if missing:
+                miss_texts = [texts[i] for i in missing]
+                fresh = np.asarray(
+                    self.base.model.encode(miss_texts, normalize_embeddings=normalize, **kwargs),
+                    dtype=np.float32,
+                )
+                cache.put_many(miss_texts, fresh)
+                for i, vec in zip(missing, fresh):
+                    cached[i] = vec
+
+        if not texts:
+            return np.zeros((0, cache.dim or 0), dtype=np.float32)
+        return np.vstack(cached).astype(np.float32, copy=False)
+
+    def encode(self, texts, **kwargs):
+        """SentenceTransformer.encode 호환 (리스트 입력만 캐시, numpy 배열 반환)"""
+        normalize = kwargs.pop("normalize_embeddings", self.base.normalize)
+        if isinstance(texts, str):
+            return self.base.encode(texts, normalize_embeddings=normalize, **kwargs)
+        return self._encode_cached(list(texts), normalize, **kwargs)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._encode_cached(list(texts), self.base.normalize).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.base.embed_query(text)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {c.model_id: c.stats() for c in self._caches.values()}
+
+
+_cached: Dict[Tuple[str, str, bool], CachedEmbeddings] = {}
+_cached_lock = threading.Lock()
+
+
+def get_cached_embeddings(
+    model_name: str = DEFAULT_EMBEDDING_MODEL,
+    device: str = "cpu",
+    normalize: bool = True,
+) -> Embeddings:
+    """
+    get_embeddings와 같은 인자로 캐시가 붙은 임베딩 반환
+
+    INVEST_AGENT_EMBEDDING_CACHE=off면 공유 BgeEmbeddings를 그대로 반환함.
+    """
+    base = get_embeddings(model_name=model_name, device=device, normalize=normalize)
+    directory = os.getenv("INVEST_AGENT_EMBEDDING_CACHE", DEFAULT_EMBEDDING_CACHE_DIR)
+    if directory.lower() in {"", "0", "off", "false", "none"}:
+        return base
+
+    key = (model_name, device, normalize)
+    with _cached_lock:
+        emb = _cached.get(key)
+        if emb is None:
+            emb = CachedEmbeddings(base, directory)
+            _cached[key] = emb
+        return emb
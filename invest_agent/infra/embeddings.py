@@ -0,0 +1,144 @@
+# invest_agent/infra/embeddings.py
+"""
+프로세스 단위 임베딩 모델 레지스트리
+
+discovery / market / competitor 에이전트와 scripts/build_market_vectordb.py가
+같은 SentenceTransformer 인스턴스를 공유하도록 (model_name, device, normalize)
+키로 한 번만 로드함. 첫 요청 시 지연 로드되며, 여러 스레드가 동시에 요청해도
+모델은 한 번만 로드됨.
+"""
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from invest_agent.infra.profiling import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "BAAI/bge-base-en-v1.5"
+
+
+class BgeEmbeddings(Embeddings):
+    """BGE 임베딩 래퍼"""
+    def __init__(self, model_name: str, device: str = "cpu", normalize: bool = True):
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name
+        self.device = device
+        self._model = SentenceTransformer(model_name, device=device)
+        self._normalize = normalize
+
+    @property
+    def model(self):
+        return self._model
+
+    @property
+    def normalize(self) -> bool:
+        return self._normalize
+
+    def encode(self, texts, **kwargs):
+        """SentenceTransformer.encode 패스스루 (numpy 배열 반환)"""
+        kwargs.setdefault("normalize_embeddings", self._normalize)
+        with span("embed", kind="embedding", model=self.model_name, texts=1 if isinstance(texts, str) else len(texts)):
+            return self._model.encode(texts, **kwargs)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        with span("embed", kind="embedding", model=self.model_name, texts=len(texts)):
+            embeddings = self._model.encode(texts, normalize_embeddings=self._normalize)
+        return embeddings.tolist()
+
+    def embed_query(self, text: str) -> list[float]:
+        with span("embed_query", kind="embedding", model=self.model_name, texts=1):
+            embedding = self._model.encode(text, normalize_embeddings=self._normalize)
+        return embedding.tolist()
+
+
+@dataclass
+class EmbeddingLoadStats:
+    model_name: str
+    device: str
+    normalize: bool
+    load_seconds: float
+    rss_delta_mb: Optional[float]
+
+
+_RegistryKey = Tuple[str, str, bool]
+
+_registry: Dict[_RegistryKey, BgeEmbeddings] = {}
+_stats: Dict[_RegistryKey, EmbeddingLoadStats] = {}
+_registry_lock = threading.Lock()
+_key_locks: Dict[_RegistryKey, threading.Lock] = {}
+
+
+def _rss_mb() -> Optional[float]:
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def get_embeddings(
+    model_name: str = DEFAULT_EMBEDDING_MODEL,
+    device: str = "cpu",
+    normalize: bool = True,
+) -> BgeEmbeddings:
+    """
+    공유 임베딩 인스턴스 반환 (없으면 로드)
+
+    같은 키에 대한 동시 요청은 키별 락으로 직렬화되어 모델이 한 번만 로드되고,
+    서로 다른 모델은 병렬로 로드될 수 있음.
+    """
+    key = (model_name, device, normalize)
+    emb = _registry.get(key)
+    if emb is not None:
+        return emb
+
+    with _registry_lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        emb = _registry.get(key)
+        if emb is not None:
+            return emb
+
+        rss_before = _rss_mb()
+        started = time.perf_counter()
+        emb = BgeEmbeddings(model_name=model_name, device=device, normalize=normalize)
+        elapsed = time.perf_counter() - started
+        rss_after = _rss_mb()
+
+        rss_delta = None
+        if rss_before is not None and rss_after is not None:
+            rss_delta = rss_after - rss_before
+
+        _stats[key] = EmbeddingLoadStats(
+            model_name=model_name,
+            device=device,
+            normalize=normalize,
+            load_seconds=elapsed,
+            rss_delta_mb=rss_delta,
+        )
+        _registry[key] = emb
+
+        mem_txt = f", +{rss_delta:.0f}MB" if rss_delta is not None else ""
+        logger.info(f"[임베딩] 모델 로드: {model_name} ({device}) {elapsed:.1f}s{mem_txt}")
+        return emb
+
+
+def embedding_stats() -> List[EmbeddingLoadStats]:
+    """로드된 모델별 로드 시간/메모리 증가량"""
+    return list(_stats.values())
+
+
+def clear_embeddings() -> None:
+    """레지스트리 비우기 (테스트/메모리 회수용)"""
+    with _registry_lock:
+        _registry.clear()
+        _stats.clear()
+        _key_locks.clear()
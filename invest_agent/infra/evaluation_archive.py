@@ -0,0 +1,154 @@
+# invest_agent/infra/evaluation_archive.py
+"""
+투자 판단 평가 기록 (append-only JSONL)
+
+투자 판단 노드가 회사마다 한 줄씩 남김:
+    - inputs:      점수 계산에 쓰인 정규화 state (LLM 평가 전)
+    - evaluations: LLM 평가기 결과 (problem-fit, 기술 체크리스트, 포지셔닝, 리스크)
+    - scores / decision / weights: 기록 당시의 점수와 판단
+    - texts:       금액으로 파싱한 LLM 원문 (market_size, revenue_model → scripts/bench_amounts.py --archive)
+가중치나 임계값을 바꾼 뒤 `python -m invest_agent.rescore`로 에이전트를 다시 돌리지 않고
+전체 기록을 재채점할 수 있음.
+
+환경 변수:
+    INVEST_AGENT_EVAL_ARCHIVE  기록 파일 경로 (기본 outputs/evaluations.jsonl, "off"면 비활성)
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+DEFAULT_EVAL_ARCHIVE_PATH = "outputs/evaluations.jsonl"
+
+# 평가기가 state에 써 넣는 키 (영역별)
+EVALUATION_KEYS: Dict[str, List[str]] = {
+    "market": ["problem_fit_score_0to5", "problem_fit_rationale"],
+    "technology": [
+        "checklist_api",
+        "checklist_multi_tenancy",
+        "checklist_sdk_docs",
+        "checklist_automation",
+        "checklist_domain_extensibility",
+    ],
+    "competition": ["qual_positioning_score_0to5", "qual_positioning_notes"],
+}
+
+# 금액 파싱에 쓰이는 원문 필드 (원본 입력의 영역 → 키)
+AMOUNT_TEXT_KEYS = {"market": "market_size", "business": "revenue_model"}
+
+_write_lock = threading.Lock()
+
+
+def archive_path() -> Optional[str]:
+    """기록 파일 경로 (비활성화되어 있으면 None)"""
+    path = os.getenv("INVEST_AGENT_EVAL_ARCHIVE", DEFAULT_EVAL_ARCHIVE_PATH)
+    if path.lower() in {"", "0", "off", "false", "none"}:
+        return None
+    return path
+
+
+def extract_evaluations(state: Dict[str, Any]) -> Dict[str, Any]:
+    """평가 후 state에서 LLM 평가 결과만 추출 ({영역: {키: 값}}, "risks": [...])"""
+    evaluations: Dict[str, Any] = {}
+    for section, keys in EVALUATION_KEYS.items():
+        values = {k: state.get(section, {})[k] for k in keys if k in state.get(section, {})}
+        if values:
+            evaluations[section] = values
+    evaluations["risks"] = state.get("risks", [])
+    return evaluations
+
+
+def amount_texts(raw_input: Dict[str, Any]) -> Dict[str, str]:
+    """원본 입력에서 금액 원문만 추출 ({키: 문장})"""
+    texts = {}
+    for section, key in AMOUNT_TEXT_KEYS.items():
+        value = (raw_input.get(section) or {}).get(key)
+        if isinstance(value, str) and value:
+            texts[key] = value
+    return texts
+
+
+def scoring_state(record: Dict[str, Any], include_evaluations: bool = False) -> Dict[str, Any]:
+    """
+    기록 1건 → 재채점용 state
+
+    기본은 파이프라인과 같이 정규화 입력 + 리스크만 사용함 (점수 계산이 LLM 평가보다 먼저 실행되므로).
+    include_evaluations=True면 problem-fit / 체크리스트 / 포지셔닝 점수도 반영함.
+    """
+    inputs = record.get("inputs", {})
+    evaluations = record.get("evaluations", {})
+    state: Dict[str, Any] = {k: dict(v) if isinstance(v, dict) else v for k, v in inputs.items()}
+    if include_evaluations:
+        for section in EVALUATION_KEYS:
+            if evaluations.get(section):
+                state.setdefault(section, {}).update(evaluations[section])
+    state["risks"] = evaluations.get("risks", [])
+    return state
+
+
+def append_evaluation(
+    company: str,
+    inputs: Dict[str, Any],
+    evaluated: Dict[str, Any],
+    weights: Dict[str, float],
+    path: Optional[str] = None,
+    texts: Optional[Dict[str, str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    평가 1건 기록 (기록이 비활성화되어 있으면 None)
+
+    Args:
+        company: 회사명
+        inputs: 점수 계산 시점의 정규화 state
+        evaluated: 평가·판단이 끝난 state (scores, decision 포함)
+        weights: 판단에 사용한 가중치
+        texts: 금액 원문 (amount_texts)
+    """
+    path = path or archive_path()
+    if path is None:
+        return None
+
+    decision = evaluated.get("decision", {})
+    record = {
+        "company": company,
+        "recorded_at": datetime.now().isoformat(),
+        "inputs": inputs,
+        "evaluations": extract_evaluations(evaluated),
+        "scores": evaluated.get("scores", {}),
+        "decision": {
+            "status": decision.get("status"),
+            "total_score": decision.get("total_score"),
+            "final_note": decision.get("final_note"),
+        },
+        "weights": dict(weights),
+        "texts": dict(texts or {}),
+    }
+
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with _write_lock:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+    return record
+
+
+def iter_evaluations(path: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """기록 순서대로 읽기 (깨진 줄은 건너뜀)"""
+    path = path or archive_path() or DEFAULT_EVAL_ARCHIVE_PATH
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def load_latest(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """회사별 가장 최근 기록 (회사명 → 레코드)"""
+    latest: Dict[str, Dict[str, Any]] = {}
+    for record in iter_evaluations(path):
+        latest[record.get("company", "")] = record
+    return latest
@@ -0,0 +1,179 @@
+# invest_agent/infra/llm_cache.py
+"""
+영속 LLM 응답 캐시
+
+(model, messages, temperature, response_format, ...) 조합을 키로 응답을
+SQLite에 저장해서, 같은 회사를 다시 평가할 때 같은 프롬프트는 API를 호출하지 않음.
+
+- ChatOpenAI: LangChain 전역 캐시(set_llm_cache)로 연결 → install_llm_cache()
+- openai.chat.completions.create 직접 호출: cached_completion / acached_completion
+
+환경 변수:
+    INVEST_AGENT_LLM_CACHE              캐시 파일 경로 (기본 .cache/llm_cache.sqlite, "off"면 비활성)
+    INVEST_AGENT_LLM_CACHE_TTL          TTL 초 (기본 7일)
+    INVEST_AGENT_LLM_CACHE_MAX_ENTRIES  최대 항목 수 (기본 50000)
+    INVEST_AGENT_LLM_CACHE_MAX_MB       최대 용량 MB (기본 512)
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+
+from invest_agent.infra.cache_store import SQLiteCacheStore
+from invest_agent.infra.profiling import span
+
+DEFAULT_LLM_CACHE_PATH = ".cache/llm_cache.sqlite"
+DEFAULT_LLM_CACHE_TTL = 7 * 24 * 3600
+
+_store: Optional[SQLiteCacheStore] = None
+_store_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def get_llm_cache_store() -> Optional[SQLiteCacheStore]:
+    """공유 캐시 저장소 (비활성화되어 있으면 None)"""
+    global _store
+    path = os.getenv("INVEST_AGENT_LLM_CACHE", DEFAULT_LLM_CACHE_PATH)
+    if path.lower() in {"", "0", "off", "false", "none"}:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SQLiteCacheStore(
+                    path,
+                    table="llm_responses",
+                    ttl_seconds=_env_number("INVEST_AGENT_LLM_CACHE_TTL", DEFAULT_LLM_CACHE_TTL),
+                    max_entries=int(_env_number("INVEST_AGENT_LLM_CACHE_MAX_ENTRIES", 50000)),
+                    max_bytes=int(_env_number("INVEST_AGENT_LLM_CACHE_MAX_MB", 512) * 1024 * 1024),
+                )
+    return _store
+
+
+def llm_cache_stats() -> Dict[str, Any]:
+    store = get_llm_cache_store()
+    return store.stats() if store else {}
+
+
+def make_cache_key(model: str, messages: Sequence[Any], **params: Any) -> str:
+    """모델/메시지/파라미터(temperature, response_format 등)로 결정적인 키 생성"""
+    payload = {
+        "model": model,
+        "messages": list(messages),
+        "params": {k: v for k, v in params.items() if v is not None},
+    }
+    raw = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ===== openai.chat.completions.create 직접 호출용 =====
+
+def _record_usage(s, model: str, resp: Any) -> None:
+    usage = getattr(resp, "usage", None)
+    s.record_usage(
+        model,
+        int(getattr(usage, "prompt_tokens", 0) or 0),
+        int(getattr(usage, "completion_tokens", 0) or 0),
+        cache_hit=False,
+    )
+
+
+def cached_completion(create: Callable[..., Any], **request: Any) -> str:
+    """
+    chat completion 결과의 message.content를 캐시해서 반환
+
+    Args:
+        create: openai.chat.completions.create 또는 client.chat.completions.create
+        request: create에 그대로 전달할 인자 (model, messages, response_format, ...)
+    """
+    model = request.get("model")
+    with span(f"llm:{model}", kind="llm", model=model) as s:
+        store = get_llm_cache_store()
+        key = make_cache_key(**request) if store else None
+        if store:
+            cached = store.get(key)
+            if cached is not None:
+                s.record_usage(model, 0, 0, cache_hit=True)
+                return cached.decode("utf-8")
+
+        resp = create(**request)
+        content = resp.choices[0].message.content
+        _record_usage(s, model, resp)
+
+        if store and content is not None:
+            store.set(key, content.encode("utf-8"))
+        return content
+
+
+async def acached_completion(create: Callable[..., Awaitable[Any]], **request: Any) -> str:
+    """cached_completion의 async 버전 (AsyncOpenAI)"""
+    model = request.get("model")
+    with span(f"llm:{model}", kind="llm", model=model) as s:
+        store = get_llm_cache_store()
+        key = make_cache_key(**request) if store else None
+        if store:
+            cached = store.get(key)
+            if cached is not None:
+                s.record_usage(model, 0, 0, cache_hit=True)
+                return cached.decode("utf-8")
+
+        resp = await create(**request)
+        content = resp.choices[0].message.content
+        _record_usage(s, model, resp)
+
+        if store and content is not None:
+            store.set(key, content.encode("utf-8"))
+        return content
+
+
+# ===== LangChain (ChatOpenAI) 전역 캐시 =====
+
+class SQLiteLLMCache(BaseCache):
+    """
+    LangChain BaseCache 구현
+
+    llm_string에는 모델명·temperature·response_format 등 호출 파라미터가
+    직렬화되어 있으므로 (prompt, llm_string)을 그대로 키로 사용.
+    """
+
+    def __init__(self, store: SQLiteCacheStore):
+        self.store = store
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str):
+        cached = self.store.get(self._key(prompt, llm_string))
+        if cached is None:
+            return None
+        try:
+            return [loads(g) for g in json.loads(cached.decode("utf-8"))]
+        except Exception:
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val) -> None:
+        payload = json.dumps([dumps(g) for g in return_val])
+        self.store.set(self._key(prompt, llm_string), payload.encode("utf-8"))
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.clear()
+
+
+def install_llm_cache() -> bool:
+    """ChatOpenAI 호출에 영속 캐시 연결. 캐시가 비활성화되어 있으면 False."""
+    store = get_llm_cache_store()
+    if store is None:
+        return False
+    from langchain_core.globals import set_llm_cache
+    set_llm_cache(SQLiteLLMCache(store))
+    return True
@@ -0,0 +1,253 @@
+# invest_agent/infra/log.py
+"""
+구조화 로깅
+
+모듈별 로거(logging.getLogger(__name__), 예: invest_agent.agents.tech)가 남긴 로그를 QueueHandler로 큐에 넣기만 하고,
+실제 출력(콘솔/파일)은 QueueListener 스레드가 맡음 → 노드 실행 스레드가 stdout 쓰기에서
+서로 기다리지 않음. 모든 레코드에 run_id / company / node가 붙어 배치·병렬 실행에서도
+어느 실행·회사의 로그인지 구분할 수 있음 (contextvars 기반이라 asyncio 태스크와
+profiling.propagate로 넘긴 스레드에서도 유지됨).
+
+문서·항목 단위처럼 반복되는 줄은 extra=SAMPLED로 남기면 호출 위치별로 초당 개수를 제한하고,
+버린 줄 수는 다음에 통과한 레코드의 suppressed 필드로 알려줌.
+
+환경 변수:
+    INVEST_AGENT_LOG_LEVEL    로그 레벨 (기본 INFO)
+    INVEST_AGENT_LOG_FORMAT   text | json (기본 text)
+    INVEST_AGENT_LOG_FILE     지정하면 이 파일에도 기록
+    INVEST_AGENT_LOG_SAMPLE   SAMPLED 로그 한도, rate_limit과 같은 형식 (기본 5/s, "off"면 제한 없음)
+"""
+import atexit
+import contextvars
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from invest_agent.infra.node_wrap import state_company
+from invest_agent.infra.rate_limit import parse_rate
+
+ROOT_LOGGER = "invest_agent"
+
+# 반복되는 줄에 붙이는 표시: logger.info(..., extra=SAMPLED)
+SAMPLED = {"sampled": True}
+
+_run_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("invest_agent_run_id", default=None)
+_company: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("invest_agent_company", default=None)
+_node: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("invest_agent_node", default=None)
+
+# LogRecord 기본 속성 (JSON 출력 때 extra 필드만 골라내기 위함)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+_CONTEXT_ATTRS = ("run_id", "company", "node")
+
+
+@contextmanager
+def log_context(run_id: Optional[str] = None, company: Optional[str] = None, node: Optional[str] = None) -> Iterator[None]:
+    """블록 안에서 남긴 로그에 run_id / company / node를 붙임 (None인 값은 바깥 값을 유지)"""
+    tokens = []
+    for var, value in ((_run_id, run_id), (_company, company), (_node, node)):
+        if value is not None:
+            tokens.append((var, var.set(value)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def node_scope(name: str) -> Callable[[Any], Any]:
+    """그래프 노드용 around hook: 실행 동안 node / company 로그 컨텍스트 설정 (node_wrap.wrap_node)"""
+    def around(state: Any):
+        return log_context(company=state_company(state), node=name)
+    return around
+
+
+# ===== 필터 / 포매터 =====
+
+class ContextFilter(logging.Filter):
+    """레코드에 run_id / company / node 추가 (로그를 남긴 스레드·태스크의 context 기준)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = _run_id.get()
+        record.company = _company.get()
+        record.node = _node.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    extra=SAMPLED 레코드를 호출 위치(파일, 줄)별 토큰 버킷으로 제한
+
+    WARNING 이상은 항상 통과. 버린 개수는 같은 위치에서 다음에 통과한 레코드의 suppressed에 담김.
+    """
+
+    def __init__(self, rate: float = 5.0, burst: float = 5.0):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[Tuple[str, int], list] = {}  # 위치 → [tokens, updated, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False) or record.levelno >= logging.WARNING:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.setdefault(key, [self.burst, now, 0])
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            if bucket[2]:
+                record.suppressed = bucket[2]
+                bucket[2] = 0
+        return True
+
+
+def _context_suffix(record: logging.LogRecord) -> str:
+    parts = [f"{k}={getattr(record, k)}" for k in _CONTEXT_ATTRS if getattr(record, k, None)]
+    suppressed = getattr(record, "suppressed", None)
+    if suppressed:
+        parts.append(f"+{suppressed} suppressed")
+    return f" ({', '.join(parts)})" if parts else ""
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 한 줄 형식: 시각 레벨 [로거] 메시지 (run_id=…, company=…)"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s [%(name)s] %(message)s", datefmt="%H:%M:%S")
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        first, sep, rest = text.partition("\n")
+        return first + _context_suffix(record) + sep + rest
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON 한 줄 형식 (컨텍스트와 extra 필드 포함)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key in _CONTEXT_ATTRS:
+            if getattr(record, key, None):
+                payload[key] = getattr(record, key)
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key not in payload and key not in _CONTEXT_ATTRS and key != "sampled":
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    큐에 넣기 전에 메시지·예외만 문자열로 확정 (컨텍스트와 extra 필드는 유지)
+
+    기본 QueueHandler.prepare는 예외 traceback을 메시지에 합쳐 버려 JSON 출력에서 분리할 수 없음.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# ===== 설정 =====
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+def _sampling_filter() -> Optional[SamplingFilter]:
+    spec = os.getenv("INVEST_AGENT_LOG_SAMPLE", "5/s")
+    try:
+        limits = parse_rate(spec)
+    except ValueError:
+        limits = (5.0, 5.0)
+    return SamplingFilter(*limits) if limits else None
+
+
+def setup_logging(
+    level: Optional[str] = None,
+    fmt: Optional[str] = None,
+    log_file: Optional[str] = None,
+) -> logging.Logger:
+    """
+    invest_agent 로거 설정 (CLI 진입점에서 한 번 호출, 다시 호출하면 기존 설정을 교체)
+
+    Args:
+        level: 로그 레벨 (기본 INVEST_AGENT_LOG_LEVEL 또는 INFO)
+        fmt: "text" | "json" (기본 INVEST_AGENT_LOG_FORMAT 또는 text)
+        log_file: 추가로 기록할 파일 (기본 INVEST_AGENT_LOG_FILE)
+    """
+    global _listener
+    level = (level or os.getenv("INVEST_AGENT_LOG_LEVEL", "INFO")).upper()
+    fmt = fmt or os.getenv("INVEST_AGENT_LOG_FORMAT", "text")
+    log_file = log_file or os.getenv("INVEST_AGENT_LOG_FILE")
+
+    with _setup_lock:
+        shutdown_logging()
+
+        formatter = JsonFormatter() if fmt == "json" else TextFormatter()
+        handlers = [logging.StreamHandler(sys.stderr)]
+        if log_file:
+            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+        for h in handlers:
+            h.setFormatter(formatter)
+
+        # 무제한 큐 → 로그를 남기는 쪽은 put만 하고 바로 돌아감
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = _QueueHandler(log_queue)
+        queue_handler.addFilter(ContextFilter())
+        sampling = _sampling_filter()
+        if sampling is not None:
+            queue_handler.addFilter(sampling)
+
+        root = logging.getLogger(ROOT_LOGGER)
+        for h in list(root.handlers):
+            root.removeHandler(h)
+        root.addHandler(queue_handler)
+        root.setLevel(level)
+        root.propagate = False
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+    return root
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for h in _listener.handlers:
+            h.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
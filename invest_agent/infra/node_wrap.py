@@ -0,0 +1,56 @@
+# invest_agent/infra/node_wrap.py
+"""
+그래프 노드 래핑
+
+workflow._add_node가 노드마다 로그 컨텍스트(log.node_scope), 프로파일링 span
+(profiling.node_span), 업데이트 점검(state_debug.update_reporter)을 붙임.
+각 기능은 hook만 제공하고 sync / async 노드 구분은 wrap_node 한 곳에서 처리함.
+
+    around: state → 컨텍스트 매니저 (노드 실행 전후, 앞에 있는 것이 바깥쪽)
+    after:  (state, update) → None (노드가 정상 반환했을 때, around 안에서 호출)
+"""
+import functools
+import inspect
+from contextlib import ExitStack
+from typing import Any, Callable, ContextManager, Optional, Sequence
+
+AroundHook = Callable[[Any], ContextManager]
+AfterHook = Callable[[Any, Any], None]
+
+
+def state_company(state: Any) -> Optional[str]:
+    """노드 입력 state의 현재 회사명 (없으면 None)"""
+    return (state.get("current_company") or None) if isinstance(state, dict) else None
+
+
+def wrap_node(node: Callable, around: Sequence[AroundHook] = (), after: Sequence[AfterHook] = ()) -> Callable:
+    """노드를 hook으로 감쌈 (hook이 없으면 노드를 그대로 반환)"""
+    if not around and not after:
+        return node
+
+    def _enter(stack: ExitStack, state: Any) -> None:
+        for hook in around:
+            stack.enter_context(hook(state))
+
+    def _after(state: Any, update: Any) -> None:
+        for hook in after:
+            hook(state, update)
+
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def anode(state, *args, **kwargs):
+            with ExitStack() as stack:
+                _enter(stack, state)
+                update = await node(state, *args, **kwargs)
+                _after(state, update)
+                return update
+        return anode
+
+    @functools.wraps(node)
+    def wrapped(state, *args, **kwargs):
+        with ExitStack() as stack:
+            _enter(stack, state)
+            update = node(state, *args, **kwargs)
+            _after(state, update)
+            return update
+    return wrapped
@@ -0,0 +1,476 @@
+# invest_agent/infra/profiling.py
+"""
+실행 프로파일링 (span 기반)
+
+그래프 노드, LLM 호출, 임베딩, Tavily 검색을 span으로 기록함.
+    - 공통: 실행 시간(wall), 대기 시간(queue_wait: rate limiter 등에서 막혀 있던 시간), 오류
+    - llm: 모델, prompt/completion 토큰, 캐시 적중, 추정 비용(USD)
+    - search: provider, 캐시 적중, 내려받은 바이트 (응답 JSON 크기 기준)
+    - embedding: 모델, 텍스트 수, 캐시에서 찾은 수
+
+start_trace()를 호출한 실행에서만 기록하고, 그 외에는 span()이 아무것도 하지 않음.
+span 부모-자식 관계는 contextvars로 이어지므로 asyncio 태스크와 LangGraph 실행 스레드에서도
+유지됨 (직접 만든 ThreadPoolExecutor에는 propagate로 감싸서 넘김).
+
+내보내기:
+    Tracer.write_jsonl(path)  span 1개당 1줄
+    Tracer.write_otlp(path)   OpenTelemetry OTLP/JSON 형식 (collector / Jaeger / Tempo로 가져올 수 있음)
+    Tracer.flame_summary()    이름 경로별로 합친 시간 트리 (터미널 출력용)
+
+    tracer = start_trace()
+    app.invoke(state, config={"callbacks": [profiling_callback()]})
+    stop_trace()
+    print(tracer.flame_summary())
+"""
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from invest_agent.infra.node_wrap import state_company
+
+# 모델별 가격 (USD / 1M 토큰: 입력, 출력). 이름이 키로 시작하면 같은 가격을 씀 (gpt-4o-2024-08-06 등)
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-nano": (0.10, 0.40),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+}
+
+# OTLP 내보내기 때 쓰는 속성 이름 (OpenTelemetry GenAI 시맨틱 컨벤션)
+_OTEL_ATTRIBUTE_NAMES = {
+    "model": "gen_ai.request.model",
+    "prompt_tokens": "gen_ai.usage.input_tokens",
+    "completion_tokens": "gen_ai.usage.output_tokens",
+}
+_OTEL_CLIENT_KINDS = {"llm", "search", "embedding"}
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    """토큰 수 → 추정 비용 (USD, 가격표에 없는 모델이면 None)"""
+    if not model:
+        return None
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):
+        if model.startswith(name):
+            price_in, price_out = MODEL_PRICES[name]
+            return (prompt_tokens * price_in + completion_tokens * price_out) / 1_000_000
+    return None
+
+
+@dataclass
+class Span:
+    name: str
+    kind: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: Optional[int] = None
+    wall_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update({k: v for k, v in attrs.items() if v is not None})
+
+    def add(self, key: str, amount: float = 1) -> None:
+        self.attrs[key] = self.attrs.get(key, 0) + amount
+
+    def record_usage(self, model: Optional[str], prompt_tokens: int, completion_tokens: int, cache_hit: bool) -> None:
+        """LLM 사용량 기록 (캐시 적중이면 비용 0)"""
+        cost = 0.0 if cache_hit else estimate_cost(model, prompt_tokens, completion_tokens)
+        self.set(
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cache_hit=cache_hit,
+            cost_usd=round(cost, 6) if cost is not None else None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start_ns / 1e9,
+            "end": self.end_ns / 1e9 if self.end_ns else None,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "queue_wait_seconds": round(self.queue_wait_seconds, 6),
+            "attrs": self.attrs,
+            "error": self.error,
+        }
+
+
+class _NullSpan:
+    """기록하지 않을 때 쓰는 빈 span (호출 측이 분기하지 않도록 같은 메서드 제공)"""
+    queue_wait_seconds = 0.0
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def add(self, key: str, amount: float = 1) -> None:
+        pass
+
+    def record_usage(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """한 실행(run)의 span 모음"""
+
+    def __init__(self, run_id: Optional[str] = None, service_name: str = "invest_agent"):
+        self.trace_id = secrets.token_hex(16)
+        self.run_id = run_id or self.trace_id[:8]
+        self.service_name = service_name
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def start(self, name: str, kind: str, parent: Optional[Span], attrs: Optional[Dict[str, Any]] = None) -> Span:
+        span = Span(
+            name=name,
+            kind=kind,
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if isinstance(parent, Span) else None,
+            start_ns=time.time_ns(),
+        )
+        if attrs:
+            span.set(**attrs)
+        return span
+
+    def finish(self, span: Span, error: Optional[BaseException] = None) -> None:
+        span.end_ns = time.time_ns()
+        span.wall_seconds = time.perf_counter() - span._started
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        with self._lock:
+            self.spans.append(span)
+
+    def finished_spans(self) -> List[Span]:
+        with self._lock:
+            return sorted(self.spans, key=lambda s: s.start_ns)
+
+    # ===== 내보내기 =====
+
+    def write_jsonl(self, path: str) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            for span in self.finished_spans():
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+        return path
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP/JSON (ExportTraceServiceRequest) 형식"""
+        spans = []
+        for span in self.finished_spans():
+            attributes = [_otel_attribute("invest_agent.kind", span.kind)]
+            attributes += [
+                _otel_attribute(_OTEL_ATTRIBUTE_NAMES.get(k, f"invest_agent.{k}"), v)
+                for k, v in span.attrs.items()
+            ]
+            if span.queue_wait_seconds:
+                attributes.append(_otel_attribute("invest_agent.queue_wait_seconds", span.queue_wait_seconds))
+            otel_span = {
+                "traceId": span.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 3 if span.kind in _OTEL_CLIENT_KINDS else 1,  # CLIENT / INTERNAL
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns or span.start_ns),
+                "attributes": attributes,
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            if span.parent_id:
+                otel_span["parentSpanId"] = span.parent_id
+            spans.append(otel_span)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    _otel_attribute("service.name", self.service_name),
+                    _otel_attribute("invest_agent.run_id", self.run_id),
+                ]},
+                "scopeSpans": [{"scope": {"name": "invest_agent.profiling"}, "spans": spans}],
+            }]
+        }
+
+    def write_otlp(self, path: str) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_otlp(), f, ensure_ascii=False)
+        return path
+
+    # ===== 요약 =====
+
+    def totals(self) -> Dict[str, Any]:
+        """종류별 합계 (호출 수, 토큰, 비용, 캐시 적중, 바이트, 대기 시간)"""
+        out: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        for span in self.finished_spans():
+            t = out[span.kind]
+            t["count"] += 1
+            t["wall_seconds"] += span.wall_seconds
+            t["queue_wait_seconds"] += span.queue_wait_seconds
+            t["errors"] += 1 if span.error else 0
+            for key in ("prompt_tokens", "completion_tokens", "cost_usd", "bytes_downloaded", "texts"):
+                if isinstance(span.attrs.get(key), (int, float)):
+                    t[key] += span.attrs[key]
+            if span.attrs.get("cache_hit") is True:
+                t["cache_hits"] += 1
+        return {kind: dict(values) for kind, values in out.items()}
+
+    def flame_summary(self, min_share: float = 0.005, width: int = 24) -> str:
+        """
+        이름 경로(부모 → 자식)별로 합친 시간 트리
+
+        병렬로 실행된 자식은 시간이 겹치므로 자식 합계가 부모보다 클 수 있음.
+        전체 시간의 min_share 미만인 경로는 생략.
+        """
+        spans = self.finished_spans()
+        if not spans:
+            return "(기록된 span 없음)"
+
+        by_id = {s.span_id: s for s in spans}
+        children: Dict[Optional[str], List[Span]] = defaultdict(list)
+        for s in spans:
+            parent = s.parent_id if s.parent_id in by_id else None
+            children[parent].append(s)
+
+        # 같은 부모 아래 같은 이름의 span은 한 줄로 합침
+        def aggregate(group: List[Span]) -> List[Tuple[str, List[Span]]]:
+            named: Dict[str, List[Span]] = defaultdict(list)
+            for s in group:
+                named[s.name].append(s)
+            return sorted(named.items(), key=lambda kv: -sum(s.wall_seconds for s in kv[1]))
+
+        roots = children[None]
+        total = (max(s.end_ns or s.start_ns for s in spans) - min(s.start_ns for s in roots)) / 1e9 or 1e-9
+        lines = [f"🔥 실행 프로파일 (run {self.run_id}, 총 {total:.1f}s, span {len(spans)}개)"]
+
+        def emit(group: List[Span], depth: int) -> None:
+            for name, same in aggregate(group):
+                wall = sum(s.wall_seconds for s in same)
+                if wall / total < min_share:
+                    continue
+                wait = sum(s.queue_wait_seconds for s in same)
+                tokens = sum(s.attrs.get("prompt_tokens", 0) + s.attrs.get("completion_tokens", 0) for s in same)
+                cost = sum(s.attrs.get("cost_usd", 0) or 0 for s in same)
+                hits = sum(1 for s in same if s.attrs.get("cache_hit") is True)
+                bar = "█" * max(1, int(width * min(1.0, wall / total)))
+
+                extra = []
+                if wait >= 0.01:
+                    extra.append(f"대기 {wait:.1f}s")
+                if tokens:
+                    extra.append(f"토큰 {tokens:,}")
+                if cost:
+                    extra.append(f"${cost:.4f}")
+                if hits:
+                    extra.append(f"캐시 {hits}/{len(same)}")
+                label = f"{'  ' * depth}{name}"
+                lines.append(
+                    f"{label:<40} {wall:8.2f}s {wall / total:6.1%} ×{len(same):<3} {bar:<{width}} {' '.join(extra)}"
+                )
+                emit([c for s in same for c in children.get(s.span_id, [])], depth + 1)
+
+        emit(roots, 0)
+
+        totals = self.totals()
+        llm = totals.get("llm", {})
+        search = totals.get("search", {})
+        if llm:
+            lines.append(
+                f"LLM {int(llm['count'])}회 (캐시 {int(llm.get('cache_hits', 0))}), "
+                f"토큰 {int(llm.get('prompt_tokens', 0)):,}/{int(llm.get('completion_tokens', 0)):,}, "
+                f"추정 비용 ${llm.get('cost_usd', 0):.4f}"
+            )
+        if search:
+            lines.append(
+                f"검색 {int(search['count'])}회 (캐시 {int(search.get('cache_hits', 0))}), "
+                f"{int(search.get('bytes_downloaded', 0)):,} bytes, 대기 {search.get('queue_wait_seconds', 0):.1f}s"
+            )
+        return "\n".join(lines)
+
+
+def _otel_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+# ===== 실행 단위 상태 =====
+
+_tracer: Optional[Tracer] = None
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("invest_agent_span", default=None)
+
+
+def start_trace(run_id: Optional[str] = None) -> Tracer:
+    """기록 시작 (이후 span()이 이 Tracer에 쌓임)"""
+    global _tracer
+    _tracer = Tracer(run_id)
+    return _tracer
+
+
+def stop_trace() -> Optional[Tracer]:
+    """기록 종료 후 Tracer 반환"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def current_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def current_span():
+    """현재 span (기록 중이 아니면 NULL_SPAN)"""
+    return _current.get() or NULL_SPAN
+
+
+@contextmanager
+def span(name: str, kind: str = "span", **attrs: Any) -> Iterator[Any]:
+    """
+    with span("tavily", kind="search", query=q) as s:
+        ...
+        s.set(cache_hit=True)
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield NULL_SPAN
+        return
+    s = tracer.start(name, kind, _current.get(), attrs)
+    token = _current.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        _current.reset(token)
+        tracer.finish(s, e)
+        raise
+    _current.reset(token)
+    tracer.finish(s)
+
+
+def add_queue_wait(seconds: float) -> None:
+    """현재 span에 대기 시간 추가 (rate limiter 등)"""
+    s = _current.get()
+    if s is not None and seconds > 0:
+        s.queue_wait_seconds += seconds
+
+
+def node_span(name: str, kind: str = "node") -> Callable[[Any], Any]:
+    """그래프 노드용 around hook: 노드 실행을 span으로 기록 (node_wrap.wrap_node)"""
+    def around(state: Any):
+        company = state_company(state)
+        return span(name, kind, **({"company": company} if company else {}))
+    return around
+
+
+def propagate(fn: Callable) -> Callable:
+    """
+    현재 context(span, LangChain 콜백)를 다른 스레드로 넘기는 래퍼
+
+    ThreadPoolExecutor는 context를 복사하지 않으므로 executor.map(propagate(fn), ...)처럼 사용.
+    호출마다 context 사본을 만들어 여러 스레드에서 동시에 실행해도 안전함.
+    """
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        return ctx.copy().run(fn, *args, **kwargs)
+    return run
+
+
+# ===== LangChain 콜백 (ChatOpenAI 호출) =====
+
+_callback_class = None
+
+
+def _usage_from_result(response) -> Tuple[int, int]:
+    usage = (response.llm_output or {}).get("token_usage") or {}
+    if usage:
+        return int(usage.get("prompt_tokens", 0) or 0), int(usage.get("completion_tokens", 0) or 0)
+    prompt = completion = 0
+    for generations in response.generations:
+        for g in generations:
+            meta = getattr(getattr(g, "message", None), "usage_metadata", None) or {}
+            prompt += int(meta.get("input_tokens", 0) or 0)
+            completion += int(meta.get("output_tokens", 0) or 0)
+    return prompt, completion
+
+
+def profiling_callback():
+    """
+    ChatOpenAI 호출을 llm span으로 기록하는 LangChain 콜백
+
+    app.invoke(..., config={"callbacks": [profiling_callback()]})로 넘기면 노드 안의
+    ChatOpenAI 호출에도 전달됨. 캐시 적중 여부는 llm_output 유무로 판단함
+    (LangChain 캐시에서 꺼낸 응답에는 llm_output이 없음).
+    """
+    global _callback_class
+    if _callback_class is None:
+        from langchain_core.callbacks import BaseCallbackHandler
+
+        class ProfilingCallbackHandler(BaseCallbackHandler):
+            run_inline = True  # 호출한 스레드/태스크에서 실행해 현재 span을 부모로 씀
+
+            def __init__(self):
+                self._spans: Dict[Any, Span] = {}
+                self._lock = threading.Lock()
+
+            def _start(self, serialized, run_id, kwargs) -> None:
+                tracer = _tracer
+                if tracer is None:
+                    return
+                params = kwargs.get("invocation_params") or {}
+                model = (
+                    params.get("model_name") or params.get("model")
+                    or ((serialized or {}).get("kwargs") or {}).get("model_name")
+                )
+                s = tracer.start(f"llm:{model or 'unknown'}", "llm", _current.get(), {"model": model})
+                with self._lock:
+                    self._spans[run_id] = s
+
+            def _pop(self, run_id) -> Optional[Span]:
+                with self._lock:
+                    return self._spans.pop(run_id, None)
+
+            def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+                self._start(serialized, run_id, kwargs)
+
+            def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+                self._start(serialized, run_id, kwargs)
+
+            def on_llm_end(self, response, *, run_id, **kwargs):
+                s = self._pop(run_id)
+                if s is None or _tracer is None:
+                    return
+                prompt_tokens, completion_tokens = _usage_from_result(response)
+                s.record_usage(s.attrs.get("model"), prompt_tokens, completion_tokens, response.llm_output is None)
+                _tracer.finish(s)
+
+            def on_llm_error(self, error, *, run_id, **kwargs):
+                s = self._pop(run_id)
+                if s is not None and _tracer is not None:
+                    _tracer.finish(s, error)
+
+        _callback_class = ProfilingCallbackHandler
+    return _callback_class()
@@ -0,0 +1,123 @@
+# invest_agent/infra/rate_limit.py
+"""
+provider별 토큰 버킷 rate limiter
+
+동시 실행(회사별 병렬, 경쟁사 리서치, batch 워커)이 늘어도 외부 API 호출 속도가
+provider 한도를 넘지 않도록 함. 스레드와 asyncio 양쪽에서 사용할 수 있음.
+
+환경 변수 (provider 이름 대문자):
+    INVEST_AGENT_RATE_TAVILY=5/s        초당 5회 (버스트 기본값 = 초당 횟수)
+    INVEST_AGENT_RATE_TAVILY=120/m:10   분당 120회, 버스트 10
+    INVEST_AGENT_RATE_TAVILY=off        제한 없음
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from invest_agent.infra.profiling import add_queue_wait
+
+logger = logging.getLogger(__name__)
+
+# provider별 기본 한도 (초당 요청 수, 버스트)
+DEFAULT_RATES: Dict[str, Tuple[float, float]] = {
+    "tavily": (5.0, 5.0),
+}
+
+_PERIODS = {"s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class TokenBucket:
+    """
+    Args:
+        rate: 초당 충전되는 토큰 수
+        capacity: 버킷 크기 (한 번에 몰아서 보낼 수 있는 요청 수)
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate와 capacity는 0보다 커야 합니다.")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 기다려야 할 시간(초)을 반환 (토큰은 음수까지 빌려 씀)"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            self.waited_seconds += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰 확보 (기다린 시간(초) 반환)"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: float = 1.0) -> float:
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+def parse_rate(spec: str) -> Optional[Tuple[float, float]]:
+    """'5/s', '120/m:10' → (초당 요청 수, 버스트). 'off'면 None."""
+    spec = spec.strip().lower()
+    if spec in {"", "0", "off", "none", "false"}:
+        return None
+    burst: Optional[float] = None
+    if ":" in spec:
+        spec, burst_txt = spec.split(":", 1)
+        burst = float(burst_txt)
+    count, _, unit = spec.partition("/")
+    per_second = float(count) / _PERIODS.get(unit or "s", 1.0)
+    return per_second, burst if burst is not None else max(1.0, per_second)
+
+
+_buckets: Dict[str, Optional[TokenBucket]] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> Optional[TokenBucket]:
+    """provider의 공유 버킷 (제한이 없으면 None)"""
+    if provider in _buckets:
+        return _buckets[provider]
+
+    with _buckets_lock:
+        if provider not in _buckets:
+            default = DEFAULT_RATES.get(provider)
+            env = os.getenv(f"INVEST_AGENT_RATE_{provider.upper()}")
+            try:
+                limits = parse_rate(env) if env is not None else default
+                bucket = TokenBucket(*limits) if limits else None
+            except ValueError:
+                # 형식 오류뿐 아니라 "0/s"처럼 TokenBucket이 거부하는 값도 기본값으로 대체
+                logger.warning(f"⚠️ 잘못된 rate 설정 무시: INVEST_AGENT_RATE_{provider.upper()}={env}")
+                bucket = TokenBucket(*default) if default else None
+            _buckets[provider] = bucket
+        return _buckets[provider]
+
+
+def throttle(provider: str) -> None:
+    """provider 한도에 맞춰 대기 (sync)"""
+    bucket = get_rate_limiter(provider)
+    if bucket is not None:
+        add_queue_wait(bucket.acquire())
+
+
+async def athrottle(provider: str) -> None:
+    """provider 한도에 맞춰 대기 (async)"""
+    bucket = get_rate_limiter(provider)
+    if bucket is not None:
+        add_queue_wait(await bucket.aacquire())
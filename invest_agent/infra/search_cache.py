@@ -0,0 +1,233 @@
+# invest_agent/infra/search_cache.py
+"""
+영속 웹 검색 캐시
+
+(provider, query, params)를 키로 Tavily 결과를 SQLite에 zlib 압축해 저장.
+raw_content가 포함된 retriever 결과도 압축되어 용량 부담이 작음.
+같은 회사를 다시 평가하는 배치 재실행에서 대부분의 네트워크 왕복을 생략함.
+
+신선도 정책 (INVEST_AGENT_SEARCH_STALENESS):
+    strict          TTL이 지나면 항상 다시 검색
+    stale-if-error  TTL이 지나면 다시 검색하되, 실패하면 오래된 결과 사용 (기본)
+    prefer-cache    보관 중인 결과가 있으면 TTL과 관계없이 사용
+
+환경 변수:
+    INVEST_AGENT_SEARCH_CACHE         캐시 파일 경로 (기본 .cache/search_cache.sqlite, "off"면 비활성)
+    INVEST_AGENT_SEARCH_CACHE_MAX_MB  최대 용량 MB (기본 1024)
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.documents import Document
+
+from invest_agent.infra.cache_store import SQLiteCacheStore
+from invest_agent.infra.profiling import span
+from invest_agent.infra.rate_limit import throttle, athrottle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_CACHE_PATH = ".cache/search_cache.sqlite"
+
+# provider별 신선도 TTL (초)
+SOURCE_TTLS: Dict[str, float] = {
+    "tavily": 3 * 24 * 3600,            # 기술/시장/경쟁사 검색 스니펫
+    "tavily_retriever": 7 * 24 * 3600,  # discovery 문서 (raw_content 포함)
+}
+DEFAULT_TTL = 24 * 3600
+
+# TTL이 지난 뒤에도 stale-if-error / prefer-cache용으로 보관하는 기간
+STALE_RETENTION = 30 * 24 * 3600
+
+STALENESS_POLICIES = ("strict", "stale-if-error", "prefer-cache")
+
+_store: Optional[SQLiteCacheStore] = None
+_store_lock = threading.Lock()
+
+
+def get_search_cache_store() -> Optional[SQLiteCacheStore]:
+    """공유 검색 캐시 저장소 (비활성화되어 있으면 None)"""
+    global _store
+    path = os.getenv("INVEST_AGENT_SEARCH_CACHE", DEFAULT_SEARCH_CACHE_PATH)
+    if path.lower() in {"", "0", "off", "false", "none"}:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                try:
+                    max_mb = float(os.getenv("INVEST_AGENT_SEARCH_CACHE_MAX_MB", 1024))
+                except ValueError:
+                    max_mb = 1024
+                _store = SQLiteCacheStore(
+                    path,
+                    table="search_results",
+                    max_bytes=int(max_mb * 1024 * 1024),
+                )
+    return _store
+
+
+def staleness_policy() -> str:
+    policy = os.getenv("INVEST_AGENT_SEARCH_STALENESS", "stale-if-error")
+    return policy if policy in STALENESS_POLICIES else "stale-if-error"
+
+
+def search_cache_stats() -> Dict[str, Any]:
+    store = get_search_cache_store()
+    return store.stats() if store else {}
+
+
+def make_search_key(provider: str, query: str, params: Optional[Dict[str, Any]] = None) -> str:
+    raw = json.dumps(
+        {"provider": provider, "query": query, "params": params or {}},
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _decode(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+_MISS = object()
+
+
+def _lookup(store: SQLiteCacheStore, provider: str, query: str, params: Optional[Dict[str, Any]]):
+    """(key, ttl, record, cached) 반환. 정책상 캐시를 쓸 수 있으면 cached에 결과, 아니면 _MISS."""
+    key = make_search_key(provider, query, params)
+    ttl = SOURCE_TTLS.get(provider, DEFAULT_TTL)
+    record = store.get_record(key)
+    if record is not None and (record.age_seconds < ttl or staleness_policy() == "prefer-cache"):
+        store.touch(key, hit=True)
+        return key, ttl, record, _decode(record.value)
+    store.touch(key, hit=False)
+    return key, ttl, record, _MISS
+
+
+def _stale_or_raise(record, provider: str, query: str, s) -> Any:
+    """검색 실패 시 정책에 따라 오래된 결과를 반환하거나 예외를 다시 발생"""
+    if record is not None and staleness_policy() != "strict":
+        logger.info(f"ℹ️ 검색 실패, 캐시된 결과 사용 ({provider}: {query[:40]})")
+        s.set(cache_hit=True, stale=True)
+        return _decode(record.value)
+    raise
+
+
+def _store_results(store: SQLiteCacheStore, key: str, ttl: float, results: Any, s) -> None:
+    blob = json.dumps(results, ensure_ascii=False).encode("utf-8")
+    # 내려받은 양은 응답 JSON 크기로 근사
+    s.set(cache_hit=False, bytes_downloaded=len(blob))
+    store.set(key, zlib.compress(blob, 6), ttl_seconds=ttl + STALE_RETENTION)
+
+
+def cached_search(
+    provider: str,
+    query: str,
+    params: Optional[Dict[str, Any]],
+    fetch: Callable[[], Any],
+) -> Any:
+    """
+    캐시를 거쳐 검색 실행
+
+    Args:
+        provider: SOURCE_TTLS 키 ("tavily", "tavily_retriever", ...)
+        query: 검색어
+        params: 결과에 영향을 주는 검색 파라미터 (max_results 등)
+        fetch: 캐시 미스 시 실제 검색을 수행하는 함수 (JSON 직렬화 가능한 값 반환)
+    """
+    with span(provider, kind="search", provider=provider, query=query[:120]) as s:
+        store = get_search_cache_store()
+        if store is None:
+            results = fetch()
+            s.set(cache_hit=False)
+            return results
+
+        key, ttl, record, cached = _lookup(store, provider, query, params)
+        if cached is not _MISS:
+            s.set(cache_hit=True)
+            return cached
+
+        try:
+            results = fetch()
+        except Exception:
+            return _stale_or_raise(record, provider, query, s)
+
+        _store_results(store, key, ttl, results, s)
+        return results
+
+
+async def acached_search(provider: str, query: str, params: Optional[Dict[str, Any]], afetch) -> Any:
+    """cached_search의 async 버전 (afetch는 coroutine 함수)"""
+    with span(provider, kind="search", provider=provider, query=query[:120]) as s:
+        store = get_search_cache_store()
+        if store is None:
+            results = await afetch()
+            s.set(cache_hit=False)
+            return results
+
+        key, ttl, record, cached = _lookup(store, provider, query, params)
+        if cached is not _MISS:
+            s.set(cache_hit=True)
+            return cached
+
+        try:
+            results = await afetch()
+        except Exception:
+            return _stale_or_raise(record, provider, query, s)
+
+        _store_results(store, key, ttl, results, s)
+        return results
+
+
+# ===== Tavily 헬퍼 =====
+
+def _check_results(results: Any) -> List[dict]:
+    # TavilySearchResults는 오류 시 예외 대신 오류 문자열을 반환하므로 캐시하지 않도록 예외로 바꿈
+    if not isinstance(results, list):
+        raise RuntimeError(f"Tavily 검색 실패: {results}")
+    return results
+
+
+def tavily_search(query: str, max_results: int = 3, **params: Any) -> List[dict]:
+    """TavilySearchResults.invoke 캐시 버전. [{url, content, ...}] 반환."""
+    from langchain_community.tools.tavily_search import TavilySearchResults
+
+    def fetch():
+        # rate limit은 캐시 미스(실제 네트워크 호출)에만 적용
+        throttle("tavily")
+        search = TavilySearchResults(max_results=max_results, **params)
+        return _check_results(search.invoke({"query": query}))
+
+    return cached_search("tavily", query, {"max_results": max_results, **params}, fetch)
+
+
+async def atavily_search(query: str, max_results: int = 3, **params: Any) -> List[dict]:
+    """tavily_search의 async 버전"""
+    from langchain_community.tools.tavily_search import TavilySearchResults
+
+    async def afetch():
+        await athrottle("tavily")
+        search = TavilySearchResults(max_results=max_results, **params)
+        return _check_results(await search.ainvoke({"query": query}))
+
+    return await acached_search("tavily", query, {"max_results": max_results, **params}, afetch)
+
+
+def _retriever_params(retriever) -> Dict[str, Any]:
+    names = ("k", "search_depth", "include_generated_answer", "include_raw_content",
+             "include_images", "include_domains", "exclude_domains")
+    return {n: getattr(retriever, n, None) for n in names}
+
+
+def retriever_search(retriever, query: str, provider: str = "tavily_retriever") -> List[Document]:
+    """TavilySearchAPIRetriever.invoke 캐시 버전 (Document 리스트 반환)"""
+    def fetch():
+        throttle("tavily")
+        docs = retriever.invoke(query)
+        return [{"page_content": d.page_content, "metadata": d.metadata} for d in docs]
+
+    rows = cached_search(provider, query, _retriever_params(retriever), fetch)
+    return [Document(page_content=r["page_content"], metadata=r["metadata"]) for r in rows]
@@ -0,0 +1,57 @@
+# invest_agent/infra/state_debug.py
+"""
+노드 업데이트 점검 (디버그용)
+
+노드는 바뀐 키만 반환해야 함. 입력 state의 값을 그대로 다시 반환하면 체크포인터가
+같은 내용을 매 단계 다시 저장해, 실행이 길어질수록 단계별 체크포인트가 커짐.
+INVEST_AGENT_DEBUG_STATE=1이면 workflow가 모든 노드에 update_reporter를 붙여
+이런 키를 경고하고 업데이트 크기를 로그로 남김 (꺼져 있으면 붙이지 않음).
+"""
+import functools
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def debug_state_enabled() -> bool:
+    return os.getenv("INVEST_AGENT_DEBUG_STATE", "").lower() in {"1", "true", "on", "yes"}
+
+
+def echoed_keys(state: Dict[str, Any], update: Any) -> List[str]:
+    """update 중 입력 state와 같은 값을 다시 반환한 키"""
+    if not isinstance(update, dict) or not isinstance(state, dict):
+        return []
+    echoed = []
+    for key, value in update.items():
+        if key not in state:
+            continue
+        try:
+            same = value is state[key] or value == state[key]
+        except Exception:
+            same = False
+        if same:
+            echoed.append(key)
+    return echoed
+
+
+def _update_size(update: Any) -> int:
+    try:
+        return len(json.dumps(update, default=str, ensure_ascii=False).encode("utf-8"))
+    except (TypeError, ValueError):
+        return -1
+
+
+def _report(name: str, state: Dict[str, Any], update: Any) -> None:
+    echoed = echoed_keys(state, update)
+    if echoed:
+        logger.warning(f"[state] {name}: 바뀌지 않은 키를 다시 반환함 → {echoed}")
+    keys = sorted(update) if isinstance(update, dict) else type(update).__name__
+    logger.info(f"[state] {name}: 업데이트 {keys}, {_update_size(update):,} bytes")
+
+
+def update_reporter(name: str) -> Callable[[Dict[str, Any], Any], None]:
+    """그래프 노드용 after hook: 반환값 점검 (node_wrap.wrap_node)"""
+    return functools.partial(_report, name)
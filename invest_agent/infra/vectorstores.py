@@ -0,0 +1,180 @@
+# invest_agent/infra/vectorstores.py
+"""
+메모리 상주 FAISS 인덱스 매니저
+
+faiss_market_index / faiss_startup_index를 프로세스당 한 번만 로드하고,
+디스크 파일(index.faiss, index.pkl)의 mtime/크기가 바뀌면 다시 로드함.
+에이전트에는 검색 메서드만 노출하는 읽기 전용 핸들을 넘김.
+"""
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_community.vectorstores import FAISS
+
+from invest_agent.infra.embeddings import get_embeddings
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILES = ("index.faiss", "index.pkl")
+
+_StatSignature = Tuple[Tuple[str, int, int], ...]
+
+
+class ReadOnlyVectorStore:
+    """
+    공유 FAISS 스토어의 읽기 전용 핸들
+
+    검색 계열 메서드만 허용하고 add_documents / delete / save_local 등
+    스토어를 바꾸는 호출은 AttributeError로 막음.
+    """
+    _ALLOWED = frozenset({
+        "similarity_search",
+        "similarity_search_with_score",
+        "similarity_search_with_relevance_scores",
+        "similarity_search_by_vector",
+        "max_marginal_relevance_search",
+        "max_marginal_relevance_search_by_vector",
+        "asimilarity_search",
+        "asimilarity_search_with_score",
+        "amax_marginal_relevance_search",
+        "as_retriever",
+        "embeddings",
+    })
+
+    def __init__(self, store: FAISS, path: str):
+        self._store = store
+        self.path = path
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._ALLOWED:
+            return getattr(self._store, name)
+        raise AttributeError(f"'{name}'은(는) 읽기 전용 인덱스 핸들에서 사용할 수 없습니다: {self.path}")
+
+    @property
+    def ntotal(self) -> int:
+        return self._store.index.ntotal
+
+
+@dataclass
+class _Entry:
+    store: FAISS
+    stat_sig: _StatSignature
+    content_hash: Optional[str]
+
+
+def _stat_signature(path: Path) -> Optional[_StatSignature]:
+    sig = []
+    for name in INDEX_FILES:
+        try:
+            st = (path / name).stat()
+        except FileNotFoundError:
+            return None
+        sig.append((name, st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _content_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    for name in INDEX_FILES:
+        with open(path / name, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()
+
+
+class FaissIndexManager:
+    """
+    경로별 FAISS 인덱스 캐시
+
+    Args:
+        verify_hash: True면 mtime/크기가 바뀌었을 때 sha256까지 비교해서
+            내용이 실제로 바뀐 경우에만 다시 로드 (touch/복사만 된 경우 재사용)
+    """
+
+    def __init__(self, verify_hash: bool = False):
+        self.verify_hash = verify_hash
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        self._path_locks: Dict[str, threading.Lock] = {}
+
+    def _path_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._path_locks.setdefault(key, threading.Lock())
+
+    def get(self, path: str, embeddings=None) -> Optional[ReadOnlyVectorStore]:
+        """
+        인덱스 핸들 반환. 디스크에 인덱스가 없으면 None.
+
+        캐시된 인덱스의 파일 시그니처가 현재 디스크와 다르면 다시 로드함.
+        """
+        index_path = Path(path)
+        key = str(index_path.resolve())
+
+        stat_sig = _stat_signature(index_path)
+        if stat_sig is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.stat_sig == stat_sig:
+            return ReadOnlyVectorStore(entry.store, path)
+
+        with self._path_lock(key):
+            entry = self._entries.get(key)
+            stat_sig = _stat_signature(index_path)
+            if stat_sig is None:
+                return None
+            if entry is not None and entry.stat_sig == stat_sig:
+                return ReadOnlyVectorStore(entry.store, path)
+
+            content_hash = None
+            if self.verify_hash:
+                content_hash = _content_hash(index_path)
+                if entry is not None and entry.content_hash == content_hash:
+                    entry.stat_sig = stat_sig
+                    return ReadOnlyVectorStore(entry.store, path)
+
+            entry = self._load(index_path, stat_sig, content_hash, embeddings)
+            self._entries[key] = entry
+            return ReadOnlyVectorStore(entry.store, path)
+
+    def reload(self, path: str, embeddings=None) -> Optional[ReadOnlyVectorStore]:
+        """캐시를 무시하고 디스크에서 다시 로드 (discovery 저장 직후 hot-reload용)"""
+        self.invalidate(path)
+        return self.get(path, embeddings)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """특정 경로(또는 전체) 캐시 제거. 다음 get에서 다시 로드됨."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(Path(path).resolve()), None)
+
+    def _load(self, index_path: Path, stat_sig: _StatSignature, content_hash: Optional[str], embeddings) -> _Entry:
+        store = FAISS.load_local(
+            str(index_path),
+            embeddings or get_embeddings(),
+            allow_dangerous_deserialization=True
+        )
+        logger.info(f"[인덱스] 로드: {index_path} ({store.index.ntotal}개 벡터)")
+        return _Entry(store=store, stat_sig=stat_sig, content_hash=content_hash)
+
+
+index_manager = FaissIndexManager(
+    verify_hash=os.getenv("INVEST_AGENT_INDEX_VERIFY_HASH", "").lower() in {"1", "true", "yes"}
+)
+
+
+def get_index(path: str, embeddings=None) -> Optional[ReadOnlyVectorStore]:
+    """공유 매니저에서 인덱스 핸들 얻기"""
+    return index_manager.get(path, embeddings)
+
+
+def reload_index(path: str, embeddings=None) -> Optional[ReadOnlyVectorStore]:
+    """공유 매니저의 인덱스를 디스크에서 다시 로드"""
+    return index_manager.reload(path, embeddings)
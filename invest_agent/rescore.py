@@ -0,0 +1,147 @@
+# invest_agent/rescore.py
+"""
+오프라인 재채점 CLI
+
+투자 판단 노드가 남긴 평가 기록(infra/evaluation_archive.py)을 LLM 호출 없이
+벡터화 점수 엔진으로 다시 채점하고, label이 바뀐 회사를 보여줌.
+가중치·임계값을 바꿔 보는 실험을 에이전트 재실행 없이 몇 초 안에 할 수 있음.
+
+    python -m invest_agent.rescore --weight market=0.4 --weight technology=0.2
+    python -m invest_agent.rescore --thresholds 55,35 --output outputs/rescored.jsonl
+"""
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .agents.scoring import DECISION_THRESHOLDS, WEIGHTS, decision_label
+from .agents.scoring_engine import score_states
+from .infra.evaluation_archive import archive_path, iter_evaluations, load_latest, scoring_state, DEFAULT_EVAL_ARCHIVE_PATH
+
+SCORE_KEYS = ["market", "technology", "competition", "traction", "deal"]
+
+
+def _parse_weights(pairs: List[str]) -> Dict[str, float]:
+    """['market=0.4', ...] → WEIGHTS를 덮어쓴 가중치"""
+    weights = dict(WEIGHTS)
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        key = key.strip()
+        if not sep or key not in WEIGHTS:
+            raise ValueError(f"잘못된 가중치: {pair} (사용 가능: {', '.join(WEIGHTS)})")
+        weights[key] = float(value)
+    return weights
+
+
+def _parse_thresholds(text: Optional[str]) -> Optional[Tuple[float, float]]:
+    """'55,35' → (55.0, 35.0)"""
+    if not text:
+        return None
+    parts = [float(p) for p in text.split(",")]
+    if len(parts) != 2 or parts[0] < parts[1]:
+        raise ValueError(f"임계값은 '투자 권고 하한,조건부 하한' 형식이어야 합니다: {text}")
+    return parts[0], parts[1]
+
+
+def _original_label(record: Dict[str, Any]) -> str:
+    decision = record.get("decision", {})
+    return decision_label(decision.get("status") or "fail", decision.get("total_score") or 0)
+
+
+def rescore(
+    records: List[Dict[str, Any]],
+    weights: Optional[Dict[str, float]] = None,
+    thresholds: Optional[Tuple[float, float]] = None,
+    include_evaluations: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    기록 목록을 다시 채점
+
+    Returns:
+        [{"company", "old_label", "new_label", "old_total", "new_total", "scores", "changed"}, ...]
+    """
+    if not records:
+        return []
+
+    states = [scoring_state(r, include_evaluations=include_evaluations) for r in records]
+    result = score_states(states, weights=weights, thresholds=thresholds)
+
+    rows: List[Dict[str, Any]] = []
+    for i, record in enumerate(records):
+        old_label = _original_label(record)
+        new_label = str(result["label"][i])
+        rows.append({
+            "company": record.get("company", ""),
+            "recorded_at": record.get("recorded_at"),
+            "old_label": old_label,
+            "new_label": new_label,
+            "old_total": record.get("decision", {}).get("total_score"),
+            "new_total": float(result["adjusted"][i]),
+            "scores": {k: float(result[k][i]) for k in SCORE_KEYS},
+            "risk_penalty_pct": float(result["risk_penalty_pct"][i]),
+            "changed": old_label != new_label,
+        })
+    return rows
+
+
+def print_diff(rows: List[Dict[str, Any]], elapsed: float) -> None:
+    changed = [r for r in rows if r["changed"]]
+    print("\n" + "=" * 60)
+    print(f"📊 재채점 결과: {len(rows)}개 중 {len(changed)}개 label 변경 ({elapsed:.2f}s)")
+    print("=" * 60)
+    for r in changed:
+        old_total = r["old_total"] if r["old_total"] is not None else float("nan")
+        print(
+            f"  {r['company']}: {r['old_label']} → {r['new_label']}"
+            f"  ({old_total:.1f} → {r['new_total']:.1f})"
+        )
+
+    counts: Dict[str, int] = {}
+    for r in rows:
+        counts[r["new_label"]] = counts.get(r["new_label"], 0) + 1
+    print("  분포: " + ", ".join(f"{label} {n}" for label, n in sorted(counts.items())))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="InvestAgent 오프라인 재채점 (LLM 호출 없음)")
+    parser.add_argument("--archive", default=None, help=f"평가 기록 JSONL (기본 {DEFAULT_EVAL_ARCHIVE_PATH})")
+    parser.add_argument("--weight", action="append", default=[], help="가중치 덮어쓰기 (예: market=0.4, 반복 가능)")
+    parser.add_argument(
+        "--thresholds", default=None,
+        help=f"투자 권고/조건부 하한 (기본 {DECISION_THRESHOLDS[0][0]:g},{DECISION_THRESHOLDS[1][0]:g})",
+    )
+    parser.add_argument("--all", action="store_true", help="회사별 최신 기록만이 아니라 전체 기록을 재채점")
+    parser.add_argument(
+        "--include-evaluations", action="store_true",
+        help="problem-fit / 체크리스트 / 포지셔닝 LLM 점수도 점수 계산에 반영",
+    )
+    parser.add_argument("--output", default=None, help="재채점 결과 JSONL")
+    args = parser.parse_args()
+
+    weights = _parse_weights(args.weight)
+    thresholds = _parse_thresholds(args.thresholds)
+    path = args.archive or archive_path() or DEFAULT_EVAL_ARCHIVE_PATH
+
+    records = list(iter_evaluations(path)) if args.all else list(load_latest(path).values())
+    print(f"📥 평가 기록 {len(records)}건 로드: {path}")
+    if abs(sum(weights.values()) - 1.0) > 1e-9:
+        print(f"⚠️ 가중치 합이 1이 아닙니다: {sum(weights.values()):.3f}")
+
+    started = time.perf_counter()
+    rows = rescore(records, weights, thresholds, include_evaluations=args.include_evaluations)
+    print_diff(rows, time.perf_counter() - started)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        print(f"💾 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
+
+# python -m invest_agent.rescore
+# python -m invest_agent.rescore --weight market=0.30 --weight traction=0.15 --thresholds 55,35
@@ -1,5 +1,6 @@
 # invest_agent/run_smoke.py
 from .workflow import app
+from .infra.log import setup_logging
 from types import SimpleNamespace
 
 class ReportConfig(SimpleNamespace):
@@ -9,6 +10,7 @@ class ReportConfig(SimpleNamespace):
     out_dir: str = "./outputs"
 
 if __name__ == "__main__":
+    setup_logging()
     init_state = {
         "query": "한국 생성형 AI 스타트업 알려줘!", 
         "sources": {},  # ← 추가 (출처 추적용)
@@ -1,6 +1,6 @@
 # invest_agent/states.py
-from typing import TypedDict, List, Dict, Any, Optional, Annotated
-from enum import Enum 
+from typing import TypedDict, List, Dict, Any, Iterable, Optional, Annotated, Tuple
+from enum import Enum
 class InvestmentLabel(str, Enum):
     """투자 판단 레이블"""
     INVEST = "invest"
@@ -9,27 +9,93 @@ class InvestmentLabel(str, Enum):
     HOLD = "hold"
     REJECT = "reject"
 
+
+# ── Reducers
+def merge_dicts(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """키 단위 병합 (오른쪽 우선). 병렬 브랜치가 서로 다른 키를 쓰는 경우에 안전."""
+    return {**(left or {}), **(right or {})}
+
+
+def merge_reports(left: Optional[List[Dict[str, Any]]], right: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    보고서 리스트 병합
+
+    (company, pdf)가 같은 항목은 한 번만 유지하므로, 노드가 기존 리스트를
+    그대로 다시 반환해도 중복되지 않음.
+    """
+    merged = list(left or [])
+    seen = {(r.get("company"), r.get("pdf")) for r in merged}
+    for r in right or []:
+        key = (r.get("company"), r.get("pdf"))
+        if key not in seen:
+            seen.add(key)
+            merged.append(r)
+    return merged
+
+
+# ── 출처 원장 {회사: {에이전트: (url, ...)}}
+# 노드는 자기 회사·에이전트 항목만 새 dict로 반환하고 (source_entry), 기존 원장을 수정하지 않음.
+# merge_sources는 입력을 바꾸지 않는 합집합이라 결합 법칙이 성립하고, 병렬 브랜치가
+# 어떤 순서로 fan-in되어도 출처가 빠지거나 다른 회사 항목과 섞이지 않음.
+SourceLedger = Dict[str, Dict[str, Tuple[str, ...]]]
+
+SHARED_SOURCES = "*"  # 특정 회사에 속하지 않는 출처 (discovery)
+
+
+def _union(left: Tuple[str, ...], right: Tuple[str, ...]) -> Tuple[str, ...]:
+    # 순서 유지 합집합 (왼쪽 먼저)
+    return tuple(dict.fromkeys((*left, *right)))
+
+
+def source_entry(company: str, agent: str, urls: Iterable[str]) -> SourceLedger:
+    """노드 반환용 원장 조각 {company: {agent: (중복·빈 값 제거한 url, ...)}}"""
+    return {company or SHARED_SOURCES: {agent: tuple(dict.fromkeys(u for u in urls if u))}}
+
+
+def merge_sources(left: Optional[SourceLedger], right: Optional[SourceLedger]) -> SourceLedger:
+    """출처 원장 병합 (회사 → 에이전트 단위 합집합, 입력은 수정하지 않음)"""
+    merged = {company: dict(agents) for company, agents in (left or {}).items()}
+    for company, agents in (right or {}).items():
+        target = merged.setdefault(company, {})
+        for agent, urls in agents.items():
+            target[agent] = _union(tuple(target.get(agent, ())), tuple(urls))
+    return merged
+
+
+def company_sources(ledger: Optional[SourceLedger], company: str) -> Dict[str, List[str]]:
+    """회사 1곳의 출처 {agent: [url, ...]} (discovery 등 공용 출처 포함)"""
+    ledger = ledger or {}
+    out = {agent: list(urls) for agent, urls in ledger.get(SHARED_SOURCES, {}).items()}
+    for agent, urls in ledger.get(company, {}).items():
+        out[agent] = list(_union(tuple(out.get(agent, ())), tuple(urls)))
+    return out
+
+
 class GraphState(TypedDict, total=False):
     # 입력
     query: str
-    
+    target_companies: List[str]  # 지정 시 탐색 결과를 이 회사들로 한정 (batch 실행용)
+
     # Discovery
     discovery: Dict[str, Any]
     companies: List[str]
     idx: int
     current_company: str
-    
+
     # Analysis
     tech: Dict[str, Any]
     market_eval: Dict[str, Any]
     competitor: Dict[str, Any]
     decision: Dict[str, Any]
     risks: List[Dict[str, Any]]
-    
+
+    # 회사별 결과 (병렬 모드에서 fan-in)
+    decisions: Annotated[Dict[str, Dict[str, Any]], merge_dicts]
+
     # Report
-    reports: List[Dict[str, Any]]
+    reports: Annotated[List[Dict[str, Any]], merge_reports]
     report_config: Dict[str, Any]
+    meta: Dict[str, Any]
 
-    # 출처 추적
-    sources: Annotated[Dict[str, List[str]], lambda x, y: {**x, **y}]
-    
\ No newline at end of file
+    # 출처 추적 (회사별·에이전트별 원장)
+    sources: Annotated[SourceLedger, merge_sources]
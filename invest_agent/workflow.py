@@ -1,18 +1,33 @@
 # invest_agent/workflow.py
-from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
+from typing import Optional
 
-from .states import GraphState, InvestmentLabel
+from langgraph.graph import StateGraph, START, END
+from langgraph.types import Send
+
+from .states import SHARED_SOURCES, GraphState, InvestmentLabel
+from .infra.llm_cache import install_llm_cache
+from .infra.checkpoint import make_checkpointer
+from .infra.node_wrap import wrap_node
+from .infra.state_debug import debug_state_enabled, update_reporter
+from .infra.profiling import node_span
+from .infra.log import node_scope
 
 # ── Nodes
 from .agents.discovery import startup_discovery, pick_company
-from .agents.tech import tech_summary
-from .agents.market import market_eval
-from .agents.competitor import competitor_analysis
-from .agents.invest import investment_decision
+from .agents.tech import tech_summary, atech_summary
+from .agents.market import market_eval, amarket_eval
+from .agents.competitor import competitor_analysis, acompetitor_analysis
+from .agents.invest import investment_decision, ainvestment_decision
 from .agents.report.node import report_writer       
 from .agents.common import advance_or_finish
 
+def _add_node(graph: StateGraph, name: str, node) -> None:
+    # 노드마다 로그 컨텍스트(node / company)와 프로파일링 span (start_trace() 중일 때만 기록)
+    # INVEST_AGENT_DEBUG_STATE=1이면 노드가 바뀌지 않은 키를 다시 반환하는지 점검
+    after = [update_reporter(name)] if debug_state_enabled() else []
+    graph.add_node(name, wrap_node(node, around=[node_scope(name), node_span(name)], after=after))
+
+
 # ── Routers
 def invest_or_hold(state: GraphState):
     """
@@ -62,19 +77,163 @@ def has_more_companies(state: GraphState):
     return "next" if idx + 1 < len(companies) else "done"
 
 
-def build_app():
+def needs_report(state: GraphState):
+    """
+    회사별 서브그래프용 라우팅 (병렬 모드)
+
+    - invest/recommend/invest_conditional → 보고서 작성
+    - 그 외 → 종료
+    """
+    label = state.get("decision", {}).get("label", InvestmentLabel.HOLD)
+    if label in {
+        InvestmentLabel.INVEST,
+        InvestmentLabel.RECOMMEND,
+        InvestmentLabel.INVEST_CONDITIONAL
+    }:
+        return "invest"
+    return "skip"
+
+
+def fan_out_companies(state: GraphState):
+    """
+    탐색 결과의 회사마다 analyze_company 작업을 하나씩 생성 (Send API)
+
+    각 작업은 자기 회사의 분석 상태만 가지고 시작하므로 서로 간섭하지 않음.
+    """
+    companies = state.get("companies", [])
+    if not companies:
+        return END
+
+    shared_sources = (state.get("sources") or {}).get(SHARED_SOURCES, {})
+    return [
+        Send("analyze_company", {
+            "query": state.get("query", ""),
+            "discovery": state.get("discovery", {}),
+            "companies": companies,
+            "idx": i,
+            "current_company": company,
+            "sources": {SHARED_SOURCES: shared_sources},
+            "report_config": state.get("report_config", {}),
+            "meta": state.get("meta", {}),
+        })
+        for i, company in enumerate(companies)
+    ]
+
+
+def _analysis_nodes(use_async: bool):
+    """
+    분석 노드 구현 선택
+
+    use_async=True면 ainvoke 기반 노드를 등록. app.ainvoke로 실행하면
+    모든 회사/브랜치의 네트워크 대기가 하나의 이벤트 루프에서 겹쳐짐.
+    (sync 노드는 LangGraph가 스레드 풀에서 실행)
+    """
+    if use_async:
+        return {
+            "tech_summary":        atech_summary,
+            "market_eval":         amarket_eval,
+            "competitor_analysis": acompetitor_analysis,
+            "investment_decision": ainvestment_decision,
+        }
+    return {
+        "tech_summary":        tech_summary,
+        "market_eval":         market_eval,
+        "competitor_analysis": competitor_analysis,
+        "investment_decision": investment_decision,
+    }
+
+
+def build_company_graph(use_async: bool = False):
+    """
+    회사 1곳에 대한 분석 서브그래프
+
+    (기술, 시장) 병렬 → 경쟁 → 투자 → (추천 시) 보고서
+    """
+    company_graph = StateGraph(GraphState)
+
+    for name, node in _analysis_nodes(use_async).items():
+        _add_node(company_graph, name, node)
+    _add_node(company_graph, "report_writer", report_writer)
+
+    company_graph.add_edge(START, "tech_summary")
+    company_graph.add_edge(START, "market_eval")
+    company_graph.add_edge("tech_summary", "competitor_analysis")
+    company_graph.add_edge("market_eval", "competitor_analysis")
+    company_graph.add_edge("competitor_analysis", "investment_decision")
+    company_graph.add_conditional_edges(
+        "investment_decision",
+        needs_report,
+        {
+            "invest": "report_writer",
+            "skip": END,
+        },
+    )
+    company_graph.add_edge("report_writer", END)
+
+    return company_graph.compile()
+
+
+def _make_analyze_company(company_app, use_async: bool = False):
+    def analyze_company(state: GraphState) -> GraphState:
+        """
+        병렬 모드 노드: 회사 1곳의 서브그래프를 실행하고 결과만 부모 상태로 전달
+
+        reports / decisions / sources는 GraphState의 reducer로 병합됨.
+        """
+        out = company_app.invoke(state)
+        return _company_result(state, out)
+
+    async def aanalyze_company(state: GraphState) -> GraphState:
+        """analyze_company의 async 버전 (서브그래프를 ainvoke)"""
+        out = await company_app.ainvoke(state)
+        return _company_result(state, out)
+
+    return aanalyze_company if use_async else analyze_company
+
+
+def _company_result(state: GraphState, out: GraphState) -> GraphState:
+    # 출처는 이 회사 항목만 올림 (공용 출처는 부모 원장에 이미 있음)
+    company = state.get("current_company", "")
+    return {
+        "reports": out.get("reports", []),
+        "decisions": out.get("decisions", {}),
+        "sources": {company: (out.get("sources") or {}).get(company, {})},
+    }
+
+
+def build_app(
+    parallel: bool = False,
+    max_concurrency: Optional[int] = None,
+    use_async: bool = False,
+    checkpointer=None,
+):
+    """
+    워크플로 컴파일
+
+    Args:
+        parallel: True면 탐색된 회사들을 Send API로 동시에 분석 (map-reduce)
+        max_concurrency: 동시에 실행할 작업 수 상한 (None이면 제한 없음)
+        use_async: True면 async 노드 등록 (app.ainvoke로 실행해야 함)
+        checkpointer: 체크포인터 (None이면 make_checkpointer(): INVEST_AGENT_CHECKPOINT_DB가
+            있으면 SQLite, 없으면 MemorySaver / False면 체크포인터 없이 컴파일)
+    """
+    if checkpointer is None:
+        checkpointer = make_checkpointer()
+    elif checkpointer is False:
+        checkpointer = None
+    if parallel:
+        return _build_parallel_app(max_concurrency, use_async, checkpointer)
+
     # --------- Wire Graph ---------
     workflow = StateGraph(GraphState)
 
     # 노드 등록
-    workflow.add_node("startup_discovery", startup_discovery)
-    workflow.add_node("pick_company",       pick_company)
-    workflow.add_node("tech_summary",       tech_summary)
-    workflow.add_node("market_eval",        market_eval)
-    workflow.add_node("competitor_analysis", competitor_analysis)
-    workflow.add_node("investment_decision", investment_decision)
-    workflow.add_node("report_writer",      report_writer)
-    workflow.add_node("advance_or_finish",  advance_or_finish)
+    _add_node(workflow, "startup_discovery", startup_discovery)
+    _add_node(workflow, "pick_company",       pick_company)
+    for name, node in _analysis_nodes(use_async).items():
+        _add_node(workflow, name, node)
+    _add_node(workflow, "report_writer",      report_writer)
+    _add_node(workflow, "advance_or_finish",  advance_or_finish)
 
     # 흐름:
     # 탐색 → 회사 선택 → (기술, 시장) 병렬 → 경쟁 → 투자
@@ -116,8 +275,31 @@ def build_app():
     workflow.set_entry_point("startup_discovery")
 
     # 컴파일
-    memory = MemorySaver()
-    app = workflow.compile(checkpointer=memory)
+    app = workflow.compile(checkpointer=checkpointer)
+    if max_concurrency:
+        app = app.with_config(max_concurrency=max_concurrency)
+    return app
+
+
+def _build_parallel_app(max_concurrency: Optional[int] = None, use_async: bool = False, checkpointer=None):
+    # 탐색 → 회사별 서브그래프 fan-out → reducer로 fan-in → 종료
+    workflow = StateGraph(GraphState)
+
+    _add_node(workflow, "startup_discovery", startup_discovery)
+    _add_node(workflow, "analyze_company",   _make_analyze_company(build_company_graph(use_async), use_async))
+
+    workflow.add_conditional_edges(
+        "startup_discovery",
+        fan_out_companies,
+        ["analyze_company", END],
+    )
+    workflow.add_edge("analyze_company", END)
+
+    workflow.set_entry_point("startup_discovery")
+
+    app = workflow.compile(checkpointer=checkpointer)
+    if max_concurrency:
+        app = app.with_config(max_concurrency=max_concurrency)
     return app
 
 
@@ -142,6 +324,9 @@ def print_graph_mermaid():
     print(g.draw_mermaid())
 
 
+# ChatOpenAI 호출에 영속 응답 캐시 연결 (INVEST_AGENT_LLM_CACHE=off로 끔)
+install_llm_cache()
+
 # 바로 import해서 쓰기 편하게
 app = build_app()
 
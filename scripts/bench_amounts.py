@@ -0,0 +1,184 @@
+# scripts/bench_amounts.py
+"""
+금액 파싱 벤치마크
+
+기존 ad-hoc 파서(호출마다 패턴 문자열로 re.search)와 agents/amounts.py를
+같은 문장 묶음에 돌려 처리 속도와 인식률(None이 아닌 비율)을 비교함.
+
+문장 묶음:
+    - 기본: 예시 문장 + REGRESSION_CASES (금액이 아닌 문장 포함)
+    - --archive: 평가 기록(outputs/evaluations.jsonl)에 남은 실제 LLM 원문 (texts 필드)
+    - --corpus: 텍스트 파일(한 줄에 한 문장) 또는 JSONL
+      (market_size / revenue_model / text 필드를 사용)
+
+실행할 때마다 REGRESSION_CASES를 먼저 확인하고, 기대값과 다르면 종료 코드 1로 끝남.
+
+    python scripts/bench_amounts.py --repeat 2000
+    python scripts/bench_amounts.py --archive outputs/evaluations.jsonl
+    python scripts/bench_amounts.py --corpus outputs/market_texts.jsonl
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+# `python scripts/bench_amounts.py`로 실행해도 invest_agent 패키지를 찾도록
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from invest_agent.agents.amounts import clear_caches, parse_amounts, parse_usd_billion, parse_usd_million
+from invest_agent.infra.evaluation_archive import iter_evaluations
+
+
+SAMPLE_TEXTS = [
+    "2024년 글로벌 생성형 AI 시장 규모는 약 6000억 달러로 추정됩니다.",
+    "국내 AI 교육 시장은 2023년 기준 250 백만 달러 규모입니다.",
+    "The global conversational AI market is valued at $12.5B in 2024.",
+    "시장 규모: US$ 3.4 billion (2023), CAGR 23.6%",
+    "국내 핀테크 AI 시장은 1.2조 원 규모로 성장 중",
+    "₩70억 규모의 시리즈 B 투자 유치",
+    "2030년까지 1조 2,000억원 규모로 확대 전망",
+    "SaaS 구독형, 연간 반복 매출(ARR) 약 12M USD",
+    "USD 800M market opportunity in APAC",
+    "연평균 성장률 17.3%로 빠르게 성장",
+    "엔터프라이즈 라이선스 + 사용량 기반 과금",
+    "약 3천만 원 수준의 초기 매출",
+    "KRW 5,000억 (2025E)",
+    "시장 규모 정보 없음",
+]
+
+# (문장, 기대 parse_usd_million 값) — 통화 표시 없는 숫자·단위당 가격은 금액이 아님
+REGRESSION_CASES = [
+    ("B2B SaaS 구독 모델", None),
+    ("7B 파라미터 LLM 시장 $30B", 30000.0),
+    ("4K 영상 시장", None),
+    ("월 $49/seat", None),
+    ("$5 per user per month", None),
+    ("월간 사용자 100만 명", None),
+    ("A100 GPU 2대 기반 추론", None),
+    ("ARR $12M/yr", 12.0),
+    ("SaaS 구독형, 연간 반복 매출(ARR) 약 12M USD", 12.0),
+    ("250 백만 달러", 250.0),
+]
+
+
+def _legacy_parse_usd_billion(text: str) -> Optional[float]:
+    """기존 scoring.parse_usd_billion (비교용 사본)"""
+    if not text:
+        return None
+    m = re.search(r"([\d\.]+)\s*억\s*달러", text)
+    if m:
+        return float(m.group(1)) / 10.0
+    m = re.search(r"([\d\.]+)\s*백만\s*달러", text)
+    if m:
+        return float(m.group(1)) / 1000.0
+    return None
+
+
+def check_regressions() -> List[str]:
+    """REGRESSION_CASES 중 기대값과 다른 문장 설명 목록"""
+    failures = []
+    for text, expected in REGRESSION_CASES:
+        got = parse_usd_million(text)
+        ok = got is None if expected is None else got is not None and abs(got - expected) < 1e-6
+        if not ok:
+            failures.append(f"{text!r}: 기대 {expected}, 결과 {got}")
+    return failures
+
+
+def load_archive(path: Optional[str]) -> List[str]:
+    """평가 기록의 금액 원문 (texts 필드가 없는 예전 기록은 건너뜀)"""
+    texts: List[str] = []
+    for record in iter_evaluations(path):
+        texts.extend(t for t in (record.get("texts") or {}).values() if isinstance(t, str))
+    return texts
+
+
+def load_corpus(path: Optional[str]) -> List[str]:
+    if not path:
+        return list(SAMPLE_TEXTS) + [t for t, _ in REGRESSION_CASES]
+
+    texts: List[str] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if path.endswith(".jsonl"):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                for key in ("market_size", "revenue_model", "text"):
+                    if isinstance(record.get(key), str):
+                        texts.append(record[key])
+            else:
+                texts.append(line)
+    return texts
+
+
+def bench(name: str, fn: Callable[[List[str]], List[Optional[float]]], texts: List[str]) -> List[Optional[float]]:
+    started = time.perf_counter()
+    out = fn(texts)
+    elapsed = time.perf_counter() - started
+    parsed = sum(v is not None for v in out)
+    print(
+        f"  {name:<28} {elapsed * 1000:8.1f} ms  "
+        f"{len(texts) / elapsed if elapsed else 0:12,.0f} 문장/s  인식 {parsed / len(texts):6.1%}"
+    )
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="금액 파싱 벤치마크")
+    parser.add_argument("--corpus", default=None, help="문장 파일 (txt 또는 jsonl)")
+    parser.add_argument("--archive", default=None, help="평가 기록 JSONL (실제 LLM 원문 사용)")
+    parser.add_argument("--repeat", type=int, default=1000, help="문장 묶음 반복 횟수")
+    args = parser.parse_args()
+
+    failures = check_regressions()
+    print(f"🧪 회귀 문장 {len(REGRESSION_CASES)}개 중 실패 {len(failures)}개")
+    for line in failures:
+        print(f"  ❌ {line}")
+
+    base = load_archive(args.archive) if args.archive else load_corpus(args.corpus)
+    if not base:
+        print("⚠️ 문장이 없습니다.")
+        sys.exit(1 if failures else 0)
+    texts = base * max(1, args.repeat)
+    print(f"📄 문장 {len(base)}개 × {args.repeat}회 = {len(texts):,}개")
+
+    legacy = bench("기존 (ad-hoc re.search)", lambda ts: [_legacy_parse_usd_billion(t) for t in ts], texts)
+
+    # 캐시 효과를 빼고 보려면 문장마다 번호를 붙여 모두 다른 문장으로 만듦
+    unique = [f"{t} #{i}" for i, t in enumerate(texts)]
+    clear_caches()
+    bench("amounts (캐시 없음)", lambda ts: [parse_usd_billion(t) for t in ts], unique)
+    clear_caches()
+    bench("amounts.parse_usd_billion", lambda ts: [parse_usd_billion(t) for t in ts], texts)
+    clear_caches()
+    new = bench("amounts.parse_amounts", lambda ts: parse_amounts(ts, unit="usd_b"), texts)
+
+    # 기존 파서가 인식한 문장은 같은 값을 내야 함
+    diffs = [
+        (t, old, cur) for t, old, cur in zip(base, legacy, new)
+        if old is not None and old != cur
+    ]
+    print(f"\n🔎 기존 인식 문장 중 값이 달라진 문장: {len(diffs)}개")
+    for t, old, cur in diffs:
+        print(f"  {t!r}: {old} → {cur}")
+
+    print("\n📋 문장별 결과 (USD billion)")
+    for t, old, cur in zip(base, legacy, new):
+        print(f"  {str(old):>8} → {str(round(cur, 4) if cur is not None else None):>10}  {t}")
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
+
+# python scripts/bench_amounts.py --repeat 5000
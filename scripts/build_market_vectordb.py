@@ -5,14 +5,18 @@ PDF → FAISS 변환 (LangChain 없이)
 """
 
 import os
+import sys
 import pickle
 from pathlib import Path
 from typing import List, Dict, Any
 import PyPDF2
 import numpy as np
-from sentence_transformers import SentenceTransformer
 import faiss
 
+# `python scripts/build_market_vectordb.py`로 실행해도 invest_agent 패키지를 찾도록
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from invest_agent.infra.embedding_cache import get_cached_embeddings
+
 
 # 산업별 키워드
 INDUSTRY_KEYWORDS = {
@@ -121,7 +125,8 @@ def create_faiss_index(
     """FAISS 인덱스 생성"""
     
     print(f"🔄 임베딩 모델 로드 중: {model_name}")
-    model = SentenceTransformer(model_name)
+    # 같은 PDF를 다시 변환하면 캐시된 청크 벡터를 재사용
+    model = get_cached_embeddings(model_name=model_name, device="cpu", normalize=True)
     
     # 텍스트 추출
     texts = [doc.page_content for doc in documents]